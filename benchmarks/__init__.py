@@ -0,0 +1 @@
+"""Benchmark dan pembanding performa dashboard Monitoring KAWAN."""
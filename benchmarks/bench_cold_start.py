@@ -0,0 +1,104 @@
+"""Cold start dashboard: waktu import ``app.py`` dan waktu render pertama halaman SLS.
+
+Setiap pengukuran berjalan di interpreter baru (subprocess) agar import dan
+cache Streamlit benar-benar dingin. Data ``readDBSLS`` disajikan server HTTP
+lokal dan satu rerun dijalankan lewat ``streamlit.testing`` (AppTest):
+
+- ``import``: ``import app`` saja (jumlah modul termuat dan apakah pandas ikut)
+- ``render``: proses baru sampai run pertama selesai (import halaman, fetch,
+  preprocessing, index, render) seperti pengunjung pertama setelah deploy
+- ``prewarm``: hook boot (``views.boot.start``) dipanggil saat "server start";
+  pengunjung pertama datang setelah prewarm selesai, yang diukur durasi run-nya
+
+::
+
+    python -m benchmarks.bench_cold_start --rows 100000
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import mock
+
+from benchmarks.stub_server import StubEndpoint, StubServer
+from kawan.config import SLS_ACTION
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+# Dijalankan lewat ``python -c`` agar tidak ada modul benchmark yang ikut termuat
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app
+print(json.dumps({"seconds": time.perf_counter() - start, "modules": len(sys.modules),
+                  "pandas": "pandas" in sys.modules}))
+"""
+
+
+def child(mode, url):
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    from kawan import sls
+    with mock.patch.object(sls, 'SLS_API_URL', url):
+        prewarm = None
+        if mode == 'prewarm':
+            from views import boot
+            boot.start().join()
+            prewarm = time.perf_counter() - start
+        t0 = time.perf_counter()
+        at = AppTest.from_file(APP, default_timeout=900).run()
+        seconds = time.perf_counter() - t0
+    errors = [e.value for e in at.exception]
+    print(json.dumps({"seconds": seconds, "prewarm": prewarm, "elements": len(at.metric), "errors": errors}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--child')
+    parser.add_argument('--url')
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.url)
+        return
+
+    from benchmarks.synthetic import make_sls_frame
+
+    body = b'{"records":' + make_sls_frame(args.rows).to_json(orient='records').encode('utf-8') + b'}'
+    print(f"rows       : {args.rows} (payload {len(body) / 2 ** 20:.1f} MiB)")
+    # Commit sebelum hook boot ada hanya diukur tanpa prewarm
+    modes = ['import', 'render'] + (['prewarm'] if importlib.util.find_spec('views.boot') else [])
+
+    with StubServer({"/sls/exec": StubEndpoint({SLS_ACTION: body})}) as server, \
+            tempfile.TemporaryDirectory() as tmp:
+        env = {k: v for k, v in os.environ.items() if k not in ('KAWAN_SNAPSHOT_DIR', 'KAWAN_SHARED_CACHE')}
+        env.update(KAWAN_HISTORY_STORE=os.path.join(tmp, 'history'), KAWAN_EXPORT_DIR=os.path.join(tmp, 'exports'))
+        for mode in modes:
+            runs = []
+            for _ in range(args.repeat):
+                cmd = ([sys.executable, '-c', IMPORT_PROBE] if mode == 'import' else
+                       [sys.executable, '-m', 'benchmarks.bench_cold_start', '--child', mode,
+                        '--url', server.url("/sls/exec")])
+                out = subprocess.run(cmd, capture_output=True, text=True, check=True, env=env,
+                                     cwd=os.path.dirname(APP))
+                runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+            best = min(runs, key=lambda r: r['seconds'])
+            if best.get('errors'):
+                raise SystemExit(f"{mode}: run gagal: {best['errors']}")
+            extra = (f"{best['modules']} modul, pandas {'dimuat' if best['pandas'] else 'belum dimuat'}"
+                     if mode == 'import' else f"{best['elements']} metric")
+            if best.get('prewarm') is not None:
+                extra += f", prewarm {best['prewarm']:.2f} s sebelum pengunjung"
+            print(f"{mode:<11}: {best['seconds']:7.3f} s ({extra})")
+
+
+if __name__ == "__main__":
+    main()
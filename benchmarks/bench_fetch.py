@@ -0,0 +1,63 @@
+"""Latensi cold-load: fetch berurutan tanpa pool vs ``kawan.fetch.fetch_many``.
+
+Menjalankan beberapa endpoint tiruan dengan jeda berbeda di server lokal,
+satu di antaranya gagal 503 sekali sebelum berhasil (menguji retry)::
+
+    python -m benchmarks.bench_fetch --delays 0.3 0.8 0.5
+"""
+
+import argparse
+import time
+
+import requests
+
+from benchmarks.stub_server import StubEndpoint, StubServer
+from kawan import fetch
+from kawan.config import HISTORY_ACTION
+
+
+def _records(n):
+    return {"records": [{"id": i, "message": f"pesan {i}", "no": str(i % 50),
+                         "status": "receive", "currentTime": "01/01/2024, 08.00.00",
+                         "timestamp": 1704096000000} for i in range(n)]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--delays', type=float, nargs='+', default=[0.3, 0.8, 0.5])
+    parser.add_argument('--records', type=int, default=5000)
+    args = parser.parse_args()
+
+    payload = _records(args.records)
+    endpoints = {f"/macros/s/EP{i}/exec": StubEndpoint({HISTORY_ACTION: payload}, delay=d)
+                 for i, d in enumerate(args.delays)}
+
+    with StubServer(endpoints) as server:
+        urls = [server.url(path) for path in endpoints]
+        params = {"action": HISTORY_ACTION}
+
+        t0 = time.perf_counter()
+        for url in urls:
+            requests.get(url, params=params).json()
+        t_sequential = time.perf_counter() - t0
+
+        # Endpoint pertama gagal sekali agar jalur retry ikut terukur
+        first = endpoints[next(iter(endpoints))]
+        first.fail_times = first.hits + 1
+        fetch.BACKOFF_BASE = 0.05
+
+        t0 = time.perf_counter()
+        results = fetch.fetch_many(urls, params=params, timeout=(2, 10))
+        t_concurrent = time.perf_counter() - t0
+
+    errors = [r for r in results if r.error]
+    print(f"endpoints        : {len(urls)} (jeda {args.delays})")
+    print(f"sequential       : {t_sequential:.3f} s (jumlah jeda {sum(args.delays):.2f} s)")
+    print(f"fetch_many       : {t_concurrent:.3f} s (jeda terlama {max(args.delays):.2f} s, +1 retry)")
+    print(f"errors           : {len(errors)}")
+    if errors:
+        raise SystemExit(f"fetch_many gagal: {errors[0].error}")
+
+
+if __name__ == "__main__":
+    main()
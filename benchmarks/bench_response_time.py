@@ -0,0 +1,157 @@
+"""Bandingkan engine waktu respon kolumnar dengan loop ``iloc`` versi lama.
+
+Jalankan dari root repo::
+
+    python -m benchmarks.bench_response_time --rows 200000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from kawan.response_time import calculate_response_stats
+
+BOT_NO = "bot"
+
+
+# ─────────────────────────────────────────────
+# Implementasi lama (referensi), disalin dari page_chatbot
+# ─────────────────────────────────────────────
+def legacy_calculate_working_hours(start, end):
+    work_start_time = datetime.strptime('08:00', '%H:%M').time()
+    work_end_time = datetime.strptime('20:00', '%H:%M').time()
+
+    if start.time() > work_end_time:
+        start = datetime.combine(start.date() + timedelta(days=1), work_start_time)
+    if end.time() < work_start_time:
+        end = datetime.combine(end.date() - timedelta(days=1), work_end_time)
+
+    if start.time() < work_start_time:
+        start = datetime.combine(start.date(), work_start_time)
+    if end.time() > work_end_time:
+        end = datetime.combine(end.date(), work_end_time)
+
+    total_seconds = 0
+    while start.date() <= end.date():
+        work_start = datetime.combine(start.date(), work_start_time)
+        work_end = datetime.combine(start.date(), work_end_time)
+        if start > work_end:
+            start = work_start + timedelta(days=1)
+            continue
+        if end < work_start:
+            break
+        total_seconds += (min(end, work_end) - max(start, work_start)).total_seconds()
+        start = work_start + timedelta(days=1)
+    return total_seconds
+
+
+def legacy_calculate_avg_response_time(df, bot_no):
+    df_sorted = df.sort_values('datetime', kind='stable').copy()
+    response_times = []
+    response_times_raw = []
+
+    for i in range(len(df_sorted) - 1):
+        current_row = df_sorted.iloc[i]
+        next_row = df_sorted.iloc[i + 1]
+
+        if (current_row['status'] == 'receive' and
+            next_row['status'] == 'send' and
+            next_row['no'] == bot_no):
+
+            work_time = legacy_calculate_working_hours(
+                current_row['datetime'],
+                next_row['datetime']
+            )
+
+            raw_time = (next_row['datetime'] - current_row['datetime']).total_seconds()
+
+            if 0 < work_time < 600:
+                response_times.append(work_time)
+                response_times_raw.append(raw_time)
+
+    if response_times:
+        avg_time = sum(response_times) / len(response_times)
+        median_time = sorted(response_times)[len(response_times)//2]
+
+        avg_time_raw = sum(response_times_raw) / len(response_times_raw)
+        median_time_raw = sorted(response_times_raw)[len(response_times_raw)//2]
+
+        def format_time(seconds):
+            minutes = int(seconds // 60)
+            secs = int(seconds % 60)
+            return f"{minutes} menit {secs} detik"
+
+        return {
+            'avg': format_time(avg_time),
+            'avg_raw': format_time(avg_time_raw),
+            'median': format_time(median_time),
+            'median_raw': format_time(median_time_raw),
+            'min': f"{int(min(response_times))} detik",
+            'max': f"{int(max(response_times))} detik",
+            'total_samples': len(response_times)
+        }
+
+    return {
+        'avg': "N/A",
+        'avg_raw': "N/A",
+        'median': "N/A",
+        'median_raw': "N/A",
+        'min': "N/A",
+        'max': "N/A",
+        'total_samples': 0
+    }
+
+
+# ─────────────────────────────────────────────
+# Data sintetis
+# ─────────────────────────────────────────────
+def make_history(rows, seed=0):
+    """History pesan acak: receive dari user, sebagian dibalas ``BOT_NO``.
+
+    Jeda antar pesan sengaja melintasi batas jam kerja dan pergantian hari
+    agar semua cabang perhitungan jam kerja ikut teruji.
+    """
+    rng = np.random.default_rng(seed)
+    gaps = np.where(rng.random(rows) < 0.9,
+                    rng.integers(1, 900, rows),
+                    rng.integers(900, 3 * 86400, rows))
+    start = np.datetime64('2024-01-01T00:00:00')
+    times = start + np.cumsum(gaps).astype('timedelta64[s]')
+    status = np.where(rng.random(rows) < 0.5, 'receive', 'send')
+    no = np.where(rng.random(rows) < 0.7, BOT_NO, rng.integers(1, 500, rows).astype(str))
+    return pd.DataFrame({'datetime': pd.to_datetime(times), 'status': status, 'no': no})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    df = make_history(args.rows, args.seed)
+
+    t0 = time.perf_counter()
+    legacy = legacy_calculate_avg_response_time(df, BOT_NO)
+    t_legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    vectorized = calculate_response_stats(df, BOT_NO)
+    t_vectorized = time.perf_counter() - t0
+
+    print(f"rows            : {args.rows}")
+    print(f"legacy (iloc)   : {t_legacy:.3f} s")
+    print(f"vectorized      : {t_vectorized:.4f} s")
+    print(f"speedup         : {t_legacy / t_vectorized:.0f}x")
+    for key in legacy:
+        flag = "OK" if legacy[key] == vectorized[key] else "MISMATCH"
+        print(f"  {key:<14}{str(legacy[key]):<22}{str(vectorized[key]):<22}{flag}")
+
+    if legacy != vectorized:
+        raise SystemExit("Hasil engine kolumnar berbeda dari implementasi lama")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Puncak RSS dan waktu worker SLS: mode biasa vs chunked per partisi wilayah.
+
+Setiap konfigurasi dijalankan di subprocess terpisah terhadap server HTTP
+lokal yang menyajikan payload sintetis, lalu menerbitkan snapshot ke
+direktori sementara. Puncak RSS proses induk dan proses pool dilaporkan
+terpisah::
+
+    python -m benchmarks.bench_sls_chunked --rows 1000000 --by nmkab --processes 1 2 4
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import mock
+
+from benchmarks.bench_sls_ingest import _status_mib
+from benchmarks.stub_server import StubEndpoint, StubServer
+from benchmarks.synthetic import make_sls_frame
+from kawan import partitions, sls, worker
+from kawan.config import SLS_ACTION
+from kawan.partitions import PARTITION_COLS
+from kawan.snapshots import SnapshotStore
+
+
+def child(url, by, processes):
+    baseline = _status_mib('VmRSS')
+    with mock.patch.object(sls, 'SLS_API_URL', url), mock.patch.object(partitions, 'SLS_API_URL', url), \
+            tempfile.TemporaryDirectory() as root:
+        store = SnapshotStore(root)
+        t0 = time.perf_counter()
+        version = worker.publish_sls(store, by, processes)
+        elapsed = time.perf_counter() - t0
+        meta = store.meta('sls', version)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    print(json.dumps({"rows": meta['rows'], "partitions": meta.get('partitions', 1), "seconds": elapsed,
+                      "baseline_mib": baseline, "peak_mib": _status_mib('VmHWM'), "pool_peak_mib": children}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--by', choices=PARTITION_COLS, default='nmkab')
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--child', action='store_true')
+    parser.add_argument('--url')
+    parser.add_argument('--mode')
+    parser.add_argument('--n', type=int)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.url, args.mode or None, args.n)
+        return
+
+    raw = make_sls_frame(args.rows)
+    body = b'{"records":' + raw.to_json(orient='records').encode('utf-8') + b'}'
+    del raw
+    print(f"rows             : {args.rows} (payload {len(body) / 2 ** 20:.1f} MiB)")
+
+    runs = [("biasa", "", 1)] + [(f"{args.by} ×{n}", args.by, n) for n in args.processes]
+    with StubServer({"/sls/exec": StubEndpoint({SLS_ACTION: body})}) as server:
+        for label, mode, n in runs:
+            out = subprocess.run([sys.executable, '-m', 'benchmarks.bench_sls_chunked', '--child',
+                                  '--url', server.url("/sls/exec"), '--mode', mode, '--n', str(n)],
+                                 capture_output=True, text=True, check=True)
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{label:<17}: {r['seconds']:6.2f} s, peak RSS {r['peak_mib']:7.1f} MiB "
+                  f"(+{r['peak_mib'] - r['baseline_mib']:6.1f} di atas import), pool {r['pool_peak_mib']:6.1f} MiB, "
+                  f"{r['partitions']} partisi")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Puncak RSS ingest ``readDBSLS``: ``response.json()`` + list dict vs decode streaming.
+
+Setiap mode dijalankan di subprocess terpisah (agar puncak RSS tidak saling
+memengaruhi) terhadap server HTTP lokal yang menyajikan payload sintetis::
+
+    python -m benchmarks.bench_sls_ingest --rows 1000000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+from benchmarks.stub_server import StubEndpoint, StubServer
+from benchmarks.synthetic import make_sls_frame
+from kawan.config import SLS_ACTION, TIMEOUTS
+from kawan.fetch import fetch_json, fetch_stream
+from kawan.ingest import typed_frame
+from kawan.sls import preprocess_sls
+
+MODES = ['legacy', 'stream']
+
+
+def _status_mib(field):
+    # VmHWM direset saat exec; ru_maxrss ikut mewarisi puncak proses induk
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _load(mode, url):
+    params = {"action": SLS_ACTION}
+    if mode == 'legacy':
+        data = fetch_json(url, params=params, timeout=TIMEOUTS[SLS_ACTION])
+        return preprocess_sls(pd.DataFrame(data['records']))
+    return fetch_stream(url, lambda chunks: typed_frame(chunks, preprocess_sls), params=params,
+                        timeout=TIMEOUTS[SLS_ACTION])
+
+
+def child(mode, url):
+    baseline = _status_mib('VmRSS')
+    t0 = time.perf_counter()
+    df = _load(mode, url)
+    elapsed = time.perf_counter() - t0
+    peak = _status_mib('VmHWM')
+    print(json.dumps({"mode": mode, "rows": len(df), "seconds": elapsed, "baseline_mib": baseline,
+                      "peak_mib": peak, "frame_mib": df.memory_usage(deep=True).sum() / 2 ** 20}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--child', choices=MODES)
+    parser.add_argument('--url')
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.url)
+        return
+
+    raw = make_sls_frame(args.rows)
+    body = b'{"records":' + raw.to_json(orient='records').encode('utf-8') + b'}'
+    del raw
+    print(f"rows             : {args.rows} (payload {len(body) / 2 ** 20:.1f} MiB)")
+
+    results = {}
+    with StubServer({"/sls/exec": StubEndpoint({SLS_ACTION: body})}) as server:
+        for mode in MODES:
+            out = subprocess.run([sys.executable, '-m', 'benchmarks.bench_sls_ingest', '--child', mode,
+                                  '--url', server.url("/sls/exec")], capture_output=True, text=True, check=True)
+            r = results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+            growth = r['peak_mib'] - r['baseline_mib']
+            print(f"{mode:<17}: peak RSS {r['peak_mib']:8.1f} MiB (+{growth:7.1f} di atas import), "
+                  f"frame {r['frame_mib']:7.1f} MiB, {r['seconds']:.2f} s")
+
+    legacy, stream = results['legacy'], results['stream']
+    saved = 1 - (stream['peak_mib'] - stream['baseline_mib']) / (legacy['peak_mib'] - legacy['baseline_mib'])
+    print(f"reduction        : {saved:.0%} puncak RSS di atas baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Memori dan waktu frame SLS: preprocessing lama (int64 + str) vs frame bertipe.
+
+Default meniru skala nasional (±1 juta SLS)::
+
+    python -m benchmarks.bench_sls_memory --rows 1000000
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import make_sls_frame
+from kawan.sls import NUMERIC_COLS, STR_COLS, preprocess_sls
+
+
+def legacy_preprocess(df):
+    for col in NUMERIC_COLS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(int)
+    for col in STR_COLS:
+        if col in df.columns:
+            df[col] = df[col].fillna('-').astype(str)
+    return df
+
+
+def _downstream(df):
+    """Operasi khas page_sls: filter wilayah, groupby kecamatan/PPL, value_counts status."""
+    t0 = time.perf_counter()
+    prov = df['nmprov'].iloc[0]
+    sub = df[df['nmprov'] == prov]
+    sub.groupby('nmkec', observed=True).agg(total_sls=('kodeSLS', 'count'), selesai=('jumlahSelesaiLapangan', 'sum'))
+    df.groupby('Nama_PPL', observed=True).agg(total_sls=('kodeSLS', 'count'), submit=('jumlahSubmit', 'sum'))
+    df['statusSls'].value_counts()
+    sorted(df['nmkec'].unique())
+    return time.perf_counter() - t0
+
+
+def _mb(df):
+    return df.memory_usage(deep=True).sum() / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    raw = make_sls_frame(args.rows)
+    print(f"rows             : {args.rows} (pandas {pd.__version__})")
+    print(f"raw frame        : {_mb(raw):8.1f} MiB")
+
+    t0 = time.perf_counter()
+    legacy = legacy_preprocess(raw.copy())
+    t_legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    typed = preprocess_sls(raw.copy())
+    t_typed = time.perf_counter() - t0
+
+    print(f"legacy frame     : {_mb(legacy):8.1f} MiB  (preprocess {t_legacy:.2f} s, downstream {_downstream(legacy):.3f} s)")
+    print(f"typed frame      : {_mb(typed):8.1f} MiB  (preprocess {t_typed:.2f} s, downstream {_downstream(typed):.3f} s)")
+    print(f"reduction        : {1 - _mb(typed) / _mb(legacy):.0%}")
+
+
+if __name__ == "__main__":
+    main()
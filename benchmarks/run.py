@@ -0,0 +1,217 @@
+"""Suite benchmark kedua halaman dashboard pada data sintetis.
+
+Data ``readDBSLS`` dan ``read-history-message`` dibangkitkan oleh
+``benchmarks/synthetic.py`` lalu disajikan dari server HTTP lokal
+(``benchmarks/stub_server.py``). Setiap tahap diukur terpisah dan hasilnya
+disimpan sebagai JSON agar bisa dibandingkan antar commit::
+
+    python -m benchmarks.run --sizes 10000 100000 1000000
+    python -m benchmarks.run --compare benchmarks/results/a.json benchmarks/results/b.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.stub_server import StubEndpoint, StubServer
+from benchmarks.synthetic import make_history_frame, make_sls_frame
+from kawan.chat_index import ChatIndex
+from kawan.config import HISTORY_ACTION, SLS_ACTION
+from kawan.export import write_csv
+from kawan.fetch import ChangeTracker, fetch_stream, get_session
+from kawan.figures import fingerprint
+from kawan.hierarchy import RegionIndex
+from kawan.history import history_frame
+from kawan.latency import LatencySketches
+from kawan.ingest import typed_frame
+from kawan.pipeline import sls_desa_counts, sls_progress_by, sls_status_counts
+from kawan.progress import ppl_progress_table
+from kawan.response_time import conversation_pairs
+from kawan.rollup import RollupCube
+from kawan.search import SearchIndex
+from kawan.sls import preprocess_sls
+from kawan.timeseries import activity_series
+from kawan.words import WordCounts, top_words
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+
+
+class StageTimer:
+    """Kumpulkan waktu per tahap; setiap tahap diulang ``repeat`` kali, diambil yang tercepat."""
+
+    def __init__(self, page, rows, repeat):
+        self.page, self.rows, self.repeat = page, rows, repeat
+        self.results = []
+
+    def run(self, stage, fn):
+        best, result = float('inf'), None
+        for _ in range(self.repeat):
+            t0 = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - t0)
+        self.results.append({"page": self.page, "rows": self.rows, "stage": stage, "seconds": best})
+        print(f"  {self.page:<5}{self.rows:>9}  {stage:<16}{best:10.4f} s")
+        return result
+
+
+def _json_body(frame):
+    return b'{"records":' + frame.to_json(orient='records').encode('utf-8') + b'}'
+
+
+def bench_sls(url, rows, repeat):
+    timer = StageTimer("sls", rows, repeat)
+    session = get_session()
+
+    body = timer.run("fetch", lambda: session.get(url, params={"action": SLS_ACTION}).content)
+    # Nilai besar diikat sebagai default lambda agar bisa dilepas dengan ``del``
+    data = timer.run("json_decode", lambda body=body: json.loads(body))
+    raw = timer.run("frame", lambda data=data: pd.DataFrame(data['records']))
+    del data, body
+    df = timer.run("preprocess", lambda raw=raw: preprocess_sls(raw.copy()))
+    del raw
+    def ingest(tracker=None):
+        return fetch_stream(url, lambda chunks: typed_frame(chunks, preprocess_sls), params={"action": SLS_ACTION},
+                            tracker=tracker)
+    timer.run("stream_ingest", ingest)
+    tracker = ChangeTracker()
+    ingest(tracker)
+    timer.run("revalidate", lambda: ingest(tracker))
+
+    index = timer.run("index_build", lambda: RegionIndex(df))
+    prov = index.labels('nmprov')[0]
+    selection = {'nmprov': prov, 'nmkab': index.options('nmkab', {'nmprov': prov})[0], 'statusSls': 'belum'}
+    timer.run("filter", lambda: df.iloc[index.rows(selection)])
+
+    search = timer.run("search_build", lambda: SearchIndex(df))
+    timer.run("search", lambda: [search.search(q) for q in ("budi", "rt 00", "01")])
+
+    cube = timer.run("rollup_build", lambda: RollupCube.from_frame(df))
+
+    def rollups():
+        sliced = cube.slice({'nmprov': prov})
+        sliced.rollup('nmkec', total_sls='total_sls', selesai='jumlahSelesaiLapangan')
+        sliced.rollup('Nama_PPL', total_sls='total_sls', selesai='jumlahSelesaiLapangan')
+        sliced.rollup(['nmkec', 'nmdesa'], jumlah='total_sls')
+        return sliced
+    sliced = timer.run("groupby", rollups)
+    charts = [sls_status_counts(sliced), sls_progress_by(sliced, 'nmkec'), sls_progress_by(sliced, 'Nama_PPL'),
+              sls_desa_counts(sliced)]
+    # Biaya rerun saat chart tidak berubah: hanya fingerprint agregat, figure diambil dari cache
+    timer.run("chart_fingerprint", lambda: [fingerprint(agg) for agg in charts])
+    timer.run("ppl_table", lambda: ppl_progress_table(df))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        timer.run("export_csv", lambda: write_csv(df, os.path.join(tmp, "sls.csv")))
+    return timer.results
+
+
+def bench_chat(url, rows, repeat):
+    timer = StageTimer("chat", rows, repeat)
+    session = get_session()
+
+    body = timer.run("fetch", lambda: session.get(url, params={"action": HISTORY_ACTION}).content)
+    data = timer.run("json_decode", lambda body=body: json.loads(body))
+    df = timer.run("frame", lambda data=data: history_frame(data, url))
+    del data, body
+
+    words = timer.run("word_counts", lambda: WordCounts.from_messages(df))
+    latency = timer.run("latency_build", lambda: LatencySketches.from_messages(df))
+    index = timer.run("index_build", lambda: ChatIndex(df, words, latency))
+    user = index.users[len(index.users) // 2]
+    mid = df['datetime'].min() + (df['datetime'].max() - df['datetime'].min()) / 2
+    timer.run("slice", lambda: index.select(user, mid, mid + pd.Timedelta(days=7)))
+    timer.run("response_pairs", lambda: conversation_pairs(df[['no', 'status', 'datetime']]))
+    timer.run("word_freq", lambda: top_words(df['message']))
+    timer.run("latency_stats", lambda: latency.stats(user=user, start=mid, end=mid + pd.Timedelta(days=7)))
+    timer.run("word_top", lambda: words.top(user=user, start=mid, end=mid + pd.Timedelta(days=7)))
+    start, end = df['datetime'].min(), df['datetime'].max()
+    timer.run("activity", lambda: activity_series(df['datetime'], start, end))
+    return timer.results
+
+
+def _metadata():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def run_suite(sizes, repeat, output_dir):
+    results = []
+    for rows in sizes:
+        endpoints = {
+            "/sls/exec": StubEndpoint({SLS_ACTION: _json_body(make_sls_frame(rows))}),
+            "/chat/exec": StubEndpoint({HISTORY_ACTION: _json_body(make_history_frame(rows))}),
+        }
+        with StubServer(endpoints) as server:
+            results += bench_sls(server.url("/sls/exec"), rows, repeat)
+            results += bench_chat(server.url("/chat/exec"), rows, repeat)
+        del endpoints
+
+    report = {"meta": _metadata(), "results": results}
+    os.makedirs(output_dir, exist_ok=True)
+    commit = (report["meta"]["commit"] or "nogit")[:7]
+    path = os.path.join(output_dir, f"bench-{commit}-{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nHasil disimpan ke {path}")
+    return path
+
+
+def compare(old_path, new_path, threshold):
+    """Cetak rasio waktu baru/lama per tahap; exit 1 bila ada regresi di atas ``threshold``."""
+    def load(path):
+        with open(path) as f:
+            report = json.load(f)
+        return report["meta"], {(r["page"], r["rows"], r["stage"]): r["seconds"] for r in report["results"]}
+
+    old_meta, old = load(old_path)
+    new_meta, new = load(new_path)
+    print(f"lama: {old_meta.get('commit')}  baru: {new_meta.get('commit')}")
+    regressions = []
+    for key in sorted(set(old) & set(new)):
+        ratio = new[key] / old[key] if old[key] > 0 else float('inf')
+        flag = "REGRESI" if ratio > threshold else ""
+        print(f"  {key[0]:<5}{key[1]:>9}  {key[2]:<16}{old[key]:10.4f} {new[key]:10.4f}  x{ratio:5.2f} {flag}")
+        if flag:
+            regressions.append(key)
+    if regressions:
+        raise SystemExit(f"{len(regressions)} tahap melambat lebih dari {threshold:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--output', default=RESULTS_DIR)
+    parser.add_argument('--compare', nargs=2, metavar=('LAMA', 'BARU'))
+    parser.add_argument('--threshold', type=float, default=1.10)
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare, args.threshold)
+    else:
+        run_suite(args.sizes, args.repeat, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Server HTTP lokal pengganti endpoint Apps Script untuk benchmark dan uji.
+
+Setiap path (mis. ``/macros/s/A/exec``) dipetakan ke sebuah ``StubEndpoint``
+yang menentukan payload per ``action``, jeda respons, dan jumlah kegagalan
+503 sementara sebelum berhasil. Respons dikompres gzip bila klien memintanya.
+Dengan ``etag=True`` endpoint mengirim ETag (hash body) dan menjawab 304
+untuk ``If-None-Match`` yang cocok.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class StubEndpoint:
+    def __init__(self, payloads, delay=0.0, fail_times=0, etag=False):
+        self.payloads = payloads
+        self.delay = delay
+        self.fail_times = fail_times
+        self.etag = etag
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    def body_for(self, action):
+        payload = self.payloads[action]
+        if callable(payload):
+            payload = payload()
+        if isinstance(payload, bytes):
+            return payload
+        return json.dumps(payload).encode('utf-8')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        endpoint = self.server.endpoints.get(parsed.path)
+        if endpoint is None:
+            self._send(404, b'{"error": "not found"}')
+            return
+
+        with endpoint._lock:
+            endpoint.hits += 1
+            failing = endpoint.hits <= endpoint.fail_times
+        if endpoint.delay:
+            time.sleep(endpoint.delay)
+        if failing:
+            self._send(503, b'{"error": "unavailable"}')
+            return
+
+        action = parse_qs(parsed.query).get('action', [''])[0]
+        try:
+            body = endpoint.body_for(action)
+        except KeyError:
+            self._send(400, b'{"error": "unknown action"}')
+            return
+        if not endpoint.etag:
+            self._send(200, body)
+            return
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self._send(304, b'', {"ETag": etag})
+        else:
+            self._send(200, body, {"ETag": etag})
+
+    def _send(self, status, body, extra_headers=None):
+        headers = {"Content-Type": "application/json", **(extra_headers or {})}
+        if body and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """Jalankan ``ThreadingHTTPServer`` di thread latar; dipakai sebagai context manager."""
+
+    def __init__(self, endpoints, host="127.0.0.1", port=0):
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.endpoints = endpoints
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path):
+        return self.base_url + path
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
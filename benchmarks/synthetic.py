@@ -0,0 +1,139 @@
+"""Generator data sintetis untuk ``readDBSLS`` dan ``read-history-message``.
+
+Hierarki wilayah meniru proporsi nasional (±38 provinsi, ±514 kabupaten,
+±7.2 ribu kecamatan, ±84 ribu desa) dan diskalakan turun untuk jumlah baris
+kecil agar setiap desa tetap berisi beberapa SLS. Satu PPL memegang ±15 SLS
+di satu desa/kecamatan, satu PML mengawasi ±6 PPL.
+"""
+
+import numpy as np
+import pandas as pd
+
+N_PROV = 38
+N_KAB = 514
+N_KEC = 7_200
+N_DESA = 84_000
+SLS_PER_PPL = 15
+PPL_PER_PML = 6
+STATUS_CHOICES = ['belum', 'proses', 'selesai', '-']
+STATUS_WEIGHTS = [0.40, 0.30, 0.25, 0.05]
+
+_WORDS = ['maju', 'jaya', 'makmur', 'sejahtera', 'indah', 'baru', 'lama', 'timur', 'barat',
+          'utara', 'selatan', 'tengah', 'sari', 'mulya', 'asri', 'damai', 'harapan', 'mekar']
+_NAMES = ['budi', 'siti', 'agus', 'dewi', 'rina', 'joko', 'ani', 'eko', 'sri', 'wati',
+          'andi', 'putri', 'rudi', 'yanti', 'hadi', 'lina', 'tono', 'nur', 'dian', 'fajar']
+
+
+def _labels(prefix, codes, rng, words=_WORDS):
+    # Nama unik per kode, deterministik untuk seed yang sama
+    first = rng.choice(words, len(codes))
+    second = rng.choice(words, len(codes))
+    return np.array([f"{prefix} {a.title()} {b.title()} {c}" for a, b, c in zip(first, second, codes)])
+
+
+def _person(rng, n):
+    first = rng.choice(_NAMES, n)
+    last = rng.choice(_NAMES, n)
+    return np.array([f"{a.title()} {b.title()}" for a, b in zip(first, last)])
+
+
+def make_sls_frame(rows, seed=0):
+    """DataFrame mentah seperti ``pd.DataFrame(payload['records'])`` hasil ``readDBSLS``."""
+    rng = np.random.default_rng(seed)
+    n_desa = int(min(N_DESA, max(1, rows // 15)))
+    n_kec = int(min(N_KEC, max(1, n_desa // 12)))
+    n_kab = int(min(N_KAB, max(1, n_kec // 14)))
+    n_prov = int(min(N_PROV, max(1, n_kab // 13)))
+
+    kab_prov = np.sort(rng.integers(0, n_prov, n_kab))
+    kec_kab = np.sort(rng.integers(0, n_kab, n_kec))
+    desa_kec = np.sort(rng.integers(0, n_kec, n_desa))
+    prov_names = _labels("Provinsi", np.arange(n_prov), rng)
+    kab_names = _labels("Kab.", np.arange(n_kab), rng)
+    kec_names = _labels("Kec.", np.arange(n_kec), rng)
+    desa_names = _labels("Desa", np.arange(n_desa), rng)
+
+    # SLS diurutkan per desa sehingga PPL berurutan memegang SLS yang berdekatan
+    desa = np.sort(rng.integers(0, n_desa, rows))
+    kec = desa_kec[desa]
+    kab = kec_kab[kec]
+    prov = kab_prov[kab]
+
+    ppl = np.arange(rows) // SLS_PER_PPL
+    pml = ppl // PPL_PER_PML
+    n_ppl, n_pml = int(ppl.max()) + 1, int(pml.max()) + 1
+    ppl_names = _person(rng, n_ppl)
+    pml_names = _person(rng, n_pml)
+
+    status = rng.choice(STATUS_CHOICES, rows, p=STATUS_WEIGHTS)
+    target = rng.integers(20, 150, rows)
+    selesai = np.where(status == 'belum', 0, (target * rng.random(rows)).astype(int))
+    submit = (selesai * rng.random(rows)).astype(int)
+    approved = (submit * rng.random(rows)).astype(int)
+    reject = submit - approved - (submit - approved) // 2
+
+    seq = np.arange(rows)
+    return pd.DataFrame({
+        'kodeSLS': [f"{p:02d}{k:04d}{c:04d}{d:05d}{s:04d}" for p, k, c, d, s in zip(prov, kab, kec, desa, seq % 10000)],
+        'nmsls': [f"RT {s % 30 + 1:03d} RW {s % 12 + 1:02d}" for s in seq],
+        'nama_ketua': _person(rng, rows),
+        'nmprov': prov_names[prov],
+        'nmkab': kab_names[kab],
+        'nmkec': kec_names[kec],
+        'nmdesa': desa_names[desa],
+        'Nama_PML': pml_names[pml],
+        'Nama_PPL': ppl_names[ppl],
+        'emailPML': [f"pml{i}@bps.go.id" for i in pml],
+        'emailPPL': [f"ppl{i}@bps.go.id" for i in ppl],
+        'PJKuda': np.array([f"PJ {i}" for i in range(n_pml // 10 + 1)])[pml // 10],
+        'noHpPml': [f"08{1000000000 + i}" for i in pml],
+        'noHPMitra': [f"08{2000000000 + i}" for i in ppl],
+        'statusSls': status,
+        'jumlahSelesaiLapangan': selesai,
+        'jumlahSubmit': submit,
+        'JumlahApproved': approved,
+        'JumlahReject': reject,
+        'jumlahSelesaiLapanganSementara': selesai,
+        'jumlahSubmitSementara': submit,
+        'JumlahApprovedSementara': approved,
+        'JumlahRejectSementara': reject,
+    })
+
+
+def make_sls_payload(rows, seed=0):
+    """Payload JSON ``{"records": [...]}`` seperti respons ``readDBSLS``."""
+    return {"records": make_sls_frame(rows, seed).to_dict('records')}
+
+
+def make_history_frame(rows, seed=0, users=2000):
+    """History pesan sintetis: percakapan user ↔ bot dengan jeda acak.
+
+    ``no`` adalah nomor user di kedua arah, seperti yang diasumsikan
+    ``conversation_pairs``: ``receive`` dikirim user itu dan ``send`` adalah
+    balasan bot kepadanya. User aktif berganti acak (~30% pesan), jadi pesan
+    user lain bisa menyela sebelum balasan datang.
+    """
+    rng = np.random.default_rng(seed)
+    gaps = np.where(rng.random(rows) < 0.9, rng.integers(1, 900, rows), rng.integers(900, 3 * 86400, rows))
+    times = np.datetime64('2024-01-01T00:00:00') + np.cumsum(gaps).astype('timedelta64[s]')
+    status = np.where(rng.random(rows) < 0.5, 'receive', 'send')
+    user = rng.integers(1, users + 1, rows).astype(str)
+    switch = rng.random(rows) < 0.3
+    switch[:1] = True
+    no = user[np.maximum.accumulate(np.where(switch, np.arange(rows), 0))]
+    words = rng.choice(_WORDS + _NAMES + ['yang', 'di', 'ke', 'dan', 'saya', 'sls', 'progres', 'submit'],
+                       (rows, 6))
+    timestamps = (times - np.datetime64(0, 's')).astype(np.int64) * 1000
+    return pd.DataFrame({
+        'id': np.arange(rows).astype(str),
+        'no': no,
+        'status': status,
+        'message': [" ".join(w[:rng_len]) for w, rng_len in zip(words, rng.integers(1, 7, rows))],
+        'currentTime': pd.to_datetime(times).strftime('%d/%m/%Y, %H.%M.%S'),
+        'timestamp': timestamps,
+    })
+
+
+def make_history_payload(rows, seed=0, **kwargs):
+    """Payload JSON ``{"records": [...]}`` seperti respons ``read-history-message``."""
+    return {"records": make_history_frame(rows, seed, **kwargs).to_dict('records')}
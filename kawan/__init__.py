@@ -0,0 +1 @@
+"""Logika komputasi dashboard Monitoring KAWAN (tanpa dependensi Streamlit)."""
@@ -0,0 +1,102 @@
+"""Indeks history pesan chatbot untuk filter user dan rentang tanggal.
+
+Dibangun sekali per muatan data:
+
+- frame diurutkan menurut ``datetime`` (NaT di akhir), sehingga rentang
+  tanggal cukup dicari dengan ``searchsorted`` lalu di-slice;
+- posting list per user (``no``): posisi baris terurut waktu, disimpan
+  berdampingan dengan timestamp-nya agar user + rentang tanggal juga hanya
+  berupa dua pencarian biner di dalam posting user itu;
+- daftar user untuk dropdown;
+- counter kata (``WordCounts``) dan sketch waktu respon (``LatencySketches``)
+  per hari/user untuk grafik frekuensi kata dan persentil waktu respon.
+"""
+
+import numpy as np
+import pandas as pd
+
+from kawan.latency import LatencySketches
+from kawan.words import WordCounts
+
+USER_COL = 'no'
+_NAT = np.iinfo(np.int64).max
+
+
+def sort_by_time(df):
+    """``df`` terurut stabil menurut ``datetime``; dikembalikan apa adanya bila sudah terurut."""
+    if df.empty or df['datetime'].is_monotonic_increasing:
+        return df
+    return df.sort_values('datetime', kind='stable', na_position='last', ignore_index=True)
+
+
+class ChatIndex:
+    def __init__(self, df, words=None, latency=None):
+        self.frame = sort_by_time(df)
+        self.words = words if words is not None else WordCounts.from_messages(self.frame)
+        self.latency = latency if latency is not None else LatencySketches.from_messages(self.frame)
+        n = len(self.frame)
+        # Timestamp ns per baris; NaT (selalu di akhir) diberi nilai maksimum agar tetap terurut
+        self._ns = np.full(n, _NAT, np.int64)
+        if n:
+            times = self.frame['datetime']
+            self.n_valid = int(times.notna().sum())
+            self._ns[:self.n_valid] = times.iloc[:self.n_valid].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        else:
+            self.n_valid = 0
+
+        self.users = []
+        self._user_code = {}
+        self._order = np.empty(0, np.int64)
+        self._bounds = np.zeros(1, np.int64)
+        if USER_COL in self.frame.columns:
+            codes, uniques = pd.factorize(self.frame[USER_COL], sort=True)
+            self.users = [str(v) for v in uniques]
+            self._user_code = {user: i for i, user in enumerate(self.users)}
+            # Sort stabil atas kode: di dalam setiap user posisi baris (dan waktunya) tetap naik
+            order = np.argsort(codes, kind='stable')
+            self._order = order[codes[order] >= 0]
+            self._bounds = np.searchsorted(codes[self._order], np.arange(len(self.users) + 1))
+        self._order_ns = self._ns[self._order]
+
+    def _span(self, user):
+        """``(timestamp terurut, offset)`` seluruh baris atau posting ``user``."""
+        if user is None:
+            return self._ns, 0
+        code = self._user_code.get(str(user))
+        if code is None:
+            return self._order_ns[:0], 0
+        lo, hi = self._bounds[code], self._bounds[code + 1]
+        return self._order_ns[lo:hi], int(lo)
+
+    def date_bounds(self, user=None):
+        """``(tanggal_awal, tanggal_akhir)`` pesan bertanggal (milik ``user`` bila diisi), atau None."""
+        ns, _ = self._span(user)
+        n_valid = int(np.searchsorted(ns, _NAT))
+        if n_valid == 0:
+            return None
+        return pd.Timestamp(ns[0]).date(), pd.Timestamp(ns[n_valid - 1]).date()
+
+    def rows(self, user=None, start=None, end=None):
+        """Posisi baris ``user`` dengan ``start <= datetime < end``.
+
+        Tanpa ``user`` hasilnya ``slice`` atas frame; dengan ``user`` array
+        posisi terurut. Batas None berarti tidak dibatasi; baris tanpa
+        ``datetime`` hanya ikut bila kedua batas None.
+        """
+        ns, offset = self._span(user)
+        lo, hi = 0, len(ns)
+        if start is not None or end is not None:
+            hi = int(np.searchsorted(ns, _NAT))
+        if start is not None:
+            lo = int(np.searchsorted(ns, pd.Timestamp(start).value))
+        if end is not None:
+            hi = min(hi, int(np.searchsorted(ns, pd.Timestamp(end).value)))
+        lo, hi = offset + lo, offset + max(lo, hi)
+        return slice(lo, hi) if user is None else self._order[lo:hi]
+
+    def select(self, user=None, start=None, end=None):
+        """Subset frame untuk ``user`` dan rentang ``[start, end)``."""
+        rows = self.rows(user, start, end)
+        if isinstance(rows, slice) and rows == slice(0, len(self.frame)):
+            return self.frame
+        return self.frame.iloc[rows]
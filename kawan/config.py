@@ -0,0 +1,50 @@
+"""Endpoint Apps Script dan parameter pengambilan data."""
+
+import os
+
+CHATBOT_API_URLS = [
+    "https://script.google.com/macros/s/AKfycbwXynUCMX_pLTl1UU8UcbQzbrxvV9wsyloHEkrFH4vOCIrz4MaQ_B8HFrxgJ5L_Qmrz/exec",
+    "https://script.google.com/macros/s/AKfycbxryhvmXetPamDTnX0PwgdQmo0t7dluEPIPHajXMRb4j0Res05WrPbM-lEMfBG3_39oMQ/exec"
+]
+
+SLS_API_URL = "https://script.google.com/macros/s/AKfycbxryhvmXetPamDTnX0PwgdQmo0t7dluEPIPHajXMRb4j0Res05WrPbM-lEMfBG3_39oMQ/exec"
+
+HISTORY_ACTION = "read-history-message"
+SLS_ACTION = "readDBSLS"
+
+# Timeout (connect, read) dalam detik per action endpoint
+TIMEOUTS = {
+    HISTORY_ACTION: (10, 60),
+    SLS_ACTION: (10, 60),
+}
+
+# Interval (detik) refresher latar belakang data SLS
+SLS_REFRESH_INTERVAL = int(os.environ.get("KAWAN_SLS_REFRESH_INTERVAL", 300))
+
+# Direktori store Parquet lokal untuk history pesan (lihat kawan/history_store.py)
+HISTORY_STORE_DIR = os.environ.get("KAWAN_HISTORY_STORE", os.path.join("data", "history"))
+
+# Direktori cache file ekspor (CSV/Parquet/XLSX) yang dibuat sesuai permintaan
+EXPORT_DIR = os.environ.get("KAWAN_EXPORT_DIR", os.path.join("data", "exports"))
+
+# Instrumentasi performa (lihat kawan/perf.py); nonaktif kecuali KAWAN_PERF=1
+PERF_ENABLED = os.environ.get("KAWAN_PERF", "").lower() in ("1", "true", "yes")
+
+# File teks metrik bergaya Prometheus yang ditulis ulang setiap rerun (opsional)
+PERF_METRICS_FILE = os.environ.get("KAWAN_PERF_METRICS") or None
+
+# Direktori snapshot hasil worker headless (kawan/worker.py). Bila diisi,
+# dashboard hanya membaca snapshot dan tidak mengambil data dari Apps Script
+SNAPSHOT_DIR = os.environ.get("KAWAN_SNAPSHOT_DIR") or None
+
+# Mode chunked worker untuk data skala nasional (kawan/partitions.py): kolom
+# partisi ``nmprov``/``nmkab`` dan jumlah proses agregasi (default: jumlah CPU)
+SLS_PARTITION_BY = os.environ.get("KAWAN_SLS_PARTITION_BY") or None
+SLS_PROCESSES = int(os.environ.get("KAWAN_SLS_PROCESSES", 0)) or None
+
+# Cache on-disk bersama antar proses dashboard (kawan/shared_cache.py); nonaktif bila kosong
+SHARED_CACHE_DIR = os.environ.get("KAWAN_SHARED_CACHE") or None
+SHARED_CACHE_MAX_BYTES = int(os.environ.get("KAWAN_SHARED_CACHE_MAX_BYTES", 2 * 1024 ** 3))
+
+# TTL (detik) data history pesan chatbot
+HISTORY_TTL = 300
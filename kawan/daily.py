@@ -0,0 +1,151 @@
+"""Counter per hari × user yang bisa digabung antar rentang tanggal.
+
+Dasar ``WordCounts`` (item = kata) dan ``LatencySketches`` (item = bucket
+sketch waktu respon). Setiap hari menyimpan array ``(user, item, count)``
+terurut ``(user, item)`` sehingga counter satu user adalah satu slice, plus
+total ``(item, count)`` semua user. Hasil untuk rentang tanggal/user mana
+pun didapat dengan menggabungkan counter hari-hari di rentang itu; data baru
+hanya mengubah counter harinya sendiri.
+
+Satu penulis (store/loader) boleh memperbarui counter sementara sesi lain
+membacanya tanpa lock: entri hari dipasang dengan satu assignment, tidak
+pernah dihapus dulu lalu ditambah ulang, dan daftar hari terurut diganti
+dengan list baru setelah entri hari barunya ada.
+"""
+
+import bisect
+
+import numpy as np
+import pandas as pd
+
+UNKNOWN_DAY = 'unknown'
+DAY_FORMAT = '%Y-%m-%d'
+
+
+def day_keys(datetimes):
+    """Kunci hari ``YYYY-MM-DD`` (``unknown`` untuk NaT), sama dengan partisi ``HistoryStore``."""
+    return datetimes.dt.strftime(DAY_FORMAT).fillna(UNKNOWN_DAY)
+
+
+def encode(vocab, codes, values):
+    """Kode integer ``values`` pada ``vocab``; nilai baru ditambahkan ke akhir vocab."""
+    inverse, uniques = pd.factorize(np.asarray(values, dtype=object))
+    mapped = np.empty(len(uniques), np.int32)
+    for i, value in enumerate(uniques):
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(vocab)
+            vocab.append(value)
+        mapped[i] = code
+    return mapped[inverse]
+
+
+def sum_by(key, counts):
+    keys, inverse = np.unique(key, return_inverse=True)
+    return keys, np.bincount(inverse, weights=counts, minlength=len(keys)).astype(np.int64)
+
+
+class DailyCounts:
+    """Counter ``(day, user, item)``; subclass menentukan arti ``item`` lewat ``ITEM_COL``."""
+
+    ITEM_COL = 'item'
+
+    def __init__(self):
+        self.users, self._user_code = [], {}
+        self.days = {}
+        self._totals = {}
+        self._sorted_days = []
+
+    # ─── Kode item (di-override subclass) ───
+    def _item_codes(self, values):
+        return np.asarray(values, dtype=np.int64)
+
+    def _item_labels(self, items):
+        return items
+
+    # ─── Tabel panjang ``day, no, <item>, count`` ───
+    @classmethod
+    def from_table(cls, table):
+        counts = cls()
+        counts._add(table, replace=True)
+        return counts
+
+    def to_table(self, days=None):
+        days = self._sorted_days if days is None else [d for d in days if d in self.days]
+        if not days:
+            return pd.DataFrame({'day': [], 'no': [], self.ITEM_COL: [], 'count': []})
+        users, items, counts = (np.concatenate([self.days[d][i] for d in days]) for i in range(3))
+        return pd.DataFrame({
+            'day': np.repeat(days, [len(self.days[d][0]) for d in days]),
+            'no': np.asarray(self.users, dtype=object)[users],
+            self.ITEM_COL: self._item_labels(items),
+            'count': counts,
+        })
+
+    def _add(self, table, replace):
+        if table.empty:
+            return
+        day_codes, day_names = pd.factorize(table['day'])
+        users = encode(self.users, self._user_code, table['no'])
+        items = self._item_codes(table[self.ITEM_COL])
+        counts = table['count'].to_numpy(np.int64)
+
+        order = np.lexsort((items, users, day_codes))
+        day_codes, users, items, counts = day_codes[order], users[order], items[order], counts[order]
+        bounds = np.searchsorted(day_codes, np.arange(len(day_names) + 1))
+        entries = {}
+        for i, day in enumerate(day_names):
+            lo, hi = bounds[i], bounds[i + 1]
+            u, it, c = users[lo:hi], items[lo:hi], counts[lo:hi]
+            if not replace and day in self.days:
+                old_u, old_it, old_c = self.days[day]
+                u, it, c = np.concatenate([old_u, u]), np.concatenate([old_it, it]), np.concatenate([old_c, c])
+            key, c = sum_by((u.astype(np.int64) << 32) | it, c)
+            entries[day] = ((key >> 32).astype(np.int32), (key & 0xFFFFFFFF).astype(np.int32), c)
+        self._publish(entries)
+
+    def _publish(self, entries):
+        new_days = [day for day in entries if day not in self.days]
+        for day, (users, items, counts) in entries.items():
+            self._totals[day] = sum_by(items, counts)
+            self.days[day] = (users, items, counts)
+        if new_days:
+            self._sorted_days = sorted(self._sorted_days + new_days)
+
+    def set_day(self, day, table):
+        """Ganti counter ``day`` dengan isi ``table`` (mis. hasil baca ulang dari disk)."""
+        if table.empty:
+            self._publish({day: (np.zeros(0, np.int32), np.zeros(0, np.int32), np.zeros(0, np.int64))})
+            return
+        self._add(table.assign(day=day), replace=True)
+
+    # ─── Query ───
+    def _day_range(self, start, end):
+        if start is None and end is None:
+            return self._sorted_days
+        # ``unknown`` terurut setelah semua tanggal ISO, jadi cukup dibatasi di ujung atas
+        days = self._sorted_days
+        lo = 0 if start is None else bisect.bisect_left(days, pd.Timestamp(start).strftime(DAY_FORMAT))
+        hi = (bisect.bisect_left(days, UNKNOWN_DAY) if end is None
+              else bisect.bisect_left(days, pd.Timestamp(end).strftime(DAY_FORMAT)))
+        return days[lo:hi]
+
+    def merged(self, user=None, start=None, end=None):
+        """Jumlah per kode item untuk ``user`` di hari ``[start, end)`` (array padat, indeks = kode).
+
+        Tanpa batas tanggal, data tanpa ``datetime`` ikut dihitung.
+        """
+        days = self._day_range(start, end)
+        if user is None:
+            parts = [self._totals[d] for d in days]
+        else:
+            code = self._user_code.get(str(user))
+            parts = []
+            for d in days if code is not None else []:
+                users, items, counts = self.days[d]
+                lo, hi = np.searchsorted(users, [code, code + 1])
+                parts.append((items[lo:hi], counts[lo:hi]))
+        if not parts:
+            return np.zeros(0, np.int64)
+        items = np.concatenate([p[0] for p in parts])
+        return np.bincount(items, weights=np.concatenate([p[1] for p in parts])).astype(np.int64)
@@ -0,0 +1,147 @@
+"""Mesin ekspor tabel: dibuat hanya saat diminta, di-memo per hash, ditulis per chunk.
+
+Setiap ekspor diidentifikasi oleh hash (versi data, state filter, kolom,
+format). File ditulis bertahap ``CHUNK_ROWS`` baris sekaligus ke direktori
+cache, sehingga teks CSV penuh tidak pernah dibangun di memori, lalu dipakai
+ulang selama kuncinya sama. File terlama dihapus saat jumlahnya melebihi
+``MAX_FILES``.
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+
+CHUNK_ROWS = 50_000
+MAX_FILES = 32
+
+# format → (ekstensi file, MIME type, label)
+EXPORT_FORMATS = {
+    'csv': ('csv', 'text/csv', 'CSV'),
+    'csv.gz': ('csv.gz', 'application/gzip', 'CSV (gzip)'),
+    'parquet': ('parquet', 'application/vnd.apache.parquet', 'Parquet'),
+    'xlsx': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'Excel (XLSX)'),
+}
+
+
+def export_key(*parts):
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:20]
+
+
+def _chunks(df):
+    for start in range(0, max(len(df), 1), CHUNK_ROWS):
+        yield start == 0, df.iloc[start:start + CHUNK_ROWS]
+
+
+def write_csv(df, path, compress=False):
+    opener = (lambda p: gzip.open(p, 'wt', encoding='utf-8', newline='', compresslevel=6)) if compress \
+        else (lambda p: open(p, 'w', encoding='utf-8', newline=''))
+    with opener(path) as f:
+        for first, chunk in _chunks(df):
+            chunk.to_csv(f, header=first, index=False)
+
+
+def write_parquet(df, path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for _, chunk in _chunks(df):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_xlsx(df, path):
+    # Format XLSX tidak bisa ditulis bertahap lewat pandas; cocok untuk tabel kecil
+    df.to_excel(path, index=False, engine='openpyxl')
+
+
+WRITERS = {
+    'csv': write_csv,
+    'csv.gz': lambda df, path: write_csv(df, path, compress=True),
+    'parquet': write_parquet,
+    'xlsx': write_xlsx,
+}
+
+
+class ExportCache:
+    def __init__(self, root, max_files=MAX_FILES):
+        self.root = root
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def path_for(self, key, fmt):
+        return os.path.join(self.root, f"{key}.{EXPORT_FORMATS[fmt][0]}")
+
+    def _tmp_path_for(self, key, fmt):
+        # Ekstensi asli tetap di akhir: writer seperti openpyxl menolak nama ``*.tmp``
+        return os.path.join(self.root, f"{key}.tmp.{EXPORT_FORMATS[fmt][0]}")
+
+    def get(self, key, fmt):
+        """Path file ekspor bila sudah ada, selain itu None."""
+        path = self.path_for(key, fmt)
+        if os.path.exists(path):
+            os.utime(path)
+            return path
+        return None
+
+    def open_file(self, key, fmt):
+        """File ekspor yang sudah terbuka (``rb``), atau None bila belum ada.
+
+        Dibuka di bawah lock yang sama dengan ``_evict`` sehingga file tidak
+        terhapus di antara pengecekan dan ``open``; setelah terbuka file tetap
+        bisa dibaca walau kemudian dihapus.
+        """
+        with self._lock:
+            path = self.get(key, fmt)
+            if path is None:
+                return None
+            try:
+                return open(path, 'rb')
+            except FileNotFoundError:
+                # Dihapus proses lain yang berbagi direktori ekspor
+                return None
+
+    def get_or_create(self, key, fmt, build):
+        """Path file ekspor; ``build()`` (pembuat DataFrame) hanya dipanggil bila belum ada."""
+        path = self.get(key, fmt)
+        if path:
+            return path
+        with self._lock:
+            path = self.path_for(key, fmt)
+            if not os.path.exists(path):
+                tmp = self._tmp_path_for(key, fmt)
+                WRITERS[fmt](build(), tmp)
+                os.replace(tmp, path)
+                self._evict()
+        return path
+
+    def _evict(self):
+        files = [os.path.join(self.root, f) for f in os.listdir(self.root) if '.tmp.' not in f]
+        if len(files) <= self.max_files:
+            return
+        files.sort(key=os.path.getmtime)
+        for path in files[:len(files) - self.max_files]:
+            os.remove(path)
+
+
+def available_formats():
+    formats = ['csv', 'csv.gz']
+    try:
+        import pyarrow  # noqa: F401
+        formats.append('parquet')
+    except ImportError:
+        pass
+    try:
+        import openpyxl  # noqa: F401
+        formats.append('xlsx')
+    except ImportError:
+        pass
+    return formats
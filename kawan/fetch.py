@@ -0,0 +1,235 @@
+"""Lapisan fetch bersama untuk endpoint Apps Script.
+
+Satu ``requests.Session`` dengan connection pool keep-alive dipakai oleh semua
+halaman. Request ke beberapa endpoint dijalankan paralel di thread pool,
+sehingga latensi cold-load mengikuti endpoint paling lambat, bukan jumlah
+semuanya. Kegagalan sementara (timeout, koneksi putus, 429/5xx) diulang
+dengan exponential backoff + jitter.
+
+``fetch_stream`` dengan ``ChangeTracker`` mengirim ``If-None-Match`` /
+``If-Modified-Since`` bila endpoint pernah memberi ETag/Last-Modified, dan
+selalu membandingkan hash isi body dengan respons sebelumnya; bila sama,
+body tidak di-parse dan hasilnya ``NOT_MODIFIED``.
+"""
+
+import hashlib
+import json
+import random
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from kawan import perf
+
+DEFAULT_TIMEOUT = (10, 60)
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+POOL_SIZE = 8
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+STREAM_CHUNK = 1 << 20
+
+_session = None
+_session_lock = threading.Lock()
+
+
+NOT_MODIFIED = object()
+
+
+class FetchError(Exception):
+    """Endpoint tetap gagal setelah semua percobaan ulang."""
+
+
+class FetchResult(NamedTuple):
+    url: str
+    data: Any
+    error: Optional[Exception]
+    elapsed: float
+
+
+class ChangeTracker:
+    """Validator respons terakhir satu endpoint: ETag, Last-Modified dan hash isi body."""
+
+    def __init__(self, etag=None, last_modified=None, digest=None):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+
+    @classmethod
+    def from_tag(cls, tag):
+        return cls(**json.loads(tag)) if tag else cls()
+
+    @property
+    def tag(self):
+        """Bentuk string (untuk disimpan bersama nilai di cache); None bila belum ada respons."""
+        if self.digest is None:
+            return None
+        return json.dumps({"etag": self.etag, "last_modified": self.last_modified, "digest": self.digest})
+
+    def request_headers(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def get_session():
+    """Session bersama (thread-safe untuk GET) dengan pool keep-alive dan gzip."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"Accept-Encoding": "gzip, deflate", "Accept": "application/json"})
+                _session = session
+    return _session
+
+
+def _backoff(attempt):
+    # "Full jitter": tidur acak antara 0 dan batas eksponensial
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def _request(url, params, timeout, retries, session, consume, stream=False, headers=None):
+    session = session or get_session()
+    action = (params or {}).get("action", "request")
+    last_error = None
+    for attempt in range(retries + 1):
+        try:
+            with perf.stage(f"fetch.{action}"):
+                response = session.get(url, params=params, timeout=timeout, stream=stream, headers=headers)
+            with response:
+                if response.status_code in RETRY_STATUSES:
+                    last_error = FetchError(f"HTTP {response.status_code} dari {url}")
+                else:
+                    response.raise_for_status()
+                    return consume(response, action)
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            last_error = e
+        perf.count(f"fetch.{action}.retry" if attempt < retries else f"fetch.{action}.failed")
+        if attempt < retries:
+            time.sleep(_backoff(attempt))
+    raise FetchError(f"Gagal mengambil {url} setelah {retries + 1} percobaan: {last_error}") from last_error
+
+
+def _decode_json(response, action):
+    perf.size(f"payload.{action}", len(response.content))
+    with perf.stage(f"json_decode.{action}"):
+        return response.json()
+
+
+def fetch_json(url, params=None, timeout=DEFAULT_TIMEOUT, retries=MAX_RETRIES, session=None):
+    """GET ``url`` dan decode JSON, dengan retry untuk kegagalan sementara."""
+    return _request(url, params, timeout, retries, session, _decode_json)
+
+
+def _counted(chunks, action):
+    total = 0
+    for chunk in chunks:
+        total += len(chunk)
+        yield chunk
+    perf.size(f"payload.{action}", total)
+
+
+def _inflate(raw_chunks, encoding, chunk_size):
+    """Dekompresi gzip/deflate bertahap; setiap chunk keluaran paling besar ``chunk_size``."""
+    if encoding not in ('gzip', 'deflate'):
+        yield from raw_chunks
+        return
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)
+    for chunk in raw_chunks:
+        while chunk:
+            data = decompressor.decompress(chunk, chunk_size)
+            if data:
+                yield data
+            chunk = decompressor.unconsumed_tail
+    tail = decompressor.flush()
+    if tail:
+        yield tail
+
+
+def _spool_if_changed(response, action, tracker, consume, chunk_size):
+    # Body mentah (masih terkompresi) ditampung di file sementara sambil
+    # di-hash; parse hanya dilakukan bila hash-nya berbeda dari respons lalu
+    encoding = response.headers.get('Content-Encoding', '').lower()
+    with tempfile.TemporaryFile() as spool:
+        digest = hashlib.sha256()
+
+        def raw_chunks():
+            for chunk in response.raw.stream(chunk_size, decode_content=False):
+                spool.write(chunk)
+                yield chunk
+
+        with perf.stage(f"hash.{action}"):
+            for data in _inflate(raw_chunks(), encoding, chunk_size):
+                digest.update(data)
+        etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+        if digest.hexdigest() == tracker.digest:
+            tracker.etag, tracker.last_modified = etag, last_modified
+            return NOT_MODIFIED
+
+        spool.seek(0)
+        with perf.stage(f"stream_decode.{action}"):
+            result = consume(_counted(_inflate(iter(lambda: spool.read(chunk_size), b''), encoding, chunk_size),
+                                      action))
+        tracker.etag, tracker.last_modified, tracker.digest = etag, last_modified, digest.hexdigest()
+        return result
+
+
+def fetch_stream(url, consume, params=None, timeout=DEFAULT_TIMEOUT, retries=MAX_RETRIES, session=None,
+                 chunk_size=STREAM_CHUNK, tracker=None):
+    """GET ``url`` tanpa membuffer body; ``consume(chunks)`` membaca iterator chunk ``bytes``.
+
+    Body yang putus di tengah jalan diulang dari awal seperti kegagalan koneksi.
+    Dengan ``tracker``, mengembalikan ``NOT_MODIFIED`` bila endpoint menjawab
+    304 atau isi body sama dengan respons terakhir; ``tracker`` diperbarui
+    setelah body baru berhasil di-``consume``.
+    """
+    def run(response, action):
+        if tracker is None:
+            with perf.stage(f"stream_decode.{action}"):
+                return consume(_counted(response.iter_content(chunk_size), action))
+        if response.status_code == 304:
+            return NOT_MODIFIED
+        return _spool_if_changed(response, action, tracker, consume, chunk_size)
+
+    headers = tracker.request_headers() if tracker is not None else None
+    return _request(url, params, timeout, retries, session, run, stream=True, headers=headers)
+
+
+def _fetch_one(url, params, timeout, retries, session):
+    start = time.perf_counter()
+    try:
+        data = fetch_json(url, params=params, timeout=timeout, retries=retries, session=session)
+        return FetchResult(url, data, None, time.perf_counter() - start)
+    except Exception as e:
+        return FetchResult(url, None, e, time.perf_counter() - start)
+
+
+def fetch_many(urls, params=None, timeout=DEFAULT_TIMEOUT, retries=MAX_RETRIES, session=None):
+    """Ambil beberapa endpoint secara paralel.
+
+    ``params`` boleh berupa satu dict untuk semua URL atau list dict per URL.
+    Mengembalikan ``FetchResult`` sesuai urutan ``urls``; kegagalan satu
+    endpoint dicatat di ``error`` dan tidak membatalkan endpoint lain.
+    """
+    if not urls:
+        return []
+    if not isinstance(params, list):
+        params = [params] * len(urls)
+    session = session or get_session()
+    with ThreadPoolExecutor(max_workers=min(POOL_SIZE, len(urls))) as pool:
+        fetch_one = perf.bind(_fetch_one)
+        futures = [pool.submit(fetch_one, url, p, timeout, retries, session) for url, p in zip(urls, params)]
+        return [f.result() for f in futures]
@@ -0,0 +1,77 @@
+"""Cache figure Plotly per fingerprint agregat masukannya.
+
+Setiap chart dibangun dari agregat kecil (hitungan status, progress per
+wilayah, top kata, deret aktivitas). ``fingerprint`` meng-hash isi agregat
+itu beserta opsi tampilannya; selama hash-nya sama, figure yang sudah
+dibangun dipakai ulang sehingga ``px``/``go`` (pembuatan trace, validasi
+properti) tidak dijalankan lagi pada rerun yang hanya mengubah widget lain.
+Entri yang paling lama tidak dipakai dibuang saat jumlahnya melebihi
+``MAX_ENTRIES``.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from kawan import perf
+
+MAX_ENTRIES = 64
+
+
+def fingerprint(*parts):
+    """Hash isi ``parts`` (DataFrame/Series di-hash per baris, nilai lain lewat ``repr``)."""
+    digest = hashlib.sha1()
+    for part in parts:
+        if isinstance(part, pd.DataFrame):
+            digest.update(repr((list(part.columns), [str(d) for d in part.dtypes], part.shape)).encode('utf-8'))
+            digest.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+        elif isinstance(part, pd.Series):
+            digest.update(repr((part.name, str(part.dtype), len(part))).encode('utf-8'))
+            digest.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+        else:
+            digest.update(repr(part).encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()[:20]
+
+
+class FigureCache:
+    """LRU figure per ``(nama chart, fingerprint)`` dengan counter hit/miss."""
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, name, key, build):
+        """Figure chart ``name`` untuk fingerprint ``key``; ``build()`` hanya dipanggil saat miss."""
+        entry = (name, key)
+        with self._lock:
+            figure = self._entries.get(entry)
+            if figure is not None:
+                self._entries.move_to_end(entry)
+                self.hits += 1
+        if figure is not None:
+            perf.count(f"figure.{name}.hit")
+            return figure
+
+        # Dibangun di luar lock; dua sesi yang miss bersamaan hanya membangun dua kali
+        figure = build()
+        with self._lock:
+            self.misses += 1
+            self._entries[entry] = figure
+            self._entries.move_to_end(entry)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        perf.count(f"figure.{name}.miss")
+        return figure
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions}
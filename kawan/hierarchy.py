@@ -0,0 +1,103 @@
+"""Indeks hierarki wilayah dan petugas untuk filter sidebar bertingkat.
+
+Dibangun sekali per versi data:
+
+- ``paths``: prefix wilayah (prov, kab, kec, desa) → posisi baris
+- ``children``: prefix wilayah → pilihan level berikutnya (terurut)
+- posting list per kolom (wilayah, petugas, status): nilai → posisi baris
+
+Subset baris diambil dari lookup indeks lalu disaring dengan perbandingan
+kode integer pada subset itu saja, bukan mask boolean atas seluruh tabel.
+"""
+
+import numpy as np
+import pandas as pd
+
+REGION_LEVELS = ['nmprov', 'nmkab', 'nmkec', 'nmdesa']
+INDEXED_COLS = REGION_LEVELS + ['Nama_PML', 'Nama_PPL', 'statusSls']
+
+
+class RegionIndex:
+    def __init__(self, df):
+        self.n_rows = len(df)
+        self.levels = [c for c in REGION_LEVELS if c in df.columns]
+        self._codes = {}
+        self._labels = {}
+        self._label_code = {}
+        self._postings = {}
+
+        for col in INDEXED_COLS:
+            if col not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[col], sort=True)
+            codes = codes.astype(np.int32)
+            labels = [str(v) for v in uniques]
+            order = np.argsort(codes, kind='stable').astype(np.int32)
+            bounds = np.searchsorted(codes[order], np.arange(len(labels) + 1))
+            self._codes[col] = codes
+            self._labels[col] = labels
+            self._label_code[col] = {label: i for i, label in enumerate(labels)}
+            self._postings[col] = (order, bounds)
+
+        self.paths = {}
+        self.children = {(): list(self._labels.get(self.levels[0], []))} if self.levels else {}
+        for depth in range(1, len(self.levels) + 1):
+            groups = df.groupby(self.levels[:depth], observed=True, sort=True).indices
+            for key, positions in groups.items():
+                key = tuple(str(k) for k in (key if isinstance(key, tuple) else (key,)))
+                self.paths[key] = positions.astype(np.int32)
+                if depth > 1:
+                    self.children.setdefault(key[:-1], []).append(key[-1])
+        for key in self.children:
+            self.children[key].sort()
+
+    def labels(self, col):
+        return list(self._labels.get(col, []))
+
+    def _posting(self, col, label):
+        code = self._label_code[col].get(label)
+        if code is None:
+            return np.empty(0, np.int32)
+        order, bounds = self._postings[col]
+        return order[bounds[code]:bounds[code + 1]]
+
+    def _region_prefix(self, selection):
+        path = []
+        for level in self.levels:
+            if selection.get(level) is None:
+                break
+            path.append(selection[level])
+        return tuple(path)
+
+    def rows(self, selection):
+        """Posisi baris (terurut) yang cocok dengan ``selection``; None berarti semua baris."""
+        selection = {c: v for c, v in selection.items() if v is not None and c in self._codes}
+        prefix = self._region_prefix(selection)
+        rest = [c for c in selection if c not in self.levels[:len(prefix)]]
+
+        if prefix:
+            rows = self.paths.get(prefix, np.empty(0, np.int32))
+        elif rest:
+            col = rest.pop(0)
+            rows = self._posting(col, selection[col])
+        else:
+            return None
+
+        for col in rest:
+            code = self._label_code[col].get(selection[col], -1)
+            rows = rows[self._codes[col][rows] == code]
+        return rows
+
+    def options(self, col, selection):
+        """Pilihan dropdown ``col`` yang tersisa di bawah pilihan ``selection``."""
+        selection = {c: v for c, v in selection.items() if v is not None and c in self._codes}
+        prefix = self._region_prefix(selection)
+        if (col in self.levels and len(selection) == len(prefix)
+                and self.levels.index(col) == len(prefix)):
+            return list(self.children.get(prefix, []))
+
+        rows = self.rows(selection)
+        if rows is None:
+            return self.labels(col)
+        labels = self._labels[col]
+        return [labels[i] for i in np.unique(self._codes[col][rows])]
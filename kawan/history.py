@@ -0,0 +1,20 @@
+"""Parsing data history pesan chatbot (action ``read-history-message``)."""
+
+import pandas as pd
+
+
+def source_label(url):
+    return url.split('/')[-2][:10] + '...'
+
+
+def history_frame(payload, url):
+    """Bangun DataFrame history dari payload JSON satu endpoint."""
+    df = pd.DataFrame(payload['records'])
+
+    df['datetime'] = pd.to_datetime(df['currentTime'], format='%d/%m/%Y, %H.%M.%S', errors='coerce')
+
+    df.loc[df['datetime'].isna(), 'datetime'] = pd.to_datetime(df['timestamp'], unit='ms')
+
+    df['source'] = source_label(url)
+
+    return df
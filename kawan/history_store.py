@@ -0,0 +1,322 @@
+"""Penyimpanan lokal history pesan: Parquet append-only dipartisi per hari.
+
+Struktur direktori::
+
+    <root>/state.json               high-water mark per sumber (timestamp, id)
+    <root>/ids.bin                  hash uint64 (id, message) append-only
+    <root>/appends.jsonl            jurnal append: penulis, rentang ids.bin, hari yang disentuh
+    <root>/date=YYYY-MM-DD/*.parquet
+    <root>/words/date=YYYY-MM-DD.parquet   jumlah token per (no, word) hari itu
+
+Setiap sinkronisasi hanya memproses baris yang lebih baru dari high-water
+mark sumbernya dan men-dedupe baris baru terhadap indeks hash, sehingga biaya
+refresh sebanding dengan data baru, bukan seluruh history. Counter kata per
+hari juga hanya diperbarui untuk hari yang menerima pesan baru.
+
+Beberapa proses boleh berbagi satu root. Setiap operasi yang membaca atau
+menulis root (append, compaction, counter kata, reload, muatan awal)
+dijalankan di bawah ``flock`` eksklusif pada ``<root>/lock``, dan file
+sementara diberi nama unik per penulis. Setiap proses memegang satu store;
+``reload()`` membaca jurnal sejak muatan terakhir dan hanya menerapkan baris
+yang ditulis proses lain (dicari di partisi hari yang disentuh), bukan
+membaca ulang seluruh history.
+"""
+
+import fcntl
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from kawan.latency import LatencySketches
+from kawan.words import WordCounts, count_tokens
+
+DEDUPE_KEYS = ['id', 'message']
+COMPACT_THRESHOLD = 16
+
+
+def _row_hashes(df):
+    keys = df[DEDUPE_KEYS].astype(str)
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy(dtype=np.uint64)
+
+
+def _timestamps_ms(df):
+    if 'timestamp' in df.columns:
+        ts = pd.to_numeric(df['timestamp'], errors='coerce')
+        if ts.notna().any():
+            return ts
+    return (df['datetime'] - pd.Timestamp(0)) // pd.Timedelta(milliseconds=1)
+
+
+def _tmp_path(path):
+    """Nama sementara unik untuk ``path`` (ditulis lalu ``os.replace``); tidak berakhiran ``.parquet``."""
+    return f"{path}.{os.getpid()}-{uuid.uuid4().hex[:8]}.tmp"
+
+
+def _normalize(df):
+    # Kolom object dari JSON bisa bertipe campuran (int/str); Parquet butuh satu tipe
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].map(lambda v: None if pd.isna(v) else str(v))
+    return df
+
+
+class HistoryStore:
+    def __init__(self, root):
+        self.root = root
+        self._lock = threading.Lock()
+        self._state_path = os.path.join(root, 'state.json')
+        self._ids_path = os.path.join(root, 'ids.bin')
+        self._journal_path = os.path.join(root, 'appends.jsonl')
+        self._lock_path = os.path.join(root, 'lock')
+        self._writer = uuid.uuid4().hex
+        os.makedirs(root, exist_ok=True)
+
+        self.state = {}
+        with self._locked():
+            self._load_state()
+            # Jurnal sebelum titik ini sudah tercermin di ids.bin dan partisi yang dibaca di bawah
+            self._journal_offset = os.path.getsize(self._journal_path) if os.path.exists(self._journal_path) else 0
+            ids = (np.fromfile(self._ids_path, dtype=np.uint64) if os.path.exists(self._ids_path)
+                   else np.empty(0, np.uint64))
+        self._ids = np.unique(ids)
+        self._frame = None
+        self._words = None
+        self._latency = None
+
+    @contextmanager
+    def _locked(self):
+        """Lock thread di proses ini plus ``flock`` antar proses yang berbagi root."""
+        with self._lock, open(self._lock_path, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _load_state(self):
+        if os.path.exists(self._state_path):
+            with open(self._state_path) as f:
+                self.state = json.load(f)
+
+    # ─── High-water mark ───
+    def high_water_mark(self, source):
+        return self.state.get(source)
+
+    def request_params(self, source, action):
+        """Parameter request; ``since`` hanya dipakai bila endpoint mendukungnya."""
+        params = {"action": action}
+        hwm = self.high_water_mark(source)
+        if hwm:
+            params["since"] = hwm["timestamp"]
+        return params
+
+    # ─── Sinkronisasi ───
+    def append(self, df, source):
+        """Tambahkan baris baru dari ``source``; kembalikan baris yang benar-benar baru."""
+        if df.empty:
+            return df
+        with self._locked():
+            # HWM dan indeks hash harus mencakup append proses lain sebelum dedupe
+            self._reload()
+            ts = _timestamps_ms(df)
+            hwm = self.high_water_mark(source)
+            if hwm:
+                # Endpoint yang mengabaikan ``since`` tetap mengirim semua data;
+                # potong di sini agar dedupe hanya menyentuh baris baru
+                keep = (ts >= hwm["timestamp"]).to_numpy()
+                df, ts = df[keep], ts[keep]
+            if df.empty:
+                return df
+
+            hashes = _row_hashes(df)
+            pos = np.searchsorted(self._ids, hashes)
+            pos = np.minimum(pos, max(len(self._ids) - 1, 0))
+            seen = self._ids[pos] == hashes if len(self._ids) else np.zeros(len(hashes), bool)
+            _, first = np.unique(hashes, return_index=True)
+            unique_in_batch = np.zeros(len(hashes), bool)
+            unique_in_batch[first] = True
+            new_mask = ~seen & unique_in_batch
+
+            self.state[source] = {"timestamp": int(ts.max()), "id": str(df.loc[ts.idxmax(), 'id'])}
+
+            new_rows = _normalize(df[new_mask])
+            if not new_rows.empty:
+                self._write_partitions(new_rows)
+                new_hashes = hashes[new_mask]
+                with open(self._ids_path, 'ab') as f:
+                    start = f.tell()
+                    new_hashes.tofile(f)
+                    end = f.tell()
+                self._journal(start, end, new_rows)
+                self._ids = np.union1d(self._ids, new_hashes)
+                if self._frame is not None:
+                    self._frame = pd.concat([self._frame, new_rows], ignore_index=True)
+                if self._latency is not None:
+                    self._latency.update(new_rows)
+
+            tmp = _tmp_path(self._state_path)
+            with open(tmp, 'w') as f:
+                json.dump(self.state, f)
+            os.replace(tmp, self._state_path)
+            return new_rows
+
+    # ─── Jurnal antar proses ───
+    def _journal(self, start, end, rows):
+        days = sorted(rows['datetime'].dt.strftime('%Y-%m-%d').fillna('unknown').unique())
+        entry = {"writer": self._writer, "ids": [start, end], "days": days}
+        with open(self._journal_path, 'a') as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def _read_journal(self):
+        if not os.path.exists(self._journal_path):
+            return []
+        with open(self._journal_path, 'rb') as f:
+            f.seek(self._journal_offset)
+            data = f.read()
+        # Baris terakhir yang belum lengkap (sedang ditulis) dibaca pada reload berikutnya
+        complete = data[:data.rfind(b'\n') + 1]
+        self._journal_offset += len(complete)
+        return [json.loads(line) for line in complete.decode('utf-8').splitlines() if line]
+
+    def reload(self):
+        """Terapkan append proses lain sejak muatan terakhir; kembalikan baris barunya."""
+        with self._locked():
+            return self._reload()
+
+    def _reload(self):
+        self._load_state()
+        entries = [e for e in self._read_journal() if e["writer"] != self._writer]
+        if not entries:
+            return pd.DataFrame()
+
+        with open(self._ids_path, 'rb') as f:
+            chunks = []
+            for entry in entries:
+                start, end = entry["ids"]
+                f.seek(start)
+                chunks.append(np.fromfile(f, dtype=np.uint64, count=(end - start) // 8))
+        new_hashes = np.setdiff1d(np.concatenate(chunks), self._ids)
+        self._ids = np.union1d(self._ids, new_hashes)
+        days = sorted({day for entry in entries for day in entry["days"]})
+
+        if self._words is not None:
+            for day in days:
+                if os.path.exists(self._words_path(day)):
+                    self._words.set_day(day, pd.read_parquet(self._words_path(day)))
+        if self._frame is None and self._latency is None:
+            return pd.DataFrame()
+
+        parts = []
+        for day in days:
+            for part in self._day_parts(day):
+                parts.append(part[np.isin(_row_hashes(part), new_hashes)])
+        new_rows = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+        if not new_rows.empty:
+            if self._frame is not None:
+                self._frame = pd.concat([self._frame, new_rows], ignore_index=True)
+            if self._latency is not None:
+                self._latency.update(new_rows)
+        return new_rows
+
+    def _write_partitions(self, df):
+        stamp = time.time_ns()
+        days = df['datetime'].dt.strftime('%Y-%m-%d').fillna('unknown')
+        for day, part in df.groupby(days):
+            day_dir = os.path.join(self.root, f"date={day}")
+            os.makedirs(day_dir, exist_ok=True)
+            part.to_parquet(os.path.join(day_dir, f"part-{stamp}.parquet"), index=False)
+            self._compact(day_dir)
+            self._update_words(day, part)
+
+    def _compact(self, day_dir):
+        files = sorted(f for f in os.listdir(day_dir) if f.endswith('.parquet'))
+        if len(files) <= COMPACT_THRESHOLD:
+            return
+        merged = pd.concat([pd.read_parquet(os.path.join(day_dir, f)) for f in files], ignore_index=True)
+        path = os.path.join(day_dir, f"part-{time.time_ns()}.parquet")
+        tmp = _tmp_path(path)
+        merged.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+        for f in files:
+            os.remove(os.path.join(day_dir, f))
+
+    # ─── Counter kata ───
+    def _words_path(self, day):
+        return os.path.join(self.root, 'words', f"date={day}.parquet")
+
+    def _update_words(self, day, part):
+        path = self._words_path(day)
+        if os.path.exists(path):
+            table = pd.concat([pd.read_parquet(path), count_tokens(part)], ignore_index=True)
+            table = table.groupby(['no', 'word'], sort=False)['count'].sum().reset_index()
+        else:
+            # Hari tanpa counter (store dari versi lama): hitung dari seluruh partisinya
+            table = count_tokens(self._read_day(day))[['no', 'word', 'count']]
+        self._write_day_words(day, table)
+        if self._words is not None:
+            self._words.set_day(day, table)
+
+    def _write_day_words(self, day, table):
+        path = self._words_path(day)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = _tmp_path(path)
+        table.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+
+    def words(self):
+        """Counter kata per hari seluruh history; dibaca dari disk sekali lalu diperbarui saat append."""
+        with self._locked():
+            if self._words is None:
+                self._reload()
+                tables = []
+                for day in self._days():
+                    if not os.path.exists(self._words_path(day)):
+                        self._write_day_words(day, count_tokens(self._read_day(day))[['no', 'word', 'count']])
+                    tables.append(pd.read_parquet(self._words_path(day)).assign(day=day))
+                self._words = WordCounts.from_table(pd.concat(tables, ignore_index=True) if tables
+                                                    else count_tokens(pd.DataFrame()))
+            return self._words
+
+    def latency(self):
+        """Sketch waktu respon per hari/user; dibangun sekali dari history lalu diperbarui saat append."""
+        with self._locked():
+            if self._latency is None:
+                if self._frame is None:
+                    self._reload()
+                    self._frame = self._read_all()
+                self._latency = LatencySketches.from_messages(self._frame)
+            return self._latency
+
+    # ─── Baca ───
+    def frame(self):
+        """Seluruh history tersimpan; dibaca dari disk sekali lalu diperbarui di memori."""
+        with self._locked():
+            if self._frame is None:
+                # Jurnal yang sudah ada ikut terbaca di sini, jangan diterapkan ulang saat reload
+                self._reload()
+                self._frame = self._read_all()
+            return self._frame
+
+    def _days(self):
+        return sorted(d[len('date='):] for d in os.listdir(self.root) if d.startswith('date='))
+
+    def _day_parts(self, day):
+        path = os.path.join(self.root, f"date={day}")
+        return [pd.read_parquet(os.path.join(path, f)) for f in sorted(os.listdir(path)) if f.endswith('.parquet')]
+
+    def _read_day(self, day):
+        parts = self._day_parts(day)
+        return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+
+    def _read_all(self):
+        parts = [part for day in self._days() for part in self._day_parts(day)]
+        if not parts:
+            return pd.DataFrame()
+        return pd.concat(parts, ignore_index=True)
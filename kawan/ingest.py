@@ -0,0 +1,104 @@
+"""Decode streaming array ``records`` menjadi frame bertipe per batch.
+
+``response.json()`` membangun seluruh list dict Python sebelum DataFrame
+dibuat, sehingga puncak memori beberapa kali ukuran payload. Di sini body
+dibaca per chunk, setiap record di-decode satu per satu dengan
+``JSONDecoder.raw_decode`` dan dikumpulkan paling banyak ``BATCH_ROWS``
+record. Setiap batch langsung dijadikan kolom bertipe (counter integer,
+kolom berkardinalitas rendah di-dictionary-encode sebagai category), lalu
+dict-nya dibuang. Kolom antar batch digabung di akhir; category disatukan
+dengan ``union_categoricals``.
+"""
+
+import codecs
+import json
+import re
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+BATCH_ROWS = 20_000
+CHUNK_BYTES = 1 << 20
+
+_RECORDS_START = r'"{key}"\s*:\s*\['
+_WHITESPACE = ' \t\n\r,'
+
+
+def iter_records(chunks, key='records'):
+    """Yield setiap objek di array ``key`` dari iterator chunk ``bytes`` JSON."""
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    start = re.compile(_RECORDS_START.format(key=re.escape(key)))
+
+    buf, pos = '', None
+    while pos is None:
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise ValueError(f"Array '{key}' tidak ditemukan di payload")
+        buf += text.decode(chunk)
+        match = start.search(buf)
+        if match:
+            buf, pos = buf[match.end():], 0
+
+    exhausted = False
+    while True:
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        if pos < len(buf) and buf[pos] == ']':
+            return
+        try:
+            if pos >= len(buf):
+                raise json.JSONDecodeError("data habis", buf, pos)
+            record, pos = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            # Record terpotong di batas chunk: ambil chunk berikutnya lalu ulangi
+            if exhausted:
+                raise ValueError(f"Payload terpotong di dalam array '{key}'")
+            chunk = next(chunks, None)
+            if chunk is None:
+                exhausted = True
+                buf = buf[pos:] + text.decode(b'', final=True)
+            else:
+                buf = buf[pos:] + text.decode(chunk)
+            pos = 0
+            continue
+        yield record
+
+
+def iter_batches(records, batch_rows=BATCH_ROWS):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_rows:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def concat_typed(frames):
+    """Gabungkan frame bertipe per batch; kolom category disatukan tanpa kembali ke object."""
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    columns = {}
+    for col in frames[0].columns:
+        parts = [f[col] for f in frames]
+        if all(isinstance(p.dtype, pd.CategoricalDtype) for p in parts):
+            columns[col] = pd.Series(union_categoricals(parts, sort_categories=True, ignore_order=True))
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(columns)
+
+
+def typed_frame(chunks, convert, key='records', batch_rows=BATCH_ROWS):
+    """Frame dari stream JSON; ``convert(DataFrame)`` memberi tipe setiap batch."""
+    frames = [convert(pd.DataFrame(batch)) for batch in iter_batches(iter_records(chunks, key), batch_rows)]
+    if all(list(f.columns) == list(frames[0].columns) for f in frames[1:]):
+        return concat_typed(frames)
+    # Kolom tidak seragam antar batch (record jarang): gabung sebagai object lalu beri tipe ulang
+    frames = [f.astype({c: object for c in f.columns if isinstance(f[c].dtype, pd.CategoricalDtype)})
+              for f in frames]
+    return convert(pd.concat(frames, ignore_index=True))
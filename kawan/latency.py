@@ -0,0 +1,224 @@
+"""Sketch kuantil waktu respon per user dan per hari.
+
+Pasangan receive→send per percakapan (``response_time.conversation_pairs``)
+dimasukkan ke sketch bucket logaritmik (gaya DDSketch): nilai ``v`` masuk
+bucket ``ceil(log_γ v)`` dengan γ = (1 + α) / (1 − α), sehingga setiap
+kuantil hasil sketch berada dalam galat relatif α dari nilai sebenarnya.
+Dua sketch digabung cukup dengan menjumlahkan hitungan bucket-nya, jadi
+sketch disimpan sebagai ``DailyCounts`` per (hari, user) dan p50/p90/p99
+untuk filter apa pun dihitung dari gabungan sketch hari-hari terkait, tanpa
+mengurutkan sampel mentah.
+
+Hanya kuantil yang aproksimasi. Di samping bucket, setiap (hari, user)
+menyimpan jumlah, minimum dan maksimum durasi yang sebenarnya (``EXACT_COLS``);
+ketiganya juga cukup digabung dengan sum/min/max, sehingga rata-rata, min
+dan max tetap sama persis dengan ``calculate_response_stats``.
+"""
+
+import numpy as np
+import pandas as pd
+
+from kawan.daily import DailyCounts, day_keys, encode
+from kawan.response_time import MAX_WORK_SECONDS, WORK_END, WORK_START, conversation_pairs, format_time
+
+RELATIVE_ACCURACY = 0.01
+MIN_SECONDS = 1e-3
+N_BUCKETS = 2048
+
+METRICS = ('work', 'raw')
+EXACT_COLS = ['sum_work', 'sum_raw', 'min_work', 'max_work']
+
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = np.log(_GAMMA)
+_MIN_BUCKET = int(np.ceil(np.log(MIN_SECONDS) / _LOG_GAMMA))
+_BUCKET_VALUES = 2 * _GAMMA ** (np.arange(N_BUCKETS) + _MIN_BUCKET) / (_GAMMA + 1)
+
+# Receive yang belum dibalas lebih lama dari ini pasti melewati batas jam kerja
+# MAX_WORK_SECONDS (jeda non-kerja terpanjang 20:00 → 08:00), jadi tidak perlu disimpan
+PENDING_HORIZON = (np.timedelta64(1, 'D') - (WORK_END - WORK_START)) + np.timedelta64(MAX_WORK_SECONDS, 's')
+
+EMPTY_STATS = {
+    'avg': "N/A", 'avg_raw': "N/A",
+    'median': "N/A", 'median_raw': "N/A",
+    'p90': "N/A", 'p90_raw': "N/A",
+    'p99': "N/A", 'p99_raw': "N/A",
+    'min': "N/A", 'max': "N/A",
+    'total_samples': 0,
+}
+
+
+def bucket_items(seconds, metric):
+    """Kode item ``metric * N_BUCKETS + bucket`` untuk setiap durasi ``seconds``."""
+    seconds = np.maximum(np.asarray(seconds, dtype=float), MIN_SECONDS)
+    buckets = np.ceil(np.log(seconds) / _LOG_GAMMA).astype(np.int64) - _MIN_BUCKET
+    return METRICS.index(metric) * N_BUCKETS + np.clip(buckets, 0, N_BUCKETS - 1)
+
+
+def sketch_table(pairs):
+    """Tabel ``day, no, bucket, count`` dari pasangan ``conversation_pairs`` (hari = hari receive)."""
+    days = day_keys(pairs['start']).to_numpy()
+    no = pairs['no'].to_numpy(dtype=object)
+    return pd.DataFrame({
+        'day': np.concatenate([days, days]),
+        'no': np.concatenate([no, no]),
+        'bucket': np.concatenate([bucket_items(pairs['work'], 'work'), bucket_items(pairs['raw'], 'raw')]),
+        'count': 1,
+    })
+
+
+def exact_table(pairs):
+    """Tabel ``day, no, sum_work, sum_raw, min_work, max_work`` per (hari receive, user)."""
+    return (pairs.assign(day=day_keys(pairs['start']))
+            .groupby(['day', 'no'], sort=False)
+            .agg(sum_work=('work', 'sum'), sum_raw=('raw', 'sum'), min_work=('work', 'min'), max_work=('work', 'max'))
+            .reset_index())
+
+
+class LatencySketches(DailyCounts):
+    """Sketch waktu respon jam kerja & 24 jam per (hari, user), diperbarui inkremental."""
+
+    ITEM_COL = 'bucket'
+
+    def __init__(self):
+        super().__init__()
+        # hari → (user terurut, array [sum_work, sum_raw, min_work, max_work] per user)
+        self._exact = {}
+        self._exact_totals = {}
+        self._pending = pd.DataFrame({'no': [], 'status': [], 'datetime': pd.Series([], dtype='datetime64[ns]')})
+
+    @classmethod
+    def from_messages(cls, df):
+        sketches = cls()
+        sketches.update(df)
+        return sketches
+
+    @classmethod
+    def from_table(cls, table, exact=None):
+        """Sketch dari ``to_table``; ``exact`` (``to_exact_table``) None untuk snapshot lama."""
+        sketches = cls()
+        if exact is not None:
+            sketches._add_exact(exact, replace=True)
+        sketches._add(table, replace=True)
+        return sketches
+
+    def to_exact_table(self):
+        days = [d for d in self._sorted_days if d in self._exact]
+        if not days:
+            return pd.DataFrame({'day': [], 'no': [], **{col: [] for col in EXACT_COLS}})
+        users = np.concatenate([self._exact[d][0] for d in days])
+        values = np.concatenate([self._exact[d][1] for d in days])
+        table = pd.DataFrame(values, columns=EXACT_COLS)
+        table.insert(0, 'no', np.asarray(self.users, dtype=object)[users])
+        table.insert(0, 'day', np.repeat(days, [len(self._exact[d][0]) for d in days]))
+        return table
+
+    def update(self, df):
+        """Tambahkan pesan baru; receive yang balasannya belum datang dibawa ke update berikutnya."""
+        if df.empty:
+            return
+        rows = df[['no', 'status', 'datetime']]
+        if not self._pending.empty:
+            rows = pd.concat([self._pending, rows], ignore_index=True)
+        pairs, unanswered = conversation_pairs(rows)
+        latest = rows['datetime'].max()
+        if pd.notna(latest):
+            unanswered = unanswered[unanswered['datetime'] > latest - PENDING_HORIZON]
+        self._pending = unanswered.reset_index(drop=True)
+        # Nilai eksak dipasang dulu agar hari baru tidak pernah terlihat tanpa entrinya
+        self._add_exact(exact_table(pairs), replace=False)
+        self._add(sketch_table(pairs), replace=False)
+
+    def _add_exact(self, table, replace):
+        if table.empty:
+            return
+        day_codes, day_names = pd.factorize(table['day'])
+        users = encode(self.users, self._user_code, table['no'])
+        values = table[EXACT_COLS].to_numpy(np.float64)
+        if not replace:
+            old = [(i, self._exact[day]) for i, day in enumerate(day_names) if day in self._exact]
+            if old:
+                day_codes = np.concatenate([day_codes] + [np.full(len(u), i) for i, (u, _) in old])
+                users = np.concatenate([users] + [u for _, (u, _) in old])
+                values = np.concatenate([values] + [v for _, (_, v) in old])
+
+        order = np.lexsort((users, day_codes))
+        day_codes, users, values = day_codes[order], users[order], values[order]
+        starts = np.flatnonzero(np.r_[True, (day_codes[1:] != day_codes[:-1]) | (users[1:] != users[:-1])])
+        values = np.column_stack([
+            np.add.reduceat(values[:, 0], starts), np.add.reduceat(values[:, 1], starts),
+            np.minimum.reduceat(values[:, 2], starts), np.maximum.reduceat(values[:, 3], starts),
+        ])
+        day_codes, users = day_codes[starts], users[starts].astype(np.int32)
+        bounds = np.searchsorted(day_codes, np.arange(len(day_names) + 1))
+        for i, day in enumerate(day_names):
+            lo, hi = bounds[i], bounds[i + 1]
+            self._exact[day] = (users[lo:hi], values[lo:hi])
+            self._exact_totals[day] = _combine(values[lo:hi])
+
+    def _exact_stats(self, user, start, end):
+        """``[sum_work, sum_raw, min_work, max_work]`` gabungan hari ``[start, end)``; None bila tidak ada."""
+        days = self._day_range(start, end)
+        if user is None:
+            parts = [self._exact_totals[d] for d in days if d in self._exact_totals]
+        else:
+            code = self._user_code.get(str(user))
+            parts = []
+            for d in days if code is not None else []:
+                entry = self._exact.get(d)
+                if entry is not None:
+                    lo, hi = np.searchsorted(entry[0], [code, code + 1])
+                    parts.append(entry[1][lo:hi])
+        if not parts:
+            return None
+        return _combine(np.vstack(parts))
+
+    def _histograms(self, user, start, end):
+        merged = self.merged(user, start, end)
+        merged = np.pad(merged, (0, len(METRICS) * N_BUCKETS - len(merged)))
+        return {metric: merged[i * N_BUCKETS:(i + 1) * N_BUCKETS] for i, metric in enumerate(METRICS)}
+
+    def quantiles(self, user=None, start=None, end=None, qs=(0.5, 0.9, 0.99), metric='work'):
+        """Kuantil (detik) ``metric`` untuk ``user`` di hari ``[start, end)``; None bila tanpa sampel."""
+        counts = self._histograms(user, start, end)[metric]
+        return _quantiles(counts, qs)
+
+    def stats(self, user=None, start=None, end=None):
+        """Ringkasan format ``calculate_response_stats`` plus p90/p99, dari gabungan sketch."""
+        hist = self._histograms(user, start, end)
+        n = int(hist['work'].sum())
+        if n == 0:
+            return dict(EMPTY_STATS)
+
+        exact = self._exact_stats(user, start, end)
+        stats = {'total_samples': n}
+        for i, (metric, suffix) in enumerate(zip(METRICS, ('', '_raw'))):
+            counts = hist[metric]
+            p50, p90, p99 = _quantiles(counts, (0.5, 0.9, 0.99))
+            total = exact[i] if exact is not None else (counts * _BUCKET_VALUES).sum()
+            stats[f'avg{suffix}'] = format_time(total / n)
+            stats[f'median{suffix}'] = format_time(p50)
+            stats[f'p90{suffix}'] = format_time(p90)
+            stats[f'p99{suffix}'] = format_time(p99)
+        if exact is not None:
+            low, high = exact[2], exact[3]
+        else:
+            # Snapshot lama tanpa nilai eksak: nilai wakil bucket terisi pertama/terakhir
+            filled = np.flatnonzero(hist['work'])
+            low, high = _BUCKET_VALUES[filled[0]], _BUCKET_VALUES[filled[-1]]
+        stats['min'] = f"{int(low)} detik"
+        stats['max'] = f"{int(high)} detik"
+        return stats
+
+
+def _combine(values):
+    return np.array([values[:, 0].sum(), values[:, 1].sum(), values[:, 2].min(), values[:, 3].max()])
+
+
+def _quantiles(counts, qs):
+    n = int(counts.sum())
+    if n == 0:
+        return None
+    cumulative = np.cumsum(counts)
+    # Rank ``int(q * n)`` sama dengan median atas versi lama (indeks n // 2)
+    ranks = np.minimum((np.asarray(qs) * n).astype(np.int64), n - 1)
+    return [float(v) for v in _BUCKET_VALUES[np.searchsorted(cumulative, ranks, side='right')]]
@@ -0,0 +1,38 @@
+"""Sort dan slicing jendela halaman di sisi server untuk tabel besar.
+
+Urutan sort dihitung sebagai array posisi baris (bisa di-cache per kolom),
+lalu setiap halaman cukup mengambil ``page_size`` posisi dari array itu.
+Hanya baris halaman aktif yang diambil dari DataFrame dan dikirim ke browser.
+"""
+
+import math
+
+import numpy as np
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+def sort_positions(df, column, ascending=True):
+    """Posisi baris ``df`` terurut menurut ``column`` (stabil, NaN di akhir)."""
+    values = df[column].reset_index(drop=True)
+    return values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+
+
+def visible_positions(n_rows, order=None, keep=None):
+    """Posisi baris yang tampil: urutan ``order`` (atau asli), disaring ``keep``."""
+    positions = np.arange(n_rows) if order is None else order
+    if keep is not None:
+        positions = positions[keep[positions]]
+    return positions
+
+
+def page_count(total, page_size):
+    return max(1, math.ceil(total / page_size))
+
+
+def page_window(positions, page, page_size):
+    """Potongan posisi untuk halaman ``page`` (mulai 1) beserta indeks awal-akhirnya."""
+    page = min(max(1, page), page_count(len(positions), page_size))
+    start = (page - 1) * page_size
+    stop = min(start + page_size, len(positions))
+    return positions[start:stop], start, stop
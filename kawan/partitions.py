@@ -0,0 +1,165 @@
+"""Mode chunked (out-of-core) untuk data SLS skala nasional.
+
+Batch bertipe dari decode streaming ``readDBSLS`` langsung ditumpahkan ke
+disk per partisi (provinsi atau kabupaten) sebagai file Arrow, tanpa pernah
+menggabungkan seluruh record di memori::
+
+    <root>/<kolom>=<nilai>/batch-000001.arrow
+
+Agregasi (sel rollup cube) dihitung per partisi di process pool lalu hasil
+parsialnya digabung; frame lengkap untuk snapshot ditulis partisi demi
+partisi. Puncak memori setiap langkah dibatasi ukuran satu partisi.
+
+Dictionary category dan lebar integer bisa berbeda antar batch, jadi
+``PartitionSpill`` mencatat gabungan keduanya dan ``harmonize`` menyeragamkan
+setiap partisi sebelum digabung atau ditulis.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+from kawan import perf
+from kawan.config import SLS_ACTION, SLS_API_URL, TIMEOUTS
+from kawan.fetch import fetch_stream
+from kawan.ingest import BATCH_ROWS, concat_typed, iter_batches, iter_records
+from kawan.rollup import CUBE_DIMS, build_cells
+from kawan.sls import preprocess_sls
+
+PARTITION_COLS = ['nmprov', 'nmkab']
+
+
+class PartitionSpill:
+    def __init__(self, root, by):
+        if by not in PARTITION_COLS:
+            raise ValueError(f"Kolom partisi harus salah satu dari {PARTITION_COLS}, bukan {by!r}")
+        self.root = root
+        self.by = by
+        self.rows = 0
+        self.columns = []
+        self.categories = {}
+        self.dtypes = {}
+        self._incomplete = set()
+        self._batches = 0
+        os.makedirs(root, exist_ok=True)
+
+    def write(self, frame):
+        """Tumpahkan satu batch bertipe ke file partisinya masing-masing."""
+        from pyarrow import feather
+
+        self._observe(frame)
+        self._batches += 1
+        for value, part in frame.groupby(self.by, observed=True, sort=False, dropna=False):
+            path = os.path.join(self.root, f"{self.by}={quote(str(value), safe='')}")
+            os.makedirs(path, exist_ok=True)
+            feather.write_feather(part.reset_index(drop=True),
+                                  os.path.join(path, f"batch-{self._batches:06d}.arrow"),
+                                  compression='uncompressed')
+        self.rows += len(frame)
+
+    def _observe(self, frame):
+        # Kolom yang tidak ada di sebagian batch akan diisi '-' oleh ``harmonize``
+        self._incomplete.update(c for c in self.columns if c not in frame.columns)
+        for col in frame.columns:
+            if col not in self.dtypes:
+                if self._batches:
+                    self._incomplete.add(col)
+                self.columns.append(col)
+            dtype = frame[col].dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                self.categories.setdefault(col, set()).update(dtype.categories)
+                self.dtypes[col] = 'category'
+            elif col in self.dtypes and _is_number(dtype) and _is_number(self.dtypes[col]):
+                # Counter di-downcast per batch; ambil tipe yang memuat semuanya
+                self.dtypes[col] = np.result_type(self.dtypes[col], dtype)
+            else:
+                self.dtypes.setdefault(col, dtype)
+
+    def partitions(self):
+        return sorted(os.path.join(self.root, d) for d in os.listdir(self.root) if d.startswith(f"{self.by}="))
+
+    def schema(self):
+        """``(kolom, kategori, dtype)`` gabungan semua batch; dikirim ke proses pool."""
+        categories = {c: sorted(v | {'-'} if c in self._incomplete else v) for c, v in self.categories.items()}
+        return self.columns, categories, self.dtypes
+
+
+def _is_number(dtype):
+    return isinstance(dtype, np.dtype) and dtype.kind in 'iuf'
+
+
+def harmonize(df, schema):
+    """Seragamkan kolom, dictionary category dan lebar integer sebuah partisi."""
+    columns, categories, dtypes = schema
+    if list(df.columns) != columns:
+        df = preprocess_sls(df.reindex(columns=columns))
+    for col in columns:
+        if col in categories:
+            df[col] = df[col].cat.set_categories(categories[col])
+        elif df[col].dtype != dtypes[col]:
+            df[col] = df[col].astype(dtypes[col])
+    return df
+
+
+def read_partition(path, schema):
+    from pyarrow import feather
+
+    # Diseragamkan per batch dulu: batch bisa berbeda kolom, dan concat butuh kolom yang sama
+    return concat_typed([harmonize(feather.read_feather(os.path.join(path, f)), schema)
+                         for f in sorted(os.listdir(path)) if f.endswith('.arrow')])
+
+
+def spill_stream(chunks, root, by, batch_rows=BATCH_ROWS):
+    """Consumer ``fetch_stream``: decode streaming lalu tumpahkan per partisi; kembalikan ``PartitionSpill``."""
+    spill = PartitionSpill(root, by)
+    for batch in iter_batches(iter_records(chunks), batch_rows):
+        spill.write(preprocess_sls(pd.DataFrame(batch)))
+    return spill
+
+
+def fetch_sls_partitioned(root, by, tracker=None):
+    """``PartitionSpill`` record SLS di ``root``; ``NOT_MODIFIED`` bila ``tracker`` menyatakan belum berubah."""
+    return fetch_stream(SLS_API_URL, lambda chunks: spill_stream(chunks, root, by),
+                        params={"action": SLS_ACTION}, timeout=TIMEOUTS[SLS_ACTION], tracker=tracker)
+
+
+# ─── Agregasi per partisi ───
+def partition_cells(path, schema):
+    """Sel rollup satu partisi (dijalankan di proses pool)."""
+    cells = build_cells(read_partition(path, schema))
+    # Dictionary gabungan hanya perlu untuk frame; sel parsial cukup membawa kategori yang terpakai
+    for col in cells.select_dtypes('category'):
+        cells[col] = cells[col].cat.remove_unused_categories()
+    return cells
+
+
+def merge_cells(parts):
+    """Gabungkan sel parsial; sel yang sama dari partisi berbeda dijumlahkan."""
+    cells = concat_typed([p for p in parts if not p.empty])
+    if cells.empty:
+        return cells
+    dims = [c for c in CUBE_DIMS if c in cells.columns]
+    return cells.groupby(dims, observed=True).sum().reset_index()
+
+
+def aggregate_cells(spill, processes=None):
+    """Sel rollup seluruh data, dihitung per partisi di ``processes`` proses (default: jumlah CPU)."""
+    paths, schema = spill.partitions(), spill.schema()
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(paths) <= 1:
+        parts = [partition_cells(p, schema) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=min(processes, len(paths))) as pool:
+            parts = list(pool.map(partition_cells, paths, [schema] * len(paths)))
+    with perf.stage("sls.merge_cells"):
+        return merge_cells(parts)
+
+
+def iter_partition_frames(spill):
+    """Frame bertipe seragam per partisi, untuk ditulis berurutan ke satu file snapshot."""
+    schema = spill.schema()
+    for path in spill.partitions():
+        yield read_partition(path, schema)
@@ -0,0 +1,252 @@
+"""Instrumentasi ringan: timer per tahap, hit/miss cache dan ukuran payload.
+
+Aktif bila ``KAWAN_PERF=1``. Saat nonaktif ``stage()`` mengembalikan satu
+context manager kosong bersama, ``count()``/``size()`` langsung kembali dan
+``cached()`` tidak membungkus fungsi apa pun, sehingga jalur panas nyaris
+tanpa biaya.
+
+Catatan dikumpulkan per rerun halaman (atau per refresh latar belakang) di
+objek ``Run`` milik thread yang memanggil ``begin()``. Saat ``end()``, isi run
+ditulis sebagai satu baris log JSON (logger ``kawan.perf``) dan total proses
+ditulis ke file teks bergaya Prometheus bila ``KAWAN_PERF_METRICS`` diisi.
+Proses Streamlit tidak mengatur logging, jadi saat aktif logger ``kawan.perf``
+diberi handler stderr sendiri di level INFO.
+"""
+
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+from kawan.config import PERF_ENABLED, PERF_METRICS_FILE
+
+ENABLED = PERF_ENABLED
+
+logger = logging.getLogger(__name__)
+
+
+def _configure_logger():
+    if logger.handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    # Baris JSON tidak ikut diformat ulang (atau tertulis dua kali) oleh handler root
+    logger.propagate = False
+
+
+if ENABLED:
+    _configure_logger()
+
+_NULL = contextlib.nullcontext()
+_local = threading.local()
+
+
+class Run:
+    """Catatan satu rerun: tahap berurutan, counter dan ukuran payload (byte)."""
+
+    def __init__(self, name):
+        self.name = name
+        self.started_at = time.time()
+        self.stages = []
+        self.counters = {}
+        self.sizes = {}
+        self.total = None
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add_stage(self, name, seconds):
+        with self._lock:
+            self.stages.append((name, seconds))
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def size(self, name, nbytes):
+        with self._lock:
+            self.sizes[name] = self.sizes.get(name, 0) + nbytes
+
+    def finish(self):
+        self.total = time.perf_counter() - self._start
+
+    def as_dict(self):
+        return {
+            "run": self.name,
+            "started_at": self.started_at,
+            "total_seconds": self.total,
+            "stages": [{"stage": name, "seconds": round(seconds, 6)} for name, seconds in self.stages],
+            "counters": dict(self.counters),
+            "bytes": dict(self.sizes),
+        }
+
+
+class Registry:
+    """Akumulasi seluruh proses untuk ekspor bergaya Prometheus."""
+
+    def __init__(self):
+        self.stages = {}    # nama → [jumlah, total detik, detik terakhir]
+        self.counters = {}
+        self.sizes = {}     # nama → byte terakhir
+        self.last_runs = {}  # nama run → Run terakhir yang selesai
+        self._lock = threading.Lock()
+
+    def add_stage(self, name, seconds):
+        with self._lock:
+            entry = self.stages.setdefault(name, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = seconds
+
+    def count(self, name, n):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def size(self, name, nbytes):
+        with self._lock:
+            self.sizes[name] = nbytes
+
+    def prometheus_text(self):
+        with self._lock:
+            lines = ["# TYPE kawan_stage_seconds summary"]
+            for name, (n, total, _) in sorted(self.stages.items()):
+                lines.append(f'kawan_stage_seconds_sum{{stage="{name}"}} {total:.6f}')
+                lines.append(f'kawan_stage_seconds_count{{stage="{name}"}} {n}')
+            lines.append("# TYPE kawan_stage_last_seconds gauge")
+            for name, (_, _, last) in sorted(self.stages.items()):
+                lines.append(f'kawan_stage_last_seconds{{stage="{name}"}} {last:.6f}')
+            lines.append("# TYPE kawan_events_total counter")
+            for name, n in sorted(self.counters.items()):
+                lines.append(f'kawan_events_total{{name="{name}"}} {n}')
+            lines.append("# TYPE kawan_payload_bytes gauge")
+            for name, nbytes in sorted(self.sizes.items()):
+                lines.append(f'kawan_payload_bytes{{name="{name}"}} {nbytes}')
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def current():
+    return getattr(_local, 'run', None)
+
+
+def begin(name):
+    """Mulai run baru di thread ini; None bila instrumentasi nonaktif."""
+    if not ENABLED:
+        return None
+    run = Run(name)
+    _local.run = run
+    return run
+
+
+def end():
+    """Tutup run thread ini, tulis log JSON dan file metrik; kembalikan run-nya."""
+    run = current()
+    if run is None:
+        return None
+    _local.run = None
+    run.finish()
+    REGISTRY.last_runs[run.name] = run
+    logger.info(json.dumps(run.as_dict()))
+    if PERF_METRICS_FILE:
+        write_metrics(PERF_METRICS_FILE)
+    return run
+
+
+def write_metrics(path):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w') as f:
+        f.write(REGISTRY.prometheus_text())
+    os.replace(tmp, path)
+
+
+def record_stage(name, seconds):
+    REGISTRY.add_stage(name, seconds)
+    run = current()
+    if run is not None:
+        run.add_stage(name, seconds)
+
+
+@contextlib.contextmanager
+def _timed(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(name, time.perf_counter() - start)
+
+
+def stage(name):
+    """Context manager pengukur waktu tahap ``name``."""
+    return _timed(name) if ENABLED else _NULL
+
+
+def count(name, n=1):
+    if not ENABLED:
+        return
+    REGISTRY.count(name, n)
+    run = current()
+    if run is not None:
+        run.count(name, n)
+
+
+def size(name, nbytes):
+    if not ENABLED:
+        return
+    REGISTRY.size(name, nbytes)
+    run = current()
+    if run is not None:
+        run.size(name, nbytes)
+
+
+def bind(fn):
+    """Bungkus ``fn`` agar catatannya masuk ke run thread pemanggil (untuk thread pool)."""
+    run = current()
+    if run is None:
+        return fn
+
+    @functools.wraps(fn)
+    def bound(*args, **kwargs):
+        previous = current()
+        _local.run = run
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _local.run = previous
+    return bound
+
+
+def cached(cache):
+    """Bungkus dekorator ``st.cache_data``/``st.cache_resource`` agar hit/miss tercatat.
+
+    Body fungsi hanya dieksekusi saat miss, jadi body ditandai sebelum
+    diteruskan ke dekorator cache dan pemanggil luar menghitung
+    ``cache.<fungsi>.hit`` atau ``cache.<fungsi>.miss``.
+    """
+    def decorate(fn):
+        if not ENABLED:
+            return cache(fn)
+        state = threading.local()
+
+        @functools.wraps(fn)
+        def body(*args, **kwargs):
+            state.miss = True
+            return fn(*args, **kwargs)
+
+        cached_fn = cache(body)
+
+        @functools.wraps(fn)
+        def call(*args, **kwargs):
+            state.miss = False
+            result = cached_fn(*args, **kwargs)
+            count(f"cache.{fn.__name__}.{'miss' if state.miss else 'hit'}")
+            return result
+
+        call.clear = cached_fn.clear
+        return call
+    return decorate
@@ -0,0 +1,129 @@
+"""Komputasi halaman dashboard tanpa Streamlit.
+
+Dipakai bersama oleh ``app.py`` (saat data dihitung di proses dashboard) dan
+``kawan/worker.py`` (saat dihitung sekali oleh worker lalu diterbitkan ke
+disk), sehingga keduanya menghasilkan angka yang sama.
+"""
+
+from kawan import perf
+from kawan.config import CHATBOT_API_URLS, HISTORY_ACTION, TIMEOUTS
+from kawan.fetch import fetch_many
+from kawan.history import history_frame
+from kawan.latency import LatencySketches
+from kawan.words import top_words
+
+
+# ─── Chatbot ───
+def sync_history(store, urls=CHATBOT_API_URLS):
+    """Ambil pesan baru dari semua endpoint ke ``store``; kembalikan list ``(url, error)`` yang gagal."""
+    params = [store.request_params(url, HISTORY_ACTION) for url in urls]
+    results = fetch_many(urls, params=params, timeout=TIMEOUTS[HISTORY_ACTION])
+
+    errors = []
+    for result in results:
+        try:
+            if result.error:
+                raise result.error
+            with perf.stage("chat.history_frame"):
+                frame = history_frame(result.data, result.url)
+            with perf.stage("chat.store_append"):
+                store.append(frame, source=result.url)
+        except Exception as e:
+            errors.append((result.url, e))
+    return errors
+
+
+def sync_store(store):
+    """Muat append proses lain lalu ambil pesan baru ke ``store``; kembalikan ``[(url, pesan_error)]``."""
+    with perf.stage("chat.store_reload"):
+        store.reload()
+    return [(url, str(e)) for url, e in sync_history(store)]
+
+
+def history_state(store):
+    """``(frame, counter_kata, sketch_latensi)`` ``store`` setelah append proses lain diterapkan."""
+    with perf.stage("chat.store_reload"):
+        store.reload()
+    with perf.stage("chat.store_frame"):
+        frame = store.frame()
+    with perf.stage("chat.store_words"):
+        words = store.words()
+    with perf.stage("chat.store_latency"):
+        return frame, words, store.latency()
+
+
+def load_history(store):
+    """Sinkronkan ``store`` lalu kembalikan ``(frame, counter_kata, sketch_latensi, [(url, pesan_error)])``."""
+    errors = sync_store(store)
+    return (*history_state(store), errors)
+
+
+def chat_summary(df, words=None, response=None):
+    """Statistik pesan, waktu respon, distribusi status, pesan & kata teratas.
+
+    ``words`` dan ``response`` adalah top kata dan ringkasan waktu respon yang
+    sudah dihitung dari counter/sketch per hari (``WordCounts.top``,
+    ``LatencySketches.stats``); bila None dihitung langsung dari ``df``.
+    """
+    status = df['status']
+    if response is None:
+        with perf.stage("chat.response_time"):
+            response = LatencySketches.from_messages(df).stats()
+
+    status_counts = status.value_counts().reset_index()
+    status_counts.columns = ['Status', 'Jumlah']
+    top_messages = df['message'].value_counts().head(15).reset_index()
+    top_messages.columns = ["Pesan", "Frekuensi"]
+
+    if words is None:
+        with perf.stage("chat.word_freq"):
+            words = top_words(df['message'])
+
+    return {
+        'total': len(df),
+        'receive': int((status == "receive").sum()),
+        'send': int((status == "send").sum()),
+        'users': int(df['no'].nunique()),
+        'response': response,
+        'status_counts': status_counts,
+        'top_messages': top_messages,
+        'top_words': words,
+    }
+
+
+# ─── SLS ───
+def sls_totals(cube):
+    """Metrik ringkasan progres dari rollup cube."""
+    return {
+        'total_sls': cube.total('total_sls'),
+        'selesai': cube.total('jumlahSelesaiLapangan'),
+        'submit': cube.total('jumlahSubmit'),
+        'approved': cube.total('JumlahApproved'),
+        'reject': cube.total('JumlahReject'),
+        'ppl': cube.nunique('Nama_PPL'),
+        'pml': cube.nunique('Nama_PML'),
+    }
+
+
+def sls_status_counts(cube):
+    counts = cube.rollup('statusSls', Jumlah='total_sls').sort_values('Jumlah', ascending=False)
+    counts.columns = ['Status', 'Jumlah']
+    counts['Status'] = counts['Status'].astype(str)
+    return counts
+
+
+def sls_progress_by(cube, col, top=15):
+    """Top ``top`` ``col`` (kecamatan/PPL) menurut jumlah SLS, dengan counter progresnya."""
+    return cube.rollup(
+        col,
+        total_sls='total_sls',
+        selesai='jumlahSelesaiLapangan',
+        submit='jumlahSubmit',
+        approved='JumlahApproved'
+    ).sort_values('total_sls', ascending=False).head(top)
+
+
+def sls_desa_counts(cube, top=20):
+    counts = cube.rollup(['nmkec', 'nmdesa'], jumlah='total_sls')
+    counts = counts.sort_values('jumlah', ascending=False).head(top)
+    return counts.astype({'nmkec': str, 'nmdesa': str})
@@ -0,0 +1,71 @@
+"""Tabel progres per PPL (dikelompokkan per ``emailPPL``) secara vektor.
+
+Ringkasan ``statusSls`` per PPL (mis. ``"belum (3), selesai (2)"``) dibangun
+dari crosstab emailPPL × statusSls via ``np.bincount`` lalu diformat
+sekaligus per peringkat, menggantikan lambda ``value_counts`` per grup.
+"""
+
+import numpy as np
+import pandas as pd
+
+FIRST_COLS = ['Nama_PPL', 'Nama_PML', 'PJKuda', 'emailPML']
+SUM_COLS = ['jumlahSelesaiLapangan', 'jumlahSubmit', 'JumlahApproved', 'JumlahReject']
+COLS_ORDER = ['emailPPL', 'Nama_PPL', 'Nama_PML', 'PJKuda', 'emailPML',
+              'jumlahSelesaiLapangan', 'jumlahSubmit', 'JumlahApproved', 'JumlahReject', 'statusSls']
+
+
+def _codes(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), [str(c) for c in series.cat.categories]
+    codes, uniques = pd.factorize(series, sort=True)
+    return codes, [str(u) for u in uniques]
+
+
+def status_summary(keys, status):
+    """String ``"status (n), ..."`` per kunci unik (terurut), urut jumlah menurun.
+
+    Jumlah yang sama diurutkan menurut kemunculan pertamanya di grup, seperti
+    ``value_counts`` pada kolom teks versi lama (juga bila ``status`` bertipe
+    category); status berjumlah nol tidak ditampilkan.
+    """
+    key_codes, key_labels = pd.factorize(keys, sort=True)
+    status_codes, status_labels = _codes(status)
+    n_keys, n_status = len(key_labels), len(status_labels)
+    if n_keys == 0:
+        return pd.Series([], index=key_labels, dtype=object)
+
+    valid = (key_codes >= 0) & (status_codes >= 0)
+    flat = key_codes[valid].astype(np.int64) * n_status + status_codes[valid]
+    counts = np.bincount(flat, minlength=n_keys * n_status).reshape(n_keys, n_status)
+    first_seen = np.full(n_keys * n_status, len(flat), dtype=np.int64)
+    np.minimum.at(first_seen, flat, np.arange(len(flat)))
+
+    order = np.lexsort((first_seen.reshape(n_keys, n_status), -counts), axis=1)
+    ranked = np.take_along_axis(counts, order, axis=1)
+    labels = np.array(status_labels, dtype=object)
+
+    result = pd.Series([''] * n_keys, dtype=object)
+    for rank in range(n_status):
+        present = ranked[:, rank] > 0
+        if not present.any():
+            break
+        piece = (pd.Series(labels[order[:, rank]], dtype=object) + " ("
+                 + pd.Series(ranked[:, rank]).astype(str) + ")")
+        sep = "" if rank == 0 else ", "
+        result = result.where(~present, result + sep + piece)
+    result.index = key_labels
+    return result.astype(str)
+
+
+def ppl_progress_table(df):
+    """Satu baris per ``emailPPL``: atribut ``first``, counter ``sum``, ringkasan status."""
+    agg = {c: 'first' for c in FIRST_COLS if c in df.columns}
+    agg.update({c: 'sum' for c in SUM_COLS if c in df.columns})
+
+    grouped = df.groupby('emailPPL', sort=True)
+    table = grouped.agg(agg) if agg else pd.DataFrame(index=grouped.size().index)
+    if 'statusSls' in df.columns:
+        table['statusSls'] = status_summary(df['emailPPL'], df['statusSls']).reindex(table.index)
+
+    table = table.reset_index()
+    return table[[c for c in COLS_ORDER if c in table.columns]]
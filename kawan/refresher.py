@@ -0,0 +1,98 @@
+"""Refresher latar belakang bergaya stale-while-revalidate.
+
+Thread daemon memanggil ``loader`` setiap ``interval`` detik dan menukar
+snapshot terakhir secara atomik (satu assignment referensi). Pembaca selalu
+mendapat snapshot terakhir yang berhasil tanpa menunggu fetch; refresh yang
+gagal dicatat di ``last_error`` dan snapshot lama tetap dipakai. Loader boleh
+mengembalikan ``UNCHANGED`` bila sumbernya belum berubah; data dan versi
+snapshot tetap (hanya ``as_of`` yang maju), sehingga cache turunan per versi
+tidak dibangun ulang. Jumlah kejadian ini dihitung di ``unchanged``.
+
+``UNCHANGED`` hanya berarti sesuatu bila refresher sudah memegang snapshot.
+Bila belum (validator loader ternyata milik muatan lain), ``reset()`` loader
+dipanggil dan loader dipanggil ulang untuk muatan penuh.
+"""
+
+import threading
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from kawan import perf
+
+RETRY_INTERVAL = 30
+
+UNCHANGED = object()
+
+
+class Snapshot(NamedTuple):
+    data: Any
+    as_of: datetime
+    version: int
+
+
+class BackgroundRefresher:
+    def __init__(self, loader, interval, name="refresher"):
+        self.interval = interval
+        self.last_error = None
+        self.last_error_at = None
+        self.unchanged = 0
+        self._loader = loader
+        self._snapshot = None
+        self._version = 0
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._refresh_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self):
+        if not self._thread.is_alive():
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def refresh(self):
+        """Muat ulang sekali; kembalikan True bila snapshot baru terpasang."""
+        with self._refresh_lock:
+            perf.begin(self._thread.name)
+            try:
+                data = self._loader()
+                if data is UNCHANGED and self._snapshot is None:
+                    perf.count(f"{self._thread.name}.forced")
+                    self._loader.reset()
+                    data = self._loader()
+                    if data is UNCHANGED:
+                        raise RuntimeError("Loader tidak mengembalikan data setelah reset")
+            except Exception as e:
+                self.last_error = e
+                self.last_error_at = datetime.now()
+                self._ready.set()
+                return False
+            finally:
+                perf.end()
+            if data is UNCHANGED:
+                self._snapshot = self._snapshot._replace(as_of=datetime.now())
+                self.unchanged += 1
+                perf.count(f"{self._thread.name}.unchanged")
+                self.last_error = None
+                self.last_error_at = None
+                self._ready.set()
+                return False
+            self._version += 1
+            self._snapshot = Snapshot(data, datetime.now(), self._version)
+            self.last_error = None
+            self.last_error_at = None
+            self._ready.set()
+            return True
+
+    def snapshot(self, timeout=None):
+        """Snapshot terakhir yang berhasil; hanya menunggu saat belum ada muatan pertama."""
+        self._ready.wait(timeout)
+        return self._snapshot
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh()
+            wait = self.interval if self._snapshot is not None else min(self.interval, RETRY_INTERVAL)
+            self._stop.wait(wait)
@@ -0,0 +1,143 @@
+"""Perhitungan waktu respon chatbot secara kolumnar (NumPy datetime64)."""
+
+import numpy as np
+import pandas as pd
+
+WORK_START = np.timedelta64(8, 'h')
+WORK_END = np.timedelta64(20, 'h')
+MAX_WORK_SECONDS = 600
+
+_DAY = np.timedelta64(1, 'D')
+_WORK_DAY = WORK_END - WORK_START
+
+
+def _working_offset(t):
+    """Detik jam kerja kumulatif sejak epoch hingga setiap titik waktu ``t``."""
+    days = t.astype('datetime64[D]')
+    time_of_day = t - days
+    in_day = np.clip(time_of_day - WORK_START, np.timedelta64(0, 'ns'), _WORK_DAY)
+    return (days - np.datetime64(0, 'D')).astype(np.int64) * _WORK_DAY + in_day
+
+
+def working_seconds(start, end):
+    """Durasi (detik) irisan [start, end] dengan jam kerja 08:00-20:00.
+
+    Ekuivalen dengan loop per hari ``calculate_working_hours`` lama, tetapi
+    dihitung dalam bentuk tertutup untuk seluruh array sekaligus.
+    """
+    start = np.asarray(start, dtype='datetime64[ns]')
+    end = np.asarray(end, dtype='datetime64[ns]')
+    delta = _working_offset(end) - _working_offset(start)
+    seconds = delta / np.timedelta64(1, 's')
+    return np.maximum(seconds, 0.0)
+
+
+def find_response_pairs(df, bot_no):
+    """Pasangan receive→send berurutan (urut waktu) yang dibalas oleh ``bot_no``.
+
+    Mengembalikan tuple ``(work_seconds, raw_seconds)`` berisi waktu respon
+    jam kerja dan 24 jam untuk pasangan yang lolos batas 0 < jam kerja < 600 s.
+    """
+    df_sorted = df.sort_values('datetime', kind='stable')
+    times = df_sorted['datetime'].to_numpy(dtype='datetime64[ns]')
+    status = df_sorted['status'].to_numpy(dtype=object)
+    no = df_sorted['no'].to_numpy(dtype=object)
+
+    is_pair = (status[:-1] == 'receive') & (status[1:] == 'send') & (no[1:] == bot_no)
+    start = times[:-1][is_pair]
+    end = times[1:][is_pair]
+
+    valid = ~(np.isnat(start) | np.isnat(end))
+    start, end = start[valid], end[valid]
+
+    work = working_seconds(start, end)
+    raw = (end - start) / np.timedelta64(1, 's')
+
+    keep = (work > 0) & (work < MAX_WORK_SECONDS)
+    return work[keep], raw[keep]
+
+
+def conversation_pairs(df):
+    """Pasangkan setiap ``receive`` dengan ``send`` berikutnya di percakapan (``no``) yang sama.
+
+    ``no`` adalah nomor user lawan bicara bot di kedua arah: baris ``receive``
+    dikirim user itu, baris ``send`` adalah balasan bot kepadanya. Baris
+    ``send`` yang diberi nomor bot sendiri tidak pernah menjadi pasangan.
+
+    Mengembalikan ``(pairs, unanswered)``: ``pairs`` berisi kolom ``no``,
+    ``start``, ``work``, ``raw`` untuk pasangan yang lolos batas
+    0 < jam kerja < 600 s; ``unanswered`` adalah baris ``receive`` (kolom
+    ``no``, ``status``, ``datetime``) yang belum punya balasan.
+    """
+    df = df[df['datetime'].notna()]
+    codes, names = pd.factorize(df['no'].astype(str))
+    times = df['datetime'].to_numpy(dtype='datetime64[ns]')
+    status = df['status'].to_numpy(dtype=object)
+
+    order = np.lexsort((times, codes))
+    codes, times, status = codes[order], times[order], status[order]
+    sends = np.flatnonzero(status == 'send')
+    receives = np.flatnonzero(status == 'receive')
+
+    # Send pertama setelah setiap receive; sah bila masih di percakapan yang sama
+    nxt = np.searchsorted(sends, receives, side='right')
+    reply = sends[np.minimum(nxt, max(len(sends) - 1, 0))] if len(sends) else receives
+    answered = (nxt < len(sends)) & (codes[reply] == codes[receives])
+
+    start, end = times[receives[answered]], times[reply[answered]]
+    work = working_seconds(start, end)
+    raw = (end - start) / np.timedelta64(1, 's')
+    keep = (work > 0) & (work < MAX_WORK_SECONDS)
+    pairs = pd.DataFrame({
+        'no': names[codes[receives[answered]][keep]],
+        'start': start[keep],
+        'work': work[keep],
+        'raw': raw[keep],
+    })
+
+    pending = receives[~answered]
+    unanswered = pd.DataFrame({
+        'no': names[codes[pending]],
+        'status': 'receive',
+        'datetime': times[pending],
+    })
+    return pairs, unanswered
+
+
+def format_time(seconds):
+    minutes = int(seconds // 60)
+    secs = int(seconds % 60)
+    return f"{minutes} menit {secs} detik"
+
+
+def _upper_median(values):
+    return np.sort(values)[len(values) // 2]
+
+
+def calculate_response_stats(df, bot_no):
+    """Ringkasan avg/median/min/max waktu respon, format sama dengan versi lama."""
+    if len(df) < 2:
+        work, raw = np.array([]), np.array([])
+    else:
+        work, raw = find_response_pairs(df, bot_no)
+
+    if len(work) == 0:
+        return {
+            'avg': "N/A",
+            'avg_raw': "N/A",
+            'median': "N/A",
+            'median_raw': "N/A",
+            'min': "N/A",
+            'max': "N/A",
+            'total_samples': 0
+        }
+
+    return {
+        'avg': format_time(work.mean()),
+        'avg_raw': format_time(raw.mean()),
+        'median': format_time(_upper_median(work)),
+        'median_raw': format_time(_upper_median(raw)),
+        'min': f"{int(work.min())} detik",
+        'max': f"{int(work.max())} detik",
+        'total_samples': len(work)
+    }
@@ -0,0 +1,53 @@
+"""Rollup cube pra-agregasi untuk grafik dan metrik halaman SLS.
+
+Sel cube adalah kombinasi teramati wilayah (prov/kab/kec/desa) × petugas
+(PML/PPL) × ``statusSls``, berisi jumlah ``kodeSLS`` (``total_sls``) dan
+jumlah setiap counter progres. Grafik per kecamatan/PPL/desa dan ringkasan
+cukup mengiris dan mengagregasi ulang sel-sel ini, tanpa memindai tabel asli.
+"""
+
+import numpy as np
+import pandas as pd
+
+from kawan.sls import NUMERIC_COLS
+
+CUBE_DIMS = ['nmprov', 'nmkab', 'nmkec', 'nmdesa', 'Nama_PML', 'Nama_PPL', 'statusSls']
+COUNT_COL = 'total_sls'
+
+
+def build_cells(df):
+    dims = [c for c in CUBE_DIMS if c in df.columns]
+    aggs = {COUNT_COL: ('kodeSLS', 'count')}
+    aggs.update({c: (c, 'sum') for c in NUMERIC_COLS if c in df.columns})
+    return df.groupby(dims, observed=True).agg(**aggs).reset_index()
+
+
+class RollupCube:
+    def __init__(self, cells):
+        self.cells = cells
+
+    @classmethod
+    def from_frame(cls, df):
+        return cls(build_cells(df))
+
+    def slice(self, selection):
+        """Sel yang cocok dengan ``selection`` (kolom → nilai; None = semua)."""
+        mask = np.ones(len(self.cells), dtype=bool)
+        for col, value in selection.items():
+            if value is not None and col in self.cells.columns:
+                mask &= (self.cells[col] == value).to_numpy()
+        if mask.all():
+            return self
+        return RollupCube(self.cells[mask])
+
+    def total(self, measure):
+        return int(self.cells[measure].sum())
+
+    def nunique(self, col):
+        return self.cells[col].nunique()
+
+    def rollup(self, by, **measures):
+        """Agregasi ulang per ``by``; ``measures`` memetakan nama keluaran → kolom measure."""
+        columns = list(dict.fromkeys(measures.values()))
+        summed = self.cells.groupby(by, observed=True)[columns].sum()
+        return pd.DataFrame({name: summed[col] for name, col in measures.items()}).reset_index()
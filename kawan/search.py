@@ -0,0 +1,103 @@
+"""Indeks trigram terbalik untuk pencarian substring case-insensitive.
+
+Nilai unik setiap kolom di-lowercase lalu dipecah menjadi trigram. Posting
+list (trigram → id string unik) dibangun secara vektor dengan NumPy: setiap
+karakter dipetakan ke alfabet ringkas sehingga pasangan (trigram, id) muat
+dalam satu int64 dan cukup satu sort + dedupe untuk membangun posting list.
+
+Query ≥ 3 karakter diselesaikan lewat irisan posting list lalu diverifikasi
+dengan pencocokan substring pada kandidat saja; query lebih pendek memindai
+nilai unik (bukan seluruh baris).
+"""
+
+import numpy as np
+import pandas as pd
+
+SEARCH_COLS = ['nmsls', 'nama_ketua', 'kodeSLS']
+
+
+class TrigramIndex:
+    def __init__(self, values):
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object).fillna('').astype(str), sort=False)
+        self._strings = pd.Series(uniques, dtype=object).str.lower()
+        self._codes = codes
+        order = np.argsort(codes, kind='stable').astype(np.int32)
+        self._rows = (order, np.searchsorted(codes[order], np.arange(len(uniques) + 1)))
+        self._build(self._strings)
+
+    def _build(self, strings):
+        n = len(strings)
+        # Karakter 0 sebagai pemisah antar string; tidak pernah muncul di teks
+        text = "\x00".join(strings) + "\x00"
+        chars = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        alphabet = np.unique(chars)
+        symbols = np.searchsorted(alphabet, chars)
+        self._alphabet = {chr(c): i for i, c in enumerate(alphabet)}
+        self._base = len(alphabet)
+
+        sep = chars == 0
+        string_id = np.cumsum(sep) - sep
+        valid = ~(sep[:-2] | sep[1:-1] | sep[2:])
+        symbols = symbols.astype(np.int64)
+        keys = (symbols[:-2] * self._base + symbols[1:-1]) * self._base + symbols[2:]
+        pairs = np.sort(keys[valid] * max(n, 1) + string_id[:-2][valid])
+        pairs = pairs[np.r_[True, pairs[1:] != pairs[:-1]]] if len(pairs) else pairs
+
+        trigram = pairs // max(n, 1)
+        self._postings = (pairs % max(n, 1)).astype(np.int32)
+        first = np.r_[True, trigram[1:] != trigram[:-1]] if len(trigram) else np.empty(0, bool)
+        self._keys = trigram[first]
+        self._starts = np.append(np.flatnonzero(first), len(pairs))
+
+    def _trigram_keys(self, query):
+        symbols = [self._alphabet[c] for c in query]
+        return {(symbols[i] * self._base + symbols[i + 1]) * self._base + symbols[i + 2]
+                for i in range(len(symbols) - 2)}
+
+    def _matching_ids(self, query):
+        if any(c not in self._alphabet for c in query):
+            return np.empty(0, np.int32)
+        if len(query) < 3:
+            return np.flatnonzero(self._strings.str.contains(query, regex=False).to_numpy())
+
+        postings = []
+        for key in self._trigram_keys(query):
+            i = np.searchsorted(self._keys, key)
+            if i == len(self._keys) or self._keys[i] != key:
+                return np.empty(0, np.int32)
+            postings.append(self._postings[self._starts[i]:self._starts[i + 1]])
+        postings.sort(key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if len(candidates) == 0:
+                return candidates
+        # Trigram cocok belum tentu berurutan; verifikasi substring pada kandidat
+        hits = self._strings.iloc[candidates].str.contains(query, regex=False).to_numpy()
+        return candidates[hits]
+
+    def search(self, query):
+        """Posisi baris (terurut) yang nilainya memuat ``query`` (case-insensitive)."""
+        ids = self._matching_ids(query.lower())
+        if len(ids) == 0:
+            return np.empty(0, np.int32)
+        if len(ids) > 256:
+            # Banyak nilai cocok: satu lookup vektor per baris lebih murah
+            hit = np.zeros(len(self._strings), bool)
+            hit[ids] = True
+            return np.flatnonzero(hit[self._codes]).astype(np.int32)
+        order, bounds = self._rows
+        return np.sort(np.concatenate([order[bounds[i]:bounds[i + 1]] for i in ids]))
+
+
+class SearchIndex:
+    """Gabungan ``TrigramIndex`` beberapa kolom; hasil adalah union posisi baris."""
+
+    def __init__(self, df, cols=SEARCH_COLS):
+        self.indexes = {col: TrigramIndex(df[col].to_numpy()) for col in cols if col in df.columns}
+
+    def search(self, query):
+        hits = [index.search(query) for index in self.indexes.values()]
+        if not hits:
+            return np.empty(0, np.int32)
+        return np.unique(np.concatenate(hits))
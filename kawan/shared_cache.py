@@ -0,0 +1,246 @@
+"""Cache on-disk lintas proses dengan TTL, batas ukuran dan single-flight.
+
+Metadata (kunci, kedaluwarsa, ukuran, akses terakhir) dan lease kunci ada di
+SQLite (mode WAL); nilainya di-pickle ke file terpisah di ``<root>/values``.
+Beberapa worker Streamlit (atau proses setelah restart) berbagi satu cache:
+
+- hit: nilai dibaca dari file, tanpa fetch;
+- kedaluwarsa: satu proses mengambil lease lalu menghitung ulang, proses lain
+  langsung menyajikan nilai lama (stale) tanpa menunggu;
+- belum ada sama sekali: proses lain menunggu hasil pemegang lease, atau
+  mengambil alih bila lease-nya habis (mis. proses pemegangnya mati).
+
+Bila total ukuran melebihi ``max_bytes``, entri yang paling lama tidak
+diakses dihapus.
+
+Setiap entri boleh membawa ``tag`` (mis. hash isi respons). Lewat
+``get_or_revalidate`` entri kedaluwarsa yang sumbernya belum berubah cukup
+diperpanjang masa berlakunya, dan pemanggil yang sudah memegang nilai
+dengan tag yang sama mendapat ``KEEP`` tanpa membaca ulang file-nya.
+"""
+
+import contextlib
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+
+from kawan import perf
+from kawan.config import SHARED_CACHE_DIR, SHARED_CACHE_MAX_BYTES
+
+LEASE_SECONDS = 600
+WAIT_TIMEOUT = 120
+POLL_INTERVAL = 0.25
+
+KEEP = object()
+
+_default = None
+_default_lock = threading.Lock()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL,
+    tag TEXT
+);
+CREATE TABLE IF NOT EXISTS leases (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires REAL NOT NULL
+);
+"""
+
+
+class SharedCache:
+    def __init__(self, root, max_bytes=SHARED_CACHE_MAX_BYTES, lease=LEASE_SECONDS, wait_timeout=WAIT_TIMEOUT):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.lease = lease
+        self.wait_timeout = wait_timeout
+        self._values_dir = os.path.join(root, 'values')
+        self._db_path = os.path.join(root, 'cache.sqlite')
+        os.makedirs(self._values_dir, exist_ok=True)
+        with self._db() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+            columns = {row[1] for row in db.execute("PRAGMA table_info(entries)")}
+            if 'tag' not in columns:
+                db.execute("ALTER TABLE entries ADD COLUMN tag TEXT")
+
+    @contextlib.contextmanager
+    def _db(self):
+        # Satu koneksi per operasi: aman dipakai dari thread mana pun
+        db = sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    # ─── Entri ───
+    def _lookup(self, key):
+        with self._db() as db:
+            row = db.execute("SELECT path, expires, tag FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return row
+
+    def _read(self, path):
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def _store(self, key, value, ttl, tag=None):
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        path = os.path.join(self._values_dir, f"{digest}-{time.time_ns()}.pkl")
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + '.tmp', path)
+        size = os.path.getsize(path)
+
+        now = time.time()
+        with self._db() as db:
+            db.execute("BEGIN IMMEDIATE")
+            old = db.execute("SELECT path FROM entries WHERE key = ?", (key,)).fetchone()
+            db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       (key, path, size, now, now + ttl, now, tag))
+            db.execute("COMMIT")
+        if old is not None and old[0] != path:
+            _remove(old[0])
+        self._evict(keep=key)
+
+    def _evict(self, keep):
+        with self._db() as db:
+            db.execute("BEGIN IMMEDIATE")
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            removed = []
+            if total > self.max_bytes:
+                for key, path, size in db.execute(
+                        "SELECT key, path, size FROM entries WHERE key != ? ORDER BY accessed", (keep,)).fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    removed.append(path)
+                    total -= size
+            db.execute("COMMIT")
+        for path in removed:
+            _remove(path)
+
+    def _touch(self, key, ttl):
+        now = time.time()
+        with self._db() as db:
+            db.execute("UPDATE entries SET expires = ?, accessed = ? WHERE key = ?", (now + ttl, now, key))
+
+    def invalidate(self, key):
+        with self._db() as db:
+            row = db.execute("SELECT path FROM entries WHERE key = ?", (key,)).fetchone()
+            db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        if row is not None:
+            _remove(row[0])
+
+    # ─── Lease single-flight ───
+    def _acquire(self, key, owner):
+        now = time.time()
+        with self._db() as db:
+            db.execute("BEGIN IMMEDIATE")
+            row = db.execute("SELECT expires FROM leases WHERE key = ?", (key,)).fetchone()
+            if row is not None and row[0] > now:
+                db.execute("ROLLBACK")
+                return False
+            db.execute("INSERT OR REPLACE INTO leases VALUES (?, ?, ?)", (key, owner, now + self.lease))
+            db.execute("COMMIT")
+        return True
+
+    def _release(self, key, owner):
+        with self._db() as db:
+            db.execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, owner))
+
+    # ─── API ───
+    def get_or_compute(self, key, compute, ttl):
+        """Nilai ``key``; ``compute()`` hanya dipanggil oleh satu proses saat miss/kedaluwarsa."""
+        value, _ = self.get_or_revalidate(key, lambda previous_tag: (compute(), None), ttl)
+        return value
+
+    def get_or_revalidate(self, key, refresh, ttl, known_tag=None):
+        """``(nilai, tag)`` untuk ``key``, atau ``KEEP`` bila tag-nya sama dengan ``known_tag``.
+
+        Saat miss/kedaluwarsa satu proses memanggil ``refresh(tag_lama)`` yang
+        mengembalikan ``(nilai, tag)`` baru, atau ``KEEP`` bila sumbernya belum
+        berubah sehingga entri lama cukup diperpanjang ``ttl`` detik.
+        """
+        owner = f"{os.getpid()}:{threading.get_ident()}:{uuid.uuid4().hex[:8]}"
+        deadline = time.time() + self.wait_timeout
+        waited = False
+        while True:
+            entry = self._lookup(key)
+            if entry is not None and entry[1] > time.time():
+                result = self._result(entry, known_tag)
+                if result is None:
+                    continue  # baru saja diganti proses lain
+                perf.count(f"shared_cache.{key}.{'wait' if waited else 'hit'}")
+                return result
+
+            if self._acquire(key, owner):
+                try:
+                    fresh = refresh(entry[2] if entry is not None else None)
+                    if fresh is KEEP and entry is not None:
+                        perf.count(f"shared_cache.{key}.revalidated")
+                        self._touch(key, ttl)
+                        result = self._result(entry, known_tag)
+                        if result is not None:
+                            return result
+                        continue
+                    perf.count(f"shared_cache.{key}.miss")
+                    value, tag = fresh
+                    self._store(key, value, ttl, tag)
+                    return KEEP if tag is not None and tag == known_tag else (value, tag)
+                finally:
+                    self._release(key, owner)
+
+            if entry is not None:
+                result = self._result(entry, known_tag)
+                if result is None:
+                    continue
+                perf.count(f"shared_cache.{key}.stale")
+                return result
+
+            if time.time() > deadline:
+                # Pemegang lease terlalu lama; hitung sendiri daripada menggantung
+                perf.count(f"shared_cache.{key}.timeout")
+                return refresh(None)
+
+            waited = True
+            time.sleep(POLL_INTERVAL)
+
+    def _result(self, entry, known_tag):
+        path, _, tag = entry
+        if tag is not None and tag == known_tag:
+            return KEEP
+        try:
+            return self._read(path), tag
+        except FileNotFoundError:
+            return None
+
+
+def default_cache():
+    """Cache bersama di ``SHARED_CACHE_DIR``; None bila tidak dikonfigurasi."""
+    global _default
+    if SHARED_CACHE_DIR is None:
+        return None
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = SharedCache(SHARED_CACHE_DIR, max_bytes=SHARED_CACHE_MAX_BYTES)
+    return _default
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,98 @@
+"""Pengambilan dan preprocessing data SLS (action ``readDBSLS``).
+
+Payload di-decode secara streaming per batch (``kawan/ingest.py``) dan setiap
+batch langsung diberi tipe oleh ``preprocess_sls``, sehingga list dict
+seluruh record tidak pernah ada di memori sekaligus. Bila isi respons sama
+dengan yang terakhir dimuat, ``SlsLoader`` mengembalikan ``UNCHANGED``
+sehingga frame dan semua cache turunannya dipakai ulang.
+"""
+
+import pandas as pd
+
+from kawan.config import SLS_ACTION, SLS_API_URL, SLS_REFRESH_INTERVAL, TIMEOUTS
+from kawan.fetch import NOT_MODIFIED, ChangeTracker, fetch_stream
+from kawan.ingest import typed_frame
+from kawan.refresher import UNCHANGED
+from kawan.shared_cache import KEEP, default_cache
+
+NUMERIC_COLS = [
+    'jumlahSelesaiLapangan', 'jumlahSubmit', 'JumlahApproved', 'JumlahReject',
+    'jumlahSelesaiLapanganSementara', 'jumlahSubmitSementara',
+    'JumlahApprovedSementara', 'JumlahRejectSementara'
+]
+
+STR_COLS = ['noHpPml', 'noHPMitra', 'kodeSLS', 'nmsls', 'nama_ketua',
+            'nmprov', 'nmkab', 'nmkec', 'nmdesa', 'Nama_PML', 'Nama_PPL',
+            'emailPPL', 'emailPML', 'statusSls']
+
+# Kolom berkardinalitas rendah disimpan sebagai category agar filter,
+# groupby dan value_counts bekerja pada kode integer
+CATEGORY_COLS = ['nmprov', 'nmkab', 'nmkec', 'nmdesa', 'statusSls', 'Nama_PML', 'Nama_PPL']
+
+
+def fetch_sls_data(tracker=None):
+    """Ambil record SLS dari Apps Script sebagai DataFrame bertipe (lihat ``preprocess_sls``).
+
+    Dengan ``tracker``, hasilnya ``NOT_MODIFIED`` bila isinya belum berubah.
+    """
+    return fetch_stream(SLS_API_URL, lambda chunks: typed_frame(chunks, preprocess_sls),
+                        params={"action": SLS_ACTION}, timeout=TIMEOUTS[SLS_ACTION], tracker=tracker)
+
+
+def preprocess_sls(df):
+    """Normalisasi tipe kolom sekali per versi data.
+
+    Counter menjadi integer terkecil yang muat, kolom teks tanpa NaN, dan
+    kolom wilayah/petugas/status menjadi category. Kolom yang sudah category
+    dibiarkan, jadi aman dipanggil ulang.
+    """
+    for col in NUMERIC_COLS:
+        if col in df.columns:
+            values = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(int)
+            df[col] = pd.to_numeric(values, downcast='integer')
+
+    for col in STR_COLS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].fillna('-').astype(str)
+            if col in CATEGORY_COLS:
+                df[col] = df[col].astype('category')
+
+    return df
+
+
+def _refresh_shared(previous_tag):
+    tracker = ChangeTracker.from_tag(previous_tag)
+    frame = fetch_sls_data(tracker)
+    return KEEP if frame is NOT_MODIFIED else (frame, tracker.tag)
+
+
+class SlsLoader:
+    """Loader ``BackgroundRefresher``: frame SLS bertipe, ``UNCHANGED`` bila sama dengan muatan terakhirnya.
+
+    Validator respons dipegang per loader (bukan per proses), jadi loader baru,
+    mis. setelah "Clear cache" Streamlit, selalu memuat frame penuh. Lewat
+    cache on-disk bersama bila ``KAWAN_SHARED_CACHE`` diisi; tag entri cache
+    adalah validator respons, jadi loader yang sudah memegang versi yang sama
+    tidak membaca ulang frame-nya.
+    """
+
+    def __init__(self):
+        self.tracker = ChangeTracker()
+
+    def reset(self):
+        """Lupakan validator sehingga pemanggilan berikutnya memuat frame penuh."""
+        self.tracker = ChangeTracker()
+
+    def __call__(self):
+        shared = default_cache()
+        if shared is None:
+            frame = fetch_sls_data(self.tracker)
+            return UNCHANGED if frame is NOT_MODIFIED else frame
+
+        result = shared.get_or_revalidate(f"sls.{SLS_ACTION}", _refresh_shared, ttl=SLS_REFRESH_INTERVAL,
+                                          known_tag=self.tracker.tag)
+        if result is KEEP:
+            return UNCHANGED
+        frame, tag = result
+        self.tracker = ChangeTracker.from_tag(tag)
+        return frame
@@ -0,0 +1,202 @@
+"""Snapshot berversi hasil worker headless, dibaca dashboard lewat memory-map.
+
+Struktur direktori::
+
+    <root>/<nama>/LATEST                 meta JSON versi terbit terakhir
+    <root>/<nama>/v000042/meta.json      meta + nilai skalar
+    <root>/<nama>/v000042/<kunci>.arrow  frame bertipe (Arrow IPC tanpa kompresi)
+
+Worker menulis versi baru ke direktori sementara, me-rename-nya, lalu
+mengganti ``LATEST`` secara atomik, sehingga pembaca tidak pernah melihat
+versi setengah jadi. Frame disimpan sebagai Arrow IPC agar bisa di-memory-map
+dan tipe category/integer kecil dari preprocessing tetap terjaga.
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime
+
+import pandas as pd
+
+from kawan.refresher import UNCHANGED
+from kawan.latency import LatencySketches
+from kawan.words import WordCounts
+
+FORMAT_VERSION = 1
+KEEP_VERSIONS = 3
+
+
+class SnapshotMissing(Exception):
+    """Belum ada snapshot terbit (worker belum pernah berjalan)."""
+
+
+class SnapshotStore:
+    def __init__(self, root, keep=KEEP_VERSIONS):
+        self.root = root
+        self.keep = keep
+
+    def _dir(self, name, version=None):
+        base = os.path.join(self.root, name)
+        return base if version is None else os.path.join(base, f"v{version:06d}")
+
+    # ─── Tulis (worker) ───
+    def publish(self, name, frames, **meta):
+        """Terbitkan ``frames`` dan ``meta``; kembalikan nomor versinya.
+
+        Nilai ``frames`` berupa DataFrame, atau iterable DataFrame bertipe
+        seragam yang ditulis berurutan ke satu file tanpa digabung di memori.
+        """
+        latest = self.latest(name)
+        version = (latest['version'] if latest else 0) + 1
+        final_dir = self._dir(name, version)
+        tmp_dir = final_dir + '.tmp'
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+
+        for key, frame in frames.items():
+            _write_frame(os.path.join(tmp_dir, f"{key}.arrow"), frame)
+        meta = {"format": FORMAT_VERSION, "version": version,
+                "published_at": datetime.now().isoformat(timespec='seconds'),
+                "frames": sorted(frames), **meta}
+        with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+            json.dump(meta, f, default=str)
+        os.replace(tmp_dir, final_dir)
+
+        pointer = os.path.join(self._dir(name), 'LATEST')
+        with open(pointer + '.tmp', 'w') as f:
+            json.dump(meta, f, default=str)
+        os.replace(pointer + '.tmp', pointer)
+        self._prune(name, version)
+        return version
+
+    def _prune(self, name, current):
+        # Pembaca yang masih me-map versi lama tetap aman: file di-unlink, bukan ditimpa
+        for entry in os.listdir(self._dir(name)):
+            if entry.startswith('v') and not entry.endswith('.tmp') and int(entry[1:]) <= current - self.keep:
+                shutil.rmtree(os.path.join(self._dir(name), entry), ignore_errors=True)
+
+    # ─── Baca (dashboard) ───
+    def latest(self, name):
+        """Meta versi terbit terakhir, atau None."""
+        try:
+            with open(os.path.join(self._dir(name), 'LATEST')) as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        return meta if meta.get('format') == FORMAT_VERSION else None
+
+    def meta(self, name, version):
+        with open(os.path.join(self._dir(name, version), 'meta.json')) as f:
+            return json.load(f)
+
+    def read_frame(self, name, version, key):
+        """Frame ``key`` dari versi ``version`` lewat memory-map."""
+        from pyarrow import feather
+
+        df = feather.read_feather(os.path.join(self._dir(name, version), f"{key}.arrow"), memory_map=True)
+        df.attrs['snapshot_version'] = version
+        return df
+
+    def read_latest(self, name, key):
+        meta = self.latest(name)
+        if meta is None:
+            raise SnapshotMissing(f"Belum ada snapshot '{name}' di {self.root}; jalankan `python -m kawan.worker`.")
+        return self.read_frame(name, meta['version'], key)
+
+
+def _write_frame(path, frame):
+    import pyarrow as pa
+    from pyarrow import feather
+
+    if isinstance(frame, pd.DataFrame):
+        feather.write_feather(frame.reset_index(drop=True), path, compression='uncompressed')
+        return
+    # Feather v2 = Arrow IPC file: batch per bagian, skema (termasuk dictionary) harus sama
+    writer = schema = None
+    try:
+        for part in frame:
+            table = pa.Table.from_pandas(part, preserve_index=False, schema=schema)
+            if writer is None:
+                schema = table.schema
+                writer = pa.ipc.new_file(path, schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        feather.write_feather(pd.DataFrame(), path, compression='uncompressed')
+
+
+class LatestLoader:
+    """Loader ``BackgroundRefresher``: frame versi terbit terbaru, ``UNCHANGED`` bila belum berganti."""
+
+    def __init__(self, store, name, key='frame'):
+        self.store = store
+        self.name = name
+        self.key = key
+        self.version = None
+
+    def reset(self):
+        self.version = None
+
+    def __call__(self):
+        meta = self.store.latest(self.name)
+        if meta is None:
+            raise SnapshotMissing(f"Belum ada snapshot '{self.name}' di {self.store.root}; "
+                                  f"jalankan `python -m kawan.worker`.")
+        if meta['version'] == self.version:
+            return UNCHANGED
+        df = self.store.read_frame(self.name, meta['version'], self.key)
+        self.version = meta['version']
+        return df
+
+
+# ─── Ringkasan chatbot ───
+def publish_chat(store, frame, summary, words=None, latency=None):
+    frames = {
+        'frame': frame,
+        'status_counts': summary['status_counts'],
+        'top_messages': summary['top_messages'],
+        'top_words': summary['top_words'].rename_axis('Kata').reset_index(name='Frekuensi'),
+    }
+    if words is not None:
+        frames['words'] = words.to_table()
+    if latency is not None:
+        frames['latency'] = latency.to_table()
+        frames['latency_exact'] = latency.to_exact_table()
+    scalars = {k: v for k, v in summary.items() if not isinstance(v, (pd.DataFrame, pd.Series))}
+    return store.publish('chat', frames, rows=len(frame), summary=scalars)
+
+
+def read_chat_summary(store, version):
+    """Ringkasan chatbot (format ``pipeline.chat_summary``) dari versi ``version``; None bila tidak ada."""
+    try:
+        summary = dict(store.meta('chat', version)['summary'])
+        summary['status_counts'] = store.read_frame('chat', version, 'status_counts')
+        summary['top_messages'] = store.read_frame('chat', version, 'top_messages')
+        summary['top_words'] = store.read_frame('chat', version, 'top_words').set_index('Kata')['Frekuensi']
+    except (FileNotFoundError, KeyError):
+        return None
+    return summary
+
+
+def read_chat_words(store, version):
+    """Counter kata per hari dari versi ``version``; None bila snapshot lama tidak memuatnya."""
+    try:
+        return WordCounts.from_table(store.read_frame('chat', version, 'words'))
+    except FileNotFoundError:
+        return None
+
+
+def read_chat_latency(store, version):
+    """Sketch waktu respon per hari dari versi ``version``; None bila snapshot lama tidak memuatnya."""
+    try:
+        table = store.read_frame('chat', version, 'latency')
+    except FileNotFoundError:
+        return None
+    try:
+        exact = store.read_frame('chat', version, 'latency_exact')
+    except FileNotFoundError:
+        exact = None
+    return LatencySketches.from_table(table, exact)
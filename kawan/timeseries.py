@@ -0,0 +1,70 @@
+"""Deret waktu aktivitas pesan dengan bucket adaptif dan downsampling LTTB."""
+
+import numpy as np
+import pandas as pd
+
+POINT_BUDGET = 2000
+
+# (rentang maksimum, frekuensi bucket, label)
+BUCKET_RULES = [
+    (pd.Timedelta(days=2), 'min', 'menit'),
+    (pd.Timedelta(days=60), 'h', 'jam'),
+    (None, 'D', 'hari'),
+]
+
+
+def pick_bucket(start, end):
+    """Frekuensi bucket berdasarkan panjang rentang tanggal terpilih."""
+    span = pd.Timestamp(end) - pd.Timestamp(start)
+    for max_span, freq, label in BUCKET_RULES:
+        if max_span is None or span <= max_span:
+            return freq, label
+
+
+def activity_counts(datetimes, freq):
+    """Jumlah pesan per bucket (hanya bucket yang berisi), terurut waktu."""
+    counts = datetimes.dt.floor(freq).value_counts().sort_index()
+    return counts.index.to_numpy(), counts.to_numpy()
+
+
+def lttb(x, y, threshold=POINT_BUDGET):
+    """Largest-Triangle-Three-Buckets: indeks titik yang dipertahankan.
+
+    ``x`` numerik (atau datetime64) terurut naik. Titik pertama dan terakhir
+    selalu disimpan; di setiap bucket dipilih titik yang membentuk segitiga
+    terluas dengan titik terpilih sebelumnya dan rata-rata bucket berikutnya.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    xf = x.astype('datetime64[ns]').astype(np.int64).astype(np.float64) if np.issubdtype(x.dtype, np.datetime64) \
+        else np.asarray(x, dtype=np.float64)
+    yf = np.asarray(y, dtype=np.float64)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_start, next_stop = edges[i + 1], (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x = xf[next_start:next_stop].mean()
+        avg_y = yf[next_start:next_stop].mean()
+        area = np.abs((xf[a] - avg_x) * (yf[start:stop] - yf[a])
+                      - (xf[a] - xf[start:stop]) * (avg_y - yf[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def activity_series(datetimes, start, end, budget=POINT_BUDGET):
+    """Deret (waktu, jumlah) siap plot untuk rentang ``start``–``end``.
+
+    Mengembalikan ``(DataFrame[datetime, jumlah], label_bucket, jumlah_bucket_asli)``.
+    """
+    freq, label = pick_bucket(start, end)
+    x, y = activity_counts(datetimes, freq)
+    keep = lttb(x, y, budget)
+    return pd.DataFrame({'datetime': x[keep], 'jumlah': y[keep]}), label, len(x)
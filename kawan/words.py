@@ -0,0 +1,73 @@
+"""Frekuensi kata pesan chatbot (tanpa stop words).
+
+Setiap pesan di-tokenisasi sekali saat masuk, lalu dijumlahkan menjadi
+counter per hari dan per user (``kawan.daily``). Top kata untuk rentang
+tanggal atau user mana pun cukup menggabungkan counter hari-hari di rentang
+itu.
+"""
+
+import numpy as np
+import pandas as pd
+
+from kawan.daily import DailyCounts, day_keys, encode
+
+STOP_WORDS = set(['yang', 'di', 'ke', 'dari', 'pada', 'dalam', 'untuk', 'dengan', 'dan', 'atau',
+                  'ini', 'itu', 'juga', 'sudah', 'saya', 'anda', 'dia', 'mereka', 'kita', 'akan',
+                  'bisa', 'ada', 'tidak', 'saat', 'oleh', 'setelah', 'para', 'seperti', 'serta',
+                  'bagi', 'tentang', 'sampai', 'hingga', 'sebuah', 'telah', 'sih', 'ya', 'hal',
+                  'ok', 'oke', 'ketika', 'kepada', 'kami', 'kamu', 'aku', 'kau', 'kalian', 'saya'])
+
+
+def top_words(messages, n=20):
+    """``n`` kata terbanyak (lowercase, stop words dibuang) sebagai Series kata → frekuensi."""
+    all_text = " ".join(messages.astype(str))
+    words = [word.lower() for word in all_text.split() if word.lower() not in STOP_WORDS]
+    return pd.Series(words).value_counts().head(n)
+
+
+def count_tokens(df):
+    """Jumlah token per ``(day, no, word)`` dari frame history pesan."""
+    if df.empty:
+        return pd.DataFrame({'day': [], 'no': [], 'word': [], 'count': []})
+    tokens = pd.DataFrame({
+        'day': day_keys(df['datetime']).to_numpy(),
+        'no': df['no'].astype(str).to_numpy(),
+        'word': df['message'].astype(str).str.lower().str.split().to_numpy(),
+    }).explode('word')
+    tokens = tokens[tokens['word'].notna() & ~tokens['word'].isin(STOP_WORDS)]
+    counts = tokens.groupby(['day', 'no', 'word'], sort=False).size()
+    return counts.rename('count').reset_index()
+
+
+class WordCounts(DailyCounts):
+    """Counter token per hari; ``item`` adalah kode kata pada vocab ``words``."""
+
+    ITEM_COL = 'word'
+
+    def __init__(self):
+        super().__init__()
+        self.words, self._word_code = [], {}
+
+    @classmethod
+    def from_messages(cls, df):
+        return cls.from_table(count_tokens(df))
+
+    def _item_codes(self, values):
+        return encode(self.words, self._word_code, values)
+
+    def _item_labels(self, items):
+        return np.asarray(self.words, dtype=object)[items]
+
+    def update(self, df):
+        """Tambahkan pesan baru; hanya counter hari yang disentuh ``df`` yang berubah."""
+        self._add(count_tokens(df), replace=False)
+
+    def top(self, n=20, user=None, start=None, end=None):
+        """``n`` kata terbanyak untuk ``user`` di hari ``[start, end)``, format sama dengan ``top_words``.
+
+        Tanpa batas tanggal, pesan tanpa ``datetime`` ikut dihitung.
+        """
+        totals = self.merged(user, start, end)
+        order = np.argsort(-totals, kind='stable')[:n]
+        order = order[totals[order] > 0]
+        return pd.Series(totals[order], index=[self.words[i] for i in order], name='count', dtype='int64')
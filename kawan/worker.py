@@ -0,0 +1,130 @@
+"""Worker headless: ambil, preprocess dan agregasi data lalu terbitkan snapshot.
+
+Menjalankan pekerjaan yang sama dengan dashboard, tetapi sekali untuk semua
+replika. Setiap siklus menerbitkan versi baru ke ``SnapshotStore``:
+
+- ``sls``: frame SLS bertipe (``frame``) dan sel rollup cube (``cells``); dengan
+  ``--partition-by`` record ditumpahkan ke disk per provinsi/kabupaten dan sel
+  dihitung per partisi di process pool (``kawan/partitions.py``)
+- ``chat``: frame history (``frame``), counter kata (``words``) dan sketch
+  waktu respon (``latency``) per hari, serta ringkasan chatbot tanpa filter
+
+Contoh::
+
+    KAWAN_SNAPSHOT_DIR=data/snapshots python -m kawan.worker            # tiap SLS_REFRESH_INTERVAL detik
+    KAWAN_SNAPSHOT_DIR=data/snapshots python -m kawan.worker --once --only sls
+    KAWAN_SNAPSHOT_DIR=data/snapshots python -m kawan.worker --partition-by nmprov --processes 8
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from kawan import perf
+from kawan.chat_index import sort_by_time
+from kawan.config import (HISTORY_STORE_DIR, SLS_PARTITION_BY, SLS_PROCESSES, SLS_REFRESH_INTERVAL,
+                          SNAPSHOT_DIR)
+from kawan.fetch import NOT_MODIFIED, ChangeTracker
+from kawan.history_store import HistoryStore
+from kawan.partitions import PARTITION_COLS, aggregate_cells, fetch_sls_partitioned, iter_partition_frames
+from kawan.pipeline import chat_summary, sync_history
+from kawan.refresher import UNCHANGED
+from kawan.rollup import build_cells
+from kawan.sls import SlsLoader
+from kawan.snapshots import SnapshotStore, publish_chat
+
+DEFAULT_SNAPSHOT_DIR = os.path.join("data", "snapshots")
+
+logger = logging.getLogger("kawan.worker")
+
+# Validator respons SLS terakhir yang diterbitkan (mode biasa / chunked)
+_sls_loader = SlsLoader()
+_chunked_tracker = ChangeTracker()
+
+
+def publish_sls(store, partition_by=None, processes=None):
+    if partition_by:
+        return publish_sls_chunked(store, partition_by, processes)
+    df = _sls_loader()
+    if df is UNCHANGED:
+        logger.info("Data SLS tidak berubah; snapshot tidak diterbitkan ulang")
+        return None
+    with perf.stage("sls.rollup_cells"):
+        cells = build_cells(df)
+    with perf.stage("sls.publish"):
+        return store.publish('sls', {'frame': df, 'cells': cells}, rows=len(df))
+
+
+def publish_sls_chunked(store, by, processes=None):
+    """Seperti ``publish_sls`` tetapi puncak memorinya sebesar satu partisi ``by``."""
+    with tempfile.TemporaryDirectory(prefix="kawan-sls-") as root:
+        with perf.stage("sls.spill"):
+            spill = fetch_sls_partitioned(root, by, _chunked_tracker)
+        if spill is NOT_MODIFIED:
+            logger.info("Data SLS tidak berubah; snapshot tidak diterbitkan ulang")
+            return None
+        with perf.stage("sls.rollup_cells"):
+            cells = aggregate_cells(spill, processes)
+        with perf.stage("sls.publish"):
+            return store.publish('sls', {'frame': iter_partition_frames(spill), 'cells': cells},
+                                 rows=spill.rows, partition_by=by, partitions=len(spill.partitions()))
+
+
+def publish_chatbot(store, history):
+    for url, error in sync_history(history):
+        logger.warning("Gagal mengambil history dari %s: %s", url, error)
+    frame = sort_by_time(history.frame())
+    if frame.empty:
+        logger.warning("History pesan kosong; snapshot chat tidak diterbitkan")
+        return None
+    words, latency = history.words(), history.latency()
+    summary = chat_summary(frame, words=words.top(), response=latency.stats())
+    with perf.stage("chat.publish"):
+        return publish_chat(store, frame, summary, words, latency)
+
+
+def run_once(store, jobs, history=None, partition_by=None, processes=None):
+    """Jalankan setiap job sekali; kegagalan satu job tidak menghentikan yang lain."""
+    for job in jobs:
+        perf.begin(f"worker.{job}")
+        start = time.perf_counter()
+        try:
+            if job == 'sls':
+                version = publish_sls(store, partition_by, processes)
+            else:
+                version = publish_chatbot(store, history or HistoryStore(HISTORY_STORE_DIR))
+            if version is not None:
+                logger.info("%s v%d diterbitkan (%.1f s)", job, version, time.perf_counter() - start)
+        except Exception:
+            logger.exception("Job %s gagal", job)
+        finally:
+            perf.end()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--root', default=SNAPSHOT_DIR or DEFAULT_SNAPSHOT_DIR)
+    parser.add_argument('--interval', type=int, default=SLS_REFRESH_INTERVAL)
+    parser.add_argument('--once', action='store_true')
+    parser.add_argument('--only', choices=['sls', 'chat'])
+    parser.add_argument('--partition-by', choices=PARTITION_COLS, default=SLS_PARTITION_BY)
+    parser.add_argument('--processes', type=int, default=SLS_PROCESSES)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    store = SnapshotStore(args.root)
+    jobs = [args.only] if args.only else ['sls', 'chat']
+    history = HistoryStore(HISTORY_STORE_DIR) if 'chat' in jobs else None
+
+    while True:
+        started = time.monotonic()
+        run_once(store, jobs, history, args.partition_by, args.processes)
+        if args.once:
+            break
+        time.sleep(max(0.0, args.interval - (time.monotonic() - started)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Jalankan dashboard dengan prewarm data SLS sejak server start.
+
+Sama dengan ``streamlit run app.py``, tetapi data SLS dan struktur turunannya
+mulai dimuat di thread latar sebelum server menerima koneksi. Argumen
+tambahan diteruskan ke ``streamlit run``::
+
+    python serve.py --server.port 8501 --server.headless true
+"""
+
+import os
+import sys
+
+from streamlit.web import cli
+
+from views import boot
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+if __name__ == "__main__":
+    boot.start()
+    cli.main(args=["run", APP, *sys.argv[1:]], prog_name="streamlit")
@@ -0,0 +1,58 @@
+import sys
+import threading
+
+import pandas as pd
+
+from kawan.words import WordCounts
+
+
+def word_table(rows):
+    return pd.DataFrame(rows, columns=['day', 'no', 'word', 'count'])
+
+
+def test_set_day_replaces_counts():
+    counts = WordCounts.from_table(word_table([
+        ('2024-01-01', '1', 'sls', 2), ('2024-01-02', '1', 'sls', 3), ('2024-01-02', '2', 'desa', 1),
+    ]))
+
+    counts.set_day('2024-01-02', word_table([(None, '2', 'desa', 5)]).drop(columns='day'))
+    assert counts.top().to_dict() == {'desa': 5, 'sls': 2}
+    assert counts.top(user='1').to_dict() == {'sls': 2}
+
+    counts.set_day('2024-01-02', word_table([]).drop(columns='day'))
+    assert counts.top().to_dict() == {'sls': 2}
+
+
+def test_set_day_while_reading():
+    # Counter dipakai bersama antar sesi: pembaca tidak boleh melihat hari yang sedang diganti
+    counts = WordCounts.from_table(word_table(
+        [(f"2024-01-{d:02d}", str(u), w, 1) for d in range(1, 29) for u in range(3) for w in ('sls', 'desa')]))
+    replacement = word_table([(None, '1', 'sls', 4), (None, '2', 'rt', 1)]).drop(columns='day')
+    errors, done = [], threading.Event()
+
+    def write():
+        try:
+            for i in range(1000):
+                counts.set_day(f"2024-01-{i % 28 + 1:02d}", replacement)
+                counts.set_day(f"2024-02-{i % 28 + 1:02d}", replacement)
+        except Exception as e:  # pragma: no cover - hanya terjadi bila ada race
+            errors.append(e)
+        finally:
+            done.set()
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        writer = threading.Thread(target=write)
+        writer.start()
+        while not done.is_set():
+            try:
+                counts.top()
+                counts.top(user='1', start='2024-01-05', end='2024-02-10')
+            except Exception as e:
+                errors.append(e)
+                break
+        writer.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
@@ -0,0 +1,41 @@
+import os
+
+import pandas as pd
+import pytest
+
+from kawan.export import ExportCache, export_key
+
+
+def test_xlsx_export(tmp_path):
+    pytest.importorskip('openpyxl')
+    df = pd.DataFrame({'nmdesa': ['A', 'B'], 'total_sls': [3, 4]})
+    cache = ExportCache(str(tmp_path))
+    key = export_key('sls', 1)
+
+    path = cache.get_or_create(key, 'xlsx', lambda: df)
+
+    assert path.endswith('.xlsx') and os.path.exists(path)
+    assert [f for f in os.listdir(tmp_path) if '.tmp.' in f] == []
+    pd.testing.assert_frame_equal(pd.read_excel(path), df)
+    assert cache.get_or_create(key, 'xlsx', lambda: pytest.fail("file sudah ada")) == path
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'csv.gz'])
+def test_csv_export(tmp_path, fmt):
+    df = pd.DataFrame({'nmdesa': ['A', 'B'], 'total_sls': [3, 4]})
+    path = ExportCache(str(tmp_path)).get_or_create(export_key('sls', fmt), fmt, lambda: df)
+    pd.testing.assert_frame_equal(pd.read_csv(path), df)
+
+
+def test_open_file_survives_eviction(tmp_path):
+    df = pd.DataFrame({'nmdesa': ['A', 'B'], 'total_sls': [3, 4]})
+    cache = ExportCache(str(tmp_path), max_files=1)
+    assert cache.open_file(export_key('sls', 0), 'csv') is None
+
+    cache.get_or_create(export_key('sls', 0), 'csv', lambda: df)
+    with cache.open_file(export_key('sls', 0), 'csv') as f:
+        # Ekspor lain mengusir file yang sedang diunduh
+        cache.get_or_create(export_key('sls', 1), 'csv', lambda: df)
+        assert cache.get(export_key('sls', 0), 'csv') is None
+        pd.testing.assert_frame_equal(pd.read_csv(f), df)
+    assert cache.open_file(export_key('sls', 0), 'csv') is None
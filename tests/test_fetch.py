@@ -0,0 +1,78 @@
+import time
+
+import pytest
+import requests
+
+from benchmarks.stub_server import StubEndpoint, StubServer
+from kawan import fetch
+
+PAYLOAD = {"records": [{"id": 1}, {"id": 2}]}
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(fetch, '_backoff', lambda attempt: 0)
+
+
+def test_retry_after_transient_failures():
+    endpoint = StubEndpoint({"read": PAYLOAD}, fail_times=2)
+    with StubServer({"/exec": endpoint}) as server:
+        assert fetch.fetch_json(server.url("/exec"), params={"action": "read"}) == PAYLOAD
+    assert endpoint.hits == 3
+
+
+def test_gives_up_after_retries():
+    endpoint = StubEndpoint({"read": PAYLOAD}, fail_times=10)
+    with StubServer({"/exec": endpoint}) as server:
+        with pytest.raises(fetch.FetchError, match="503"):
+            fetch.fetch_json(server.url("/exec"), params={"action": "read"}, retries=2)
+    assert endpoint.hits == 3
+
+
+def test_client_error_not_retried():
+    endpoint = StubEndpoint({"read": PAYLOAD})
+    with StubServer({"/exec": endpoint}) as server:
+        # Action tidak dikenal dijawab 400
+        with pytest.raises(requests.HTTPError):
+            fetch.fetch_json(server.url("/exec"), params={"action": "lain"})
+    assert endpoint.hits == 1
+
+
+def test_fetch_many_parallel_and_isolated():
+    slow = [StubEndpoint({"read": {"n": i}}, delay=0.3) for i in range(3)]
+    endpoints = {f"/exec{i}": e for i, e in enumerate(slow)}
+    with StubServer(endpoints) as server:
+        urls = [server.url(path) for path in endpoints] + [server.url("/missing")]
+        start = time.perf_counter()
+        results = fetch.fetch_many(urls, params={"action": "read"})
+        elapsed = time.perf_counter() - start
+
+    assert [r.url for r in results] == urls
+    assert [r.data for r in results[:3]] == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert isinstance(results[3].error, requests.HTTPError) and results[3].data is None
+    # Paralel: waktu total mengikuti endpoint paling lambat, bukan jumlah jedanya
+    assert elapsed < 0.8
+
+
+def test_session_reuses_connections():
+    session = fetch.get_session()
+    assert fetch.get_session() is session
+    endpoint = StubEndpoint({"read": PAYLOAD})
+    with StubServer({"/exec": endpoint}) as server:
+        for _ in range(3):
+            fetch.fetch_json(server.url("/exec"), params={"action": "read"})
+        manager = session.get_adapter(server.base_url).poolmanager
+        pools = [manager.pools[key] for key in manager.pools.keys() if key.key_port == server.httpd.server_port]
+    # Tiga request keep-alive memakai satu koneksi dari pool
+    assert [(p.num_connections, p.num_requests) for p in pools] == [(1, 3)]
+
+
+def test_stream_not_modified_with_etag():
+    endpoint = StubEndpoint({"read": PAYLOAD}, etag=True)
+    tracker = fetch.ChangeTracker()
+    consume = lambda chunks: b"".join(chunks)  # noqa: E731
+    with StubServer({"/exec": endpoint}) as server:
+        url = server.url("/exec")
+        assert fetch.fetch_stream(url, consume, params={"action": "read"}, tracker=tracker)
+        assert fetch.fetch_stream(url, consume, params={"action": "read"}, tracker=tracker) is fetch.NOT_MODIFIED
+    assert tracker.etag and endpoint.hits == 2
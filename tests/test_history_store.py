@@ -0,0 +1,75 @@
+import multiprocessing
+import os
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_history_frame
+from kawan.history import history_frame
+from kawan.history_store import HistoryStore
+from kawan.latency import LatencySketches
+from kawan.words import WordCounts
+
+URL = 'http://stub/macros/s/abcdefghijkl/exec'
+
+
+def messages(rows):
+    raw = make_history_frame(rows, users=20)
+    df = history_frame({'records': raw.to_dict('records')}, URL)
+    return df.sort_values('datetime', kind='stable').reset_index(drop=True)
+
+
+def sorted_frame(df):
+    return df.sort_values(['id', 'message']).reset_index(drop=True)[['id', 'no', 'message', 'status']]
+
+
+def test_reload_applies_appends_from_other_process(tmp_path):
+    everything = messages(3500)
+    df, more = everything.iloc[:3000], everything.iloc[3000:]
+    writer, reader = HistoryStore(str(tmp_path)), HistoryStore(str(tmp_path))
+    writer.append(df.iloc[:1000], source=URL)
+
+    # Pembaca memuat state awal (termasuk append pertama) sebelum proses lain menambah data
+    reader.frame(), reader.words(), reader.latency()
+    writer.append(df.iloc[1000:2000], source=URL)
+    writer.append(df.iloc[2000:], source=URL)
+
+    new_rows = reader.reload()
+    assert len(new_rows) == 2000
+    assert reader.reload().empty
+    assert reader.high_water_mark(URL) == writer.high_water_mark(URL)
+
+    full = HistoryStore(str(tmp_path))
+    pd.testing.assert_frame_equal(sorted_frame(reader.frame()), sorted_frame(full.frame()))
+    assert reader.words().top(100).to_dict() == WordCounts.from_messages(df).top(100).to_dict()
+    assert reader.latency().stats() == LatencySketches.from_messages(df).stats()
+
+    # Append pembaca sendiri tidak mengulang baris penulis
+    writer.frame()
+    reader.append(more, source=URL)
+    assert len(reader.frame()) == len(df) + len(more)
+    assert len(writer.reload()) == len(more)
+    assert len(writer.frame()) == len(df) + len(more)
+
+
+def append_in_batches(root, df, batches):
+    store = HistoryStore(root)
+    for part in np.array_split(np.arange(len(df)), batches):
+        store.append(df.iloc[part], source=URL)
+
+
+def test_concurrent_writers(tmp_path):
+    # Dua worker menyinkronkan data yang sama ke satu root secara bersamaan
+    df = messages(3000)
+    ctx = multiprocessing.get_context('fork')
+    workers = [ctx.Process(target=append_in_batches, args=(str(tmp_path), df, 40)) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert [worker.exitcode for worker in workers] == [0, 0]
+
+    store = HistoryStore(str(tmp_path))
+    pd.testing.assert_frame_equal(sorted_frame(store.frame()), sorted_frame(df))
+    assert store.words().top(100).to_dict() == WordCounts.from_messages(df).top(100).to_dict()
+    assert [f for f in os.listdir(tmp_path) if f.endswith('.tmp')] == []
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import make_history_frame
+from kawan.history import history_frame
+from kawan.latency import LatencySketches
+from kawan.response_time import calculate_response_stats, conversation_pairs
+
+EXACT_KEYS = ['avg', 'avg_raw', 'min', 'max', 'total_samples']
+
+
+def conversation(no, n, seed):
+    """``n`` pasang receive→send bergantian untuk ``no`` dengan jeda acak mulai jam kerja."""
+    rng = np.random.default_rng(seed)
+    gaps = rng.integers(5, 900, size=2 * n)
+    times = pd.Timestamp('2024-03-04 08:00') + pd.to_timedelta(np.cumsum(gaps), unit='s')
+    return pd.DataFrame({'no': no, 'status': ['receive', 'send'] * n, 'datetime': times})
+
+
+def exact(stats):
+    return {key: stats[key] for key in EXACT_KEYS}
+
+
+@pytest.mark.parametrize('batches', [1, 7])
+def test_stats_match_response_stats(batches):
+    df = conversation('bot', 3000, seed=1)
+    expected = exact(calculate_response_stats(df, 'bot'))
+    assert expected['total_samples'] > 1000
+
+    sketches = LatencySketches()
+    for part in np.array_split(np.arange(len(df)), batches):
+        sketches.update(df.iloc[part])
+    assert exact(sketches.stats()) == expected
+
+    loaded = LatencySketches.from_table(sketches.to_table(), sketches.to_exact_table())
+    assert exact(loaded.stats()) == expected
+
+
+def test_stats_per_user_and_range():
+    df = pd.concat([conversation(str(u), 800, seed=u) for u in range(4)], ignore_index=True)
+    sketches = LatencySketches.from_messages(df)
+    start, end = pd.Timestamp('2024-03-06'), pd.Timestamp('2024-03-09')
+
+    for u in map(str, range(4)):
+        rows = df[df['no'] == u]
+        assert exact(sketches.stats(user=u)) == exact(calculate_response_stats(rows, u))
+        in_range = rows[(rows['datetime'] >= start) & (rows['datetime'] < end)]
+        assert exact(sketches.stats(user=u, start=start, end=end)) == exact(calculate_response_stats(in_range, u))
+
+
+def test_synthetic_history_has_samples():
+    # Fixture benchmark: balasan bot tercatat di bawah ``no`` user yang dibalas
+    raw = make_history_frame(5000, users=50)
+    df = history_frame({'records': raw.to_dict('records')}, 'http://stub/macros/s/abcdefghijkl/exec')
+    pairs, _ = conversation_pairs(df)
+    assert len(pairs) > 200
+    assert LatencySketches.from_messages(df).stats()['total_samples'] == len(pairs)
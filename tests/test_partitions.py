@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import make_sls_frame
+from kawan.partitions import PartitionSpill, aggregate_cells, iter_partition_frames
+from kawan.rollup import CUBE_DIMS, build_cells
+from kawan.sls import preprocess_sls
+
+pytest.importorskip('pyarrow')
+
+
+def sorted_cells(cells):
+    dims = [c for c in CUBE_DIMS if c in cells.columns]
+    cells = cells.astype({c: str for c in dims})
+    return cells.sort_values(dims).reset_index(drop=True)
+
+
+@pytest.mark.parametrize('share', [1.0, 0.5])
+def test_partition_missing_column(tmp_path, share):
+    df = preprocess_sls(make_sls_frame(5000))
+    first = df['nmprov'].cat.categories[0]
+    in_first = (df['nmprov'] == first).to_numpy()
+    # ``share`` baris provinsi pertama datang di batch tanpa ``nmdesa``; 0.5 = partisi campuran
+    missing = in_first & (in_first.cumsum() <= share * in_first.sum())
+
+    spill = PartitionSpill(str(tmp_path), 'nmprov')
+    spill.write(preprocess_sls(df[missing].drop(columns='nmdesa').reset_index(drop=True)))
+    spill.write(preprocess_sls(df[~missing].reset_index(drop=True)))
+
+    expected = build_cells(df.assign(nmdesa=df['nmdesa'].astype(str).where(~missing, '-')))
+    cells = aggregate_cells(spill, processes=1)
+    assert cells['total_sls'].sum() == len(df)
+    pd.testing.assert_frame_equal(sorted_cells(cells), sorted_cells(expected), check_dtype=False)
+
+    frame = pd.concat(list(iter_partition_frames(spill)), ignore_index=True)
+    assert frame['nmdesa'].notna().all()
+    assert (frame['nmdesa'] == '-').sum() == missing.sum()
@@ -0,0 +1,24 @@
+import json
+import os
+import subprocess
+import sys
+
+PROBE = """
+from kawan import perf
+perf.begin("probe")
+with perf.stage("probe.stage"):
+    perf.count("probe.event")
+perf.end()
+"""
+
+
+def test_run_logged_without_logging_config():
+    # Seperti proses Streamlit: tidak ada yang memanggil logging.basicConfig
+    env = {k: v for k, v in os.environ.items() if k != 'KAWAN_PERF_METRICS'}
+    out = subprocess.run([sys.executable, '-c', PROBE], capture_output=True, text=True, check=True,
+                         env={**env, 'KAWAN_PERF': '1'}, cwd=os.path.dirname(os.path.dirname(__file__)))
+    lines = [json.loads(line) for line in out.stderr.splitlines() if line.startswith('{')]
+    assert len(lines) == 1
+    assert lines[0]['run'] == 'probe'
+    assert [s['stage'] for s in lines[0]['stages']] == ['probe.stage']
+    assert lines[0]['counters'] == {'probe.event': 1}
@@ -0,0 +1,29 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import make_sls_frame
+from kawan.progress import ppl_progress_table, status_summary
+from kawan.sls import preprocess_sls
+
+
+def value_counts_summary(df):
+    # Versi lama: lambda ``value_counts`` per grup pada kolom teks
+    return df.groupby('emailPPL')['statusSls'].agg(
+        lambda x: ', '.join(f"{v} ({c})" for v, c in pd.Series(x).value_counts().items() if c))
+
+
+@pytest.mark.parametrize('dtype', [str, 'category'])
+def test_ties_keep_first_seen_order(dtype):
+    keys = pd.Series(['a', 'a', 'a', 'a', 'a', 'b', 'b', 'b'])
+    status = pd.Series(['selesai', 'belum', 'belum', 'selesai', '-', 'proses', 'belum', 'proses']).astype(dtype)
+    assert status_summary(keys, status).to_dict() == {
+        'a': 'selesai (2), belum (2), - (1)',
+        'b': 'proses (2), belum (1)',
+    }
+
+
+def test_matches_value_counts():
+    df = preprocess_sls(make_sls_frame(20_000))
+    expected = value_counts_summary(df.assign(statusSls=df['statusSls'].astype(str)))
+    table = ppl_progress_table(df).set_index('emailPPL')['statusSls']
+    pd.testing.assert_series_equal(table, expected, check_names=False, check_index_type=False)
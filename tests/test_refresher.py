@@ -0,0 +1,56 @@
+import pytest
+
+from benchmarks.stub_server import StubEndpoint, StubServer
+from benchmarks.synthetic import make_sls_frame
+from kawan import sls
+from kawan.config import SLS_ACTION
+from kawan.refresher import UNCHANGED, BackgroundRefresher
+from kawan.shared_cache import SharedCache
+
+
+@pytest.fixture
+def sls_url(monkeypatch):
+    body = b'{"records":' + make_sls_frame(200).to_json(orient='records').encode('utf-8') + b'}'
+    with StubServer({"/sls/exec": StubEndpoint({SLS_ACTION: body}, etag=True)}) as server:
+        monkeypatch.setattr(sls, 'SLS_API_URL', server.url("/sls/exec"))
+        yield
+
+
+@pytest.mark.parametrize('shared', [False, True])
+def test_new_refresher_loads_unchanged_data(sls_url, monkeypatch, tmp_path, shared):
+    cache = SharedCache(str(tmp_path)) if shared else None
+    monkeypatch.setattr(sls, 'default_cache', lambda: cache)
+
+    first = BackgroundRefresher(sls.SlsLoader(), interval=60)
+    assert first.refresh()
+    assert not first.refresh() and first.unchanged == 1
+
+    # Mis. get_sls_refresher dibangun ulang setelah "Clear cache": data upstream belum berubah
+    second = BackgroundRefresher(sls.SlsLoader(), interval=60)
+    assert second.refresh()
+    assert second.snapshot(timeout=0).data.shape == first.snapshot(timeout=0).data.shape
+    assert second.last_error is None
+
+
+class StaleLoader:
+    """Loader yang validatornya sudah melihat data sebelum refresher memegang snapshot."""
+
+    def __init__(self):
+        self.known = True
+        self.calls = 0
+
+    def reset(self):
+        self.known = False
+
+    def __call__(self):
+        self.calls += 1
+        return UNCHANGED if self.known else {'rows': 1}
+
+
+def test_unchanged_without_snapshot_forces_full_load():
+    loader = StaleLoader()
+    refresher = BackgroundRefresher(loader, interval=60)
+
+    assert refresher.refresh()
+    assert refresher.snapshot(timeout=0).data == {'rows': 1}
+    assert loader.calls == 2 and refresher.unchanged == 0
@@ -0,0 +1 @@
+"""Halaman dashboard Streamlit; modul halaman diimpor ``app.py`` hanya saat halamannya dibuka."""
@@ -0,0 +1,42 @@
+"""Prewarm saat server start: data SLS dan struktur turunannya dimuat di thread latar.
+
+``start()`` idempoten per proses. ``serve.py`` memanggilnya sebelum server
+Streamlit menerima koneksi (di proses yang sama), sehingga pengunjung pertama
+setelah deploy langsung mendapat cache yang sudah hangat. Prewarm memakai
+fungsi ``st.cache_resource`` yang sama dengan halaman, jadi hasilnya dipakai
+bersama oleh semua sesi.
+"""
+
+import logging
+import threading
+
+from kawan import perf
+
+logger = logging.getLogger("kawan.boot")
+
+_lock = threading.Lock()
+_thread = None
+
+
+def start():
+    """Mulai prewarm sekali per proses; kembalikan thread-nya."""
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_prewarm, name="prewarm", daemon=True)
+            _thread.start()
+    return _thread
+
+
+def _prewarm():
+    perf.begin("prewarm")
+    try:
+        with perf.stage("prewarm.import"):
+            from views import sls
+        with perf.stage("prewarm.sls"):
+            sls.prewarm()
+    except Exception:
+        # Halaman akan memuat ulang sendiri dan menampilkan error-nya
+        logger.exception("Prewarm data SLS gagal")
+    finally:
+        perf.end()
@@ -0,0 +1,170 @@
+"""Halaman Analisis Chatbot KAWAN."""
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from kawan import perf
+from kawan.chat_index import ChatIndex
+from kawan.config import HISTORY_ACTION, HISTORY_STORE_DIR, HISTORY_TTL
+from kawan.history_store import HistoryStore
+from kawan.pipeline import chat_summary, history_state, load_history, sync_store
+from kawan.shared_cache import default_cache
+from kawan.snapshots import read_chat_latency, read_chat_summary, read_chat_words
+from kawan.timeseries import activity_series
+from views.common import cached_chart, get_snapshot_store
+
+
+# ─── Chart (dibangun lewat cached_chart) ───
+def chat_status_pie(status_count):
+    return px.pie(status_count, names='Status', values='Jumlah', color_discrete_sequence=px.colors.qualitative.Pastel)
+
+
+def chat_activity_line(df_time, bucket_label):
+    fig = go.Figure(go.Scattergl(
+        x=df_time['datetime'], y=df_time['jumlah'],
+        mode='lines+markers' if len(df_time) <= 200 else 'lines',
+        name='jumlah'
+    ))
+    fig.update_layout(xaxis_title="datetime", yaxis_title=f"jumlah per {bucket_label}")
+    return fig
+
+
+def chat_top_messages_bar(top_msg):
+    return px.bar(top_msg, x="Frekuensi", y="Pesan", orientation="h", text="Frekuensi",
+                  color="Frekuensi", color_continuous_scale="Blues")
+
+
+def chat_top_words_bar(word_freq):
+    fig = px.bar(
+        x=word_freq.values,
+        y=word_freq.index,
+        orientation='h',
+        title='20 Kata Paling Sering Muncul (Excluding Stop Words)',
+        labels={'x': 'Frekuensi', 'y': 'Kata'},
+        height=600
+    )
+    fig.update_layout(
+        showlegend=False,
+        margin=dict(l=20, r=20, t=40, b=20),
+        plot_bgcolor='white'
+    )
+    return fig
+
+
+def page_chatbot():
+    @st.cache_resource
+    def get_history_store():
+        return HistoryStore(HISTORY_STORE_DIR)
+
+    @perf.cached(st.cache_resource(ttl=HISTORY_TTL))
+    def load_chat_index():
+        # Frame terurut waktu + indeks user, dipakai bersama (read-only) oleh semua sesi
+        snapshots = get_snapshot_store()
+        if snapshots is not None:
+            df = snapshots.read_latest('chat', 'frame')
+            version = df.attrs['snapshot_version']
+            return ChatIndex(df, read_chat_words(snapshots, version), read_chat_latency(snapshots, version))
+
+        store = get_history_store()
+        shared = default_cache()
+        if shared is None:
+            df, words, latency, errors = load_history(store)
+        else:
+            # Hanya satu proses per TTL yang sinkron ke API; cache cukup menyimpan daftar
+            # error, proses lain menerapkan delta dari jurnal store di disk
+            errors = shared.get_or_compute(f"chat.{HISTORY_ACTION}.sync", lambda: sync_store(store),
+                                           ttl=HISTORY_TTL)
+            df, words, latency = history_state(store)
+        for url, error in errors:
+            st.error(f"Error loading data from {url}: {error}")
+        with perf.stage("chat.index"):
+            return ChatIndex(df, words, latency)
+
+    @perf.cached(st.cache_data(max_entries=4))
+    def get_published_summary(version):
+        return read_chat_summary(get_snapshot_store(), version)
+
+    index = load_chat_index()
+    full_range = index.date_bounds()
+
+    st.title("🤖 Analisis History Chatbot KAWAN")
+    st.markdown("Dashboard interaktif untuk menganalisis percakapan chatbot KAWAN berdasarkan data history pesan.")
+
+    st.sidebar.header("⚙️ Filter Data")
+
+    selected_user = st.sidebar.selectbox("Pilih User:", options=["Semua"] + index.users)
+    user = None if selected_user == "Semua" else selected_user
+
+    date_range = st.sidebar.date_input(
+        "Pilih Rentang Tanggal:",
+        list(index.date_bounds(user) or full_range)
+    )
+    range_start = pd.Timestamp(date_range[0])
+    range_end = pd.Timestamp(date_range[1]) + pd.Timedelta(days=1)
+
+    # Rentang tanggal = pencarian biner pada frame terurut waktu, bukan perbandingan per baris
+    with perf.stage("chat.filter"):
+        df = index.select(user, range_start, range_end)
+
+    # Tanpa filter, ringkasan hasil worker (bila ada) dipakai apa adanya
+    summary = None
+    version = index.frame.attrs.get('snapshot_version')
+    if version is not None and selected_user == "Semua" and tuple(date_range) == full_range:
+        summary = get_published_summary(version)
+    if summary is None:
+        with perf.stage("chat.word_top"):
+            words = index.words.top(user=user, start=range_start, end=range_end)
+        with perf.stage("chat.latency"):
+            response = index.latency.stats(user=user, start=range_start, end=range_end)
+        summary = chat_summary(df, words=words, response=response)
+
+    st.subheader("📊 Statistik Ringkas")
+
+    response_stats = summary['response']
+
+    st.subheader("📊 Statistik Pesan")
+    col1, col2 = st.columns(2)
+    with col1:
+        col1.metric("Total Pesan", summary['total'])
+        col1.metric("Pesan Diterima", summary['receive'])
+        col1.metric("Pesan Dikirim", summary['send'])
+        col1.metric("Jumlah User Unik", summary['users'])
+
+    st.subheader("⏱️ Analisis Waktu Respon")
+    st.markdown("*Setiap pesan masuk dipasangkan dengan balasan berikutnya di percakapan (nomor) yang sama; "
+                "waktu respon dihitung dalam jam kerja (08:00-20:00). Persentil dari sketch, galat relatif ≤ 1%.*")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Jumlah Sampel Response", response_stats['total_samples'])
+        st.metric("Response Tercepat", response_stats['min'])
+        st.metric("Response Terlama", response_stats['max'])
+
+    with col2:
+        st.metric("Rata-rata Waktu Respon (Jam Kerja)", response_stats['avg'])
+        st.metric("Rata-rata Waktu Respon (24 Jam)", response_stats['avg_raw'])
+        st.metric("P90 Waktu Respon (Jam Kerja)", response_stats.get('p90', "N/A"))
+
+    with col3:
+        st.metric("Median Waktu Respon (Jam Kerja)", response_stats['median'])
+        st.metric("Median Waktu Respon (24 Jam)", response_stats['median_raw'])
+        st.metric("P99 Waktu Respon (Jam Kerja)", response_stats.get('p99', "N/A"))
+
+    st.subheader("📈 Distribusi Status Pesan")
+    cached_chart("chat.status", chat_status_pie, summary['status_counts'])
+
+    st.subheader("⏰ Aktivitas Pesan Seiring Waktu")
+    with perf.stage("chat.activity"):
+        df_time, bucket_label, n_buckets = activity_series(df['datetime'], range_start, range_end)
+    cached_chart("chat.activity", chat_activity_line, df_time, bucket_label)
+    if len(df_time) < n_buckets:
+        st.caption(f"Per {bucket_label}; {len(df_time)} dari {n_buckets} titik ditampilkan (downsampling LTTB).")
+
+    st.subheader("💬 Pesan Paling Sering Muncul")
+    cached_chart("chat.top_messages", chat_top_messages_bar, summary['top_messages'])
+
+    st.subheader("☁️ Analisis Frekuensi Kata")
+    cached_chart("chat.top_words", chat_top_words_bar, summary['top_words'])
@@ -0,0 +1,142 @@
+"""Widget bersama kedua halaman: tabel berhalaman, ekspor lazy, chart ter-cache dan panel performa."""
+
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from kawan import perf
+from kawan.config import EXPORT_DIR, SNAPSHOT_DIR
+from kawan.export import EXPORT_FORMATS, ExportCache, available_formats, export_key
+from kawan.figures import FigureCache, fingerprint
+from kawan.paging import PAGE_SIZES, page_count, page_window, sort_positions, visible_positions
+from kawan.snapshots import SnapshotStore
+
+# st.fragment (>= 1.37) atau st.experimental_fragment (1.33–1.36); versi lebih lama rerun satu halaman penuh
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda fn: fn)
+
+
+@perf.cached(st.cache_resource(max_entries=16))
+def get_sort_order(cache_key, column, ascending, _df):
+    return sort_positions(_df, column, ascending)
+
+
+@st.cache_resource
+def get_export_cache():
+    return ExportCache(EXPORT_DIR)
+
+
+@st.cache_resource
+def get_snapshot_store():
+    # Mode worker: data dihitung oleh `python -m kawan.worker`, dashboard hanya membaca
+    return SnapshotStore(SNAPSHOT_DIR) if SNAPSHOT_DIR else None
+
+
+def paged_table(df, key, cache_key, columns=None, labels=None, keep=None, height=500):
+    """Tabel berhalaman: sort & slicing di server, hanya halaman aktif dikirim ke browser.
+
+    ``cache_key`` harus berubah setiap kali isi ``df`` berubah (dipakai untuk
+    cache urutan sort). ``keep`` adalah mask boolean opsional atas baris ``df``.
+    Mengembalikan jumlah baris yang lolos ``keep``.
+    """
+    columns = columns or list(df.columns)
+    labels = labels or columns
+    label_to_col = dict(zip(labels, columns))
+
+    sort_options = ["(urutan asli)"] + list(labels)
+    if st.session_state.get(f"{key}_sort_col") not in sort_options:
+        st.session_state.pop(f"{key}_sort_col", None)
+
+    c_sort, c_dir, c_size, c_page = st.columns([3, 2, 1, 1])
+    with c_sort:
+        sort_by = st.selectbox("Urutkan berdasarkan:", options=sort_options, key=f"{key}_sort_col")
+    with c_dir:
+        sort_dir = st.radio("Arah", ["Naik", "Turun"], horizontal=True, key=f"{key}_sort_dir")
+    with c_size:
+        page_size = st.selectbox("Baris/halaman", PAGE_SIZES, index=1, key=f"{key}_page_size")
+
+    order = None
+    if sort_by != sort_options[0]:
+        order = get_sort_order(cache_key, label_to_col[sort_by], sort_dir == "Naik", df)
+    positions = visible_positions(len(df), order, keep)
+
+    n_pages = page_count(len(positions), page_size)
+    # Nilai widget hanya lewat session state (tanpa ``value=``) agar clamp tidak memicu peringatan Streamlit
+    if f"{key}_page" not in st.session_state:
+        st.session_state[f"{key}_page"] = 1
+    elif st.session_state[f"{key}_page"] > n_pages:
+        st.session_state[f"{key}_page"] = n_pages
+    with c_page:
+        page = st.number_input("Halaman", min_value=1, max_value=n_pages, step=1, key=f"{key}_page")
+
+    rows, start, stop = page_window(positions, page, page_size)
+    with perf.stage(f"{key}.render"):
+        page_df = df.iloc[rows][columns]
+        page_df.columns = labels
+        st.dataframe(page_df, use_container_width=True, hide_index=True, height=height)
+    st.caption(f"Halaman {page} dari {n_pages} · baris {start + 1 if stop else 0}–{stop} dari {len(positions)}")
+    return len(positions)
+
+
+def export_controls(key, file_stem, cache_parts, build):
+    """Tombol unduh lazy: file dibuat saat diminta lalu di-memo per ``cache_parts`` + format."""
+    exports = get_export_cache()
+    formats = available_formats()
+    c_fmt, c_btn = st.columns([1, 3])
+    with c_fmt:
+        fmt = st.selectbox("Format", formats, format_func=lambda f: EXPORT_FORMATS[f][2], key=f"{key}_export_fmt")
+    ext, mime, label = EXPORT_FORMATS[fmt]
+    cache_key = export_key(*cache_parts, fmt)
+
+    with c_btn:
+        f = exports.open_file(cache_key, fmt)
+        if f is None and st.button(f"📦 Siapkan file {label}", key=f"{key}_export_prepare"):
+            with st.spinner("Menyiapkan file..."), perf.stage(f"{key}.export.{fmt}"):
+                exports.get_or_create(cache_key, fmt, build)
+            f = exports.open_file(cache_key, fmt)
+        if f is not None:
+            with f:
+                st.download_button(
+                    label=f"📥 Download {label}",
+                    data=f,
+                    file_name=f"{file_stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{ext}",
+                    mime=mime,
+                    key=f"{key}_export_download",
+                )
+
+
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache()
+
+
+def cached_chart(name, build, data, *options):
+    """Tampilkan ``build(data, *options)``; figure dibangun ulang hanya bila isi ``data``/``options`` berubah."""
+    fig = get_figure_cache().get_or_build(name, fingerprint(data, *options), lambda: build(data, *options))
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def perf_panel(run):
+    """Panel "Performance" per rerun (hanya tampil bila KAWAN_PERF=1)."""
+    if run is None:
+        return
+    with st.expander("⏱️ Performance", expanded=False):
+        st.caption(f"Total rerun: {run.total:.3f} s")
+        figures = get_figure_cache().stats()
+        st.caption(f"Cache figure: {figures['hits']} hit, {figures['misses']} miss, "
+                   f"{figures['evictions']} evict, {figures['entries']} entri")
+        if run.stages:
+            stages = pd.DataFrame(run.stages, columns=['Tahap', 'Detik'])
+            st.dataframe(stages, use_container_width=True, hide_index=True)
+        if run.counters:
+            st.dataframe(pd.DataFrame(sorted(run.counters.items()), columns=['Counter', 'Jumlah']),
+                         use_container_width=True, hide_index=True)
+        if run.sizes:
+            st.dataframe(pd.DataFrame(sorted(run.sizes.items()), columns=['Payload', 'Byte']),
+                         use_container_width=True, hide_index=True)
+        for name, background in perf.REGISTRY.last_runs.items():
+            if name == run.name:
+                continue
+            st.caption(f"Refresh latar belakang terakhir ({name}): {background.total:.3f} s")
+            st.dataframe(pd.DataFrame(background.stages, columns=['Tahap', 'Detik']),
+                         use_container_width=True, hide_index=True)
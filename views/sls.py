@@ -0,0 +1,452 @@
+"""Halaman Monitoring Progress SLS."""
+
+import functools
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from kawan import perf
+from kawan.config import SLS_REFRESH_INTERVAL
+from kawan.hierarchy import RegionIndex
+from kawan.pipeline import sls_desa_counts, sls_progress_by, sls_status_counts, sls_totals
+from kawan.progress import ppl_progress_table
+from kawan.refresher import BackgroundRefresher
+from kawan.rollup import RollupCube
+from kawan.search import SearchIndex, TrigramIndex
+from kawan.sls import SlsLoader
+from kawan.snapshots import LatestLoader
+from views.common import cached_chart, export_controls, fragment, get_snapshot_store, paged_table
+
+
+# ─── Chart (dibangun lewat cached_chart) ───
+SLS_STATUS_COLORS = {
+    'belum': '#FFA726',
+    'selesai': '#66BB6A',
+    'proses': '#42A5F5',
+    '-': '#BDBDBD'
+}
+
+
+def sls_status_pie(status_counts):
+    fig = px.pie(
+        status_counts, names='Status', values='Jumlah',
+        color='Status',
+        color_discrete_map=SLS_STATUS_COLORS,
+        hole=0.4
+    )
+    fig.update_traces(textposition='outside', textinfo='percent+label')
+    return fig
+
+
+def sls_progress_bars(progress, col):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name='Selesai Lapangan', x=progress[col], y=progress['selesai'], marker_color='#2196F3'))
+    fig.add_trace(go.Bar(name='Submit', x=progress[col], y=progress['submit'], marker_color='#FFA726'))
+    fig.add_trace(go.Bar(name='Approved', x=progress[col], y=progress['approved'], marker_color='#66BB6A'))
+    fig.update_layout(barmode='group', xaxis_tickangle=-45, height=400, margin=dict(l=20, r=20, t=20, b=80))
+    return fig
+
+
+def sls_desa_bar(desa_counts):
+    fig = px.bar(
+        desa_counts, x='jumlah', y='nmdesa', orientation='h',
+        color='nmkec', text='jumlah',
+        labels={'jumlah': 'Jumlah SLS', 'nmdesa': 'Desa', 'nmkec': 'Kecamatan'},
+        height=500, color_discrete_sequence=px.colors.qualitative.Bold
+    )
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'}, margin=dict(l=20, r=20, t=20, b=20))
+    return fig
+
+
+# ─── Data & struktur turunan (cache_resource, dibagi antar sesi) ───
+@st.cache_resource
+def get_sls_refresher():
+    snapshots = get_snapshot_store()
+    loader = SlsLoader() if snapshots is None else LatestLoader(snapshots, 'sls')
+    return BackgroundRefresher(loader, interval=SLS_REFRESH_INTERVAL, name="sls-refresher").start()
+
+
+@perf.cached(st.cache_resource(max_entries=2))
+def get_region_index(version, _df):
+    return RegionIndex(_df)
+
+
+@perf.cached(st.cache_resource(max_entries=2))
+def get_search_index(version, _df):
+    return SearchIndex(_df)
+
+
+@perf.cached(st.cache_resource(max_entries=2))
+def get_rollup_cube(version, _df):
+    snapshots = get_snapshot_store()
+    published = _df.attrs.get('snapshot_version')
+    if snapshots is not None and published is not None:
+        try:
+            return RollupCube(snapshots.read_frame('sls', published, 'cells'))
+        except FileNotFoundError:
+            pass
+    return RollupCube.from_frame(_df)
+
+
+def prewarm():
+    """Muat data SLS dan struktur turunannya sebelum pengunjung pertama (dipanggil ``views.boot``)."""
+    snapshot = get_sls_refresher().snapshot()
+    if snapshot is None or snapshot.data.empty:
+        return
+    with perf.stage("prewarm.region_index"):
+        get_region_index(snapshot.version, snapshot.data)
+    with perf.stage("prewarm.rollup"):
+        get_rollup_cube(snapshot.version, snapshot.data)
+    with perf.stage("prewarm.search_index"):
+        get_search_index(snapshot.version, snapshot.data)
+
+
+# ─── Halaman ───
+def sls_fragment(name):
+    """Jadikan satu bagian halaman SLS sebagai fragment yang bisa rerun sendiri.
+
+    Widget di dalam fragment hanya menjalankan ulang fungsi itu dengan argumen
+    dari rerun penuh terakhir; filter sidebar tetap menjalankan seluruh
+    halaman. Rerun fragment dicatat sebagai run perf tersendiri.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            if perf.current() is not None:
+                return fn(*args, **kwargs)
+            perf.begin(f"fragment.{name}")
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                perf.end()
+        return fragment(run)
+    return decorate
+
+
+@perf.cached(st.cache_data(max_entries=16))
+def get_progress_table(key, _filtered):
+    return ppl_progress_table(_filtered)
+
+
+@perf.cached(st.cache_resource(max_entries=8))
+def get_search_cube(key, _filtered):
+    # Pencarian teks bekerja per baris, jadi cube dibangun dari subset hasil pencarian
+    return RollupCube.from_frame(_filtered)
+
+
+@perf.cached(st.cache_resource(max_entries=32))
+def get_column_index(key, col, _values):
+    return TrigramIndex(_values)
+
+
+@sls_fragment("metrics")
+def sls_metrics(cube):
+    with perf.stage("sls.metrics"):
+        totals = sls_totals(cube)
+
+    total_sls = totals['total_sls']
+    total_selesai = totals['selesai']
+    total_submit = totals['submit']
+    total_approved = totals['approved']
+    total_reject = totals['reject']
+
+    st.subheader("📊 Ringkasan Progress")
+    col1, col2, col3, col4, col5, col6, col7 = st.columns(7)
+    col1.metric("Total SLS", total_sls)
+    col2.metric("Selesai Lapangan", total_selesai)
+    col3.metric("Submit", total_submit)
+    col4.metric("Approved", total_approved)
+    col5.metric("Reject", total_reject)
+    col6.metric("Jumlah PPL", totals['ppl'])
+    col7.metric("Jumlah PML", totals['pml'])
+
+    if total_sls > 0:
+        st.markdown(f"""
+        <div style="display:flex; gap:8px; margin-top:8px; flex-wrap:wrap;">
+            <span style="background:#E3F2FD; padding:4px 12px; border-radius:12px; font-size:0.85rem;">
+                ✅ Selesai Lapangan: <b>{total_selesai/total_sls*100:.1f}%</b>
+            </span>
+            <span style="background:#FFF3E0; padding:4px 12px; border-radius:12px; font-size:0.85rem;">
+                📤 Submit: <b>{total_submit/total_sls*100:.1f}%</b>
+            </span>
+            <span style="background:#E8F5E9; padding:4px 12px; border-radius:12px; font-size:0.85rem;">
+                ✅ Approved: <b>{total_approved/total_sls*100:.1f}%</b>
+            </span>
+            <span style="background:#FFEBEE; padding:4px 12px; border-radius:12px; font-size:0.85rem;">
+                ❌ Reject: <b>{total_reject/total_sls*100:.1f}%</b>
+            </span>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+@sls_fragment("charts")
+def sls_charts(cube):
+    st.markdown("---")
+
+    col_chart1, col_chart2 = st.columns(2)
+
+    with col_chart1, perf.stage("sls.chart.status"):
+        st.subheader("📈 Distribusi Status SLS")
+        status_counts = sls_status_counts(cube)
+        if not status_counts.empty:
+            cached_chart("sls.status", sls_status_pie, status_counts)
+        else:
+            st.info("Tidak ada data status SLS.")
+
+    with col_chart2, perf.stage("sls.chart.kecamatan"):
+        st.subheader("🏘️ Progress per Kecamatan")
+        kec_progress = sls_progress_by(cube, 'nmkec')
+
+        if not kec_progress.empty:
+            cached_chart("sls.kecamatan", sls_progress_bars, kec_progress, 'nmkec')
+        else:
+            st.info("Tidak ada data kecamatan.")
+
+    st.markdown("---")
+
+    col_chart3, col_chart4 = st.columns(2)
+
+    with col_chart3, perf.stage("sls.chart.ppl"):
+        st.subheader("👷 Progress per PPL")
+        ppl_progress = sls_progress_by(cube, 'Nama_PPL')
+
+        if not ppl_progress.empty:
+            cached_chart("sls.ppl", sls_progress_bars, ppl_progress, 'Nama_PPL')
+        else:
+            st.info("Tidak ada data PPL.")
+
+    with col_chart4, perf.stage("sls.chart.desa"):
+        st.subheader("🗺️ Sebaran SLS per Desa")
+        desa_counts = sls_desa_counts(cube)
+
+        if not desa_counts.empty:
+            cached_chart("sls.desa", sls_desa_bar, desa_counts)
+        else:
+            st.info("Tidak ada data desa.")
+
+
+@sls_fragment("progress_table")
+def sls_progress_section(filtered, filter_key, n_total):
+    st.markdown("---")
+    st.subheader("📊 Progress per PPL")
+
+    progress_cols = [
+        'jumlahSelesaiLapangan', 'jumlahSubmit', 'JumlahApproved', 'JumlahReject',
+        'statusSls', 'Nama_PML', 'Nama_PPL', 'PJKuda', 'emailPPL', 'emailPML'
+    ]
+
+    progress_cols = [c for c in progress_cols if c in filtered.columns]
+
+    col_label_map = {
+        'emailPPL': 'Email PPL',
+        'Nama_PPL': 'Nama PPL',
+        'Nama_PML': 'Nama PML',
+        'PJKuda': 'PJKuda',
+        'emailPML': 'Email PML',
+        'jumlahSelesaiLapangan': 'Selesai Lapangan',
+        'jumlahSubmit': 'Submit',
+        'JumlahApproved': 'Approved',
+        'JumlahReject': 'Reject',
+        'statusSls': 'Status SLS',
+    }
+
+    if 'emailPPL' in progress_cols:
+        default_cols = ['emailPPL', 'Nama_PPL', 'Nama_PML', 'PJKuda',
+                        'jumlahSelesaiLapangan', 'jumlahSubmit', 'JumlahApproved', 'JumlahReject', 'statusSls']
+        default_cols = [c for c in default_cols if c in progress_cols]
+
+        selected_cols = st.multiselect(
+            "Pilih kolom yang ditampilkan:",
+            options=progress_cols,
+            default=default_cols,
+            format_func=lambda c: col_label_map.get(c, c),
+            key="progress_col_selector"
+        )
+
+        # Agregasi di-cache per state filter; urutan & filter kolom tidak menghitung ulang
+        with perf.stage("sls.progress_table"):
+            progress_df = get_progress_table(filter_key, filtered).rename(columns=col_label_map)
+
+        if selected_cols:
+            selected_labels = [col_label_map.get(c, c) for c in selected_cols]
+            display_progress_df = progress_df[selected_labels]
+        else:
+            display_progress_df = progress_df
+
+        # ─── Column Filters (Filter Kolom Bertingkat) ───
+        col_filters = {}
+        with st.expander("🔍 Filter Kolom Bertingkat", expanded=False):
+            n_fcols = min(4, len(display_progress_df.columns) or 1)
+            cols_list = list(display_progress_df.columns)
+            for row_start in range(0, len(cols_list), n_fcols):
+                row_cols = cols_list[row_start:row_start + n_fcols]
+                cols_ui = st.columns(n_fcols)
+                for j, col in enumerate(row_cols):
+                    if j >= len(cols_ui):
+                        break
+                    with cols_ui[j]:
+                        col_data = display_progress_df[col]
+                        if pd.api.types.is_numeric_dtype(col_data):
+                            lo = int(col_data.min()) if pd.notna(col_data.min()) else 0
+                            hi = int(col_data.max()) if pd.notna(col_data.max()) else 0
+                            min_col, max_col = st.columns(2)
+                            with min_col:
+                                lo_val = st.number_input(f"Min {col}", value=lo, key=f"ppl_min_{col}")
+                            with max_col:
+                                hi_val = st.number_input(f"Max {col}", value=hi, key=f"ppl_max_{col}")
+                            col_filters[col] = (lo_val, hi_val)
+                        else:
+                            col_filters[col] = st.text_input(
+                                f"Cari {col}", key=f"ppl_filter_{col}"
+                            )
+
+        keep = np.ones(len(display_progress_df), dtype=bool)
+        for col, val in col_filters.items():
+            if val is None or (isinstance(val, str) and not val.strip()):
+                continue
+            if isinstance(val, tuple):
+                col_data = display_progress_df[col]
+                keep &= ((col_data >= val[0]) & (col_data <= val[1])).to_numpy()
+            elif isinstance(val, str):
+                index = get_column_index(filter_key, col, display_progress_df[col].astype(str).to_numpy())
+                col_keep = np.zeros(len(display_progress_df), dtype=bool)
+                col_keep[index.search(val)] = True
+                keep &= col_keep
+
+        n_display = paged_table(display_progress_df, "progress", (filter_key, tuple(display_progress_df.columns)),
+                                keep=keep)
+
+        st.caption(f"Menampilkan {n_display} PPL (dari {len(progress_df)} setelah filter sidebar) dari {n_total} total data SLS.")
+
+        export_controls(
+            "progress", "progress_per_ppl",
+            (filter_key, tuple(display_progress_df.columns), tuple(col_filters.items())),
+            lambda: display_progress_df[keep],
+        )
+    else:
+        st.info("Kolom emailPPL tidak tersedia.")
+
+
+@sls_fragment("detail_table")
+def sls_detail_section(filtered, filter_key, n_total):
+    st.markdown("---")
+    st.subheader("📋 Data Detail SLS")
+
+    display_cols = [
+        'kodeSLS', 'nmsls', 'nama_ketua',
+        'nmprov', 'nmkab', 'nmkec', 'nmdesa',
+        'Nama_PML', 'Nama_PPL',
+        'jumlahSelesaiLapangan', 'jumlahSubmit', 'JumlahApproved', 'JumlahReject',
+        'statusSls', 'noHpPml', 'noHPMitra', 'emailPPL', 'emailPML'
+    ]
+
+    display_cols = [c for c in display_cols if c in filtered.columns]
+
+    detail_label_map = {
+        'kodeSLS': 'Kode SLS', 'nmsls': 'Nama SLS', 'nama_ketua': 'Nama Ketua',
+        'nmprov': 'Provinsi', 'nmkab': 'Kabupaten', 'nmkec': 'Kecamatan', 'nmdesa': 'Desa',
+        'Nama_PML': 'PML', 'Nama_PPL': 'PPL',
+        'jumlahSelesaiLapangan': 'Selesai Lapangan', 'jumlahSubmit': 'Submit',
+        'JumlahApproved': 'Approved', 'JumlahReject': 'Reject',
+        'statusSls': 'Status', 'noHpPml': 'No. HP PML', 'noHPMitra': 'No. HP Mitra',
+        'emailPPL': 'Email PPL', 'emailPML': 'Email PML'
+    }
+    display_labels = [detail_label_map[c] for c in display_cols]
+
+    n_detail = paged_table(filtered, "detail", filter_key, columns=display_cols, labels=display_labels)
+
+    st.caption(f"Menampilkan {n_detail} dari {n_total} total data SLS.")
+
+    # Download button
+    export_controls(
+        "detail", "data_sls", (filter_key, tuple(display_cols)),
+        lambda: filtered[display_cols].rename(columns=detail_label_map),
+    )
+
+
+def page_sls():
+    refresher = get_sls_refresher()
+    snapshot = refresher.snapshot()
+
+    if snapshot is None:
+        st.error(f"Gagal memuat data SLS: {str(refresher.last_error)}")
+        return
+
+    df = snapshot.data
+
+    if df.empty:
+        st.warning("Tidak ada data SLS yang tersedia.")
+        return
+
+    st.title("📋 Monitoring Progress SLS")
+    st.markdown("Dashboard monitoring progres pemutakhiran **Sensus Lingkungan Sensus (SLS)** — data real-time dari Google Apps Script.")
+    data_caption = f"🕒 Data per {snapshot.as_of.strftime('%d/%m/%Y %H:%M:%S')}"
+    if refresher.unchanged:
+        data_caption += f" · ♻️ {refresher.unchanged}× refresh tanpa perubahan data (rebuild dilewati)"
+    st.caption(data_caption)
+    if refresher.last_error is not None:
+        st.warning(f"Refresh data terakhir gagal ({refresher.last_error_at.strftime('%H:%M:%S')}): "
+                   f"{str(refresher.last_error)}. Menampilkan data terakhir yang berhasil dimuat.")
+
+    # ─────────────────────────────────────────────
+    # Sidebar Filters
+    # ─────────────────────────────────────────────
+    st.sidebar.header("🔍 Filter SLS")
+
+    with perf.stage("sls.region_index"):
+        region_index = get_region_index(snapshot.version, df)
+    selection = {}
+
+    def make_filter(col, label):
+        # Pilihan mengikuti filter di atasnya (Provinsi → Kabupaten → ... → PPL)
+        options = region_index.options(col, selection)
+        key = f"filter_{col}"
+        if st.session_state.get(key, "Semua") not in options:
+            st.session_state[key] = "Semua"
+        selected = st.sidebar.selectbox(label, ["Semua"] + options, key=key)
+        selection[col] = selected if selected != "Semua" else None
+        return selection[col]
+
+    make_filter('nmprov', 'Provinsi')
+    make_filter('nmkab', 'Kabupaten')
+    make_filter('nmkec', 'Kecamatan')
+    make_filter('nmdesa', 'Desa')
+    make_filter('Nama_PML', 'PML')
+    make_filter('Nama_PPL', 'PPL')
+
+    status_options = region_index.labels('statusSls')
+    sel_status = st.sidebar.selectbox("Status SLS", ["Semua"] + status_options, key="filter_status")
+    if sel_status != "Semua":
+        selection['statusSls'] = sel_status
+
+    cari_text = st.sidebar.text_input("🔎 Cari Nama SLS / Ketua", "")
+
+    # ─────────────────────────────────────────────
+    # Apply search filter
+    # ─────────────────────────────────────────────
+    with perf.stage("sls.filter"):
+        rows = region_index.rows(selection)
+        if cari_text:
+            hits = get_search_index(snapshot.version, df).search(cari_text)
+            rows = hits if rows is None else np.intersect1d(rows, hits, assume_unique=True)
+
+        filtered = df if rows is None else df.iloc[rows]
+    filter_key = (snapshot.version, tuple(sorted(selection.items())), cari_text)
+
+    # ─────────────────────────────────────────────
+    # Rollup Cube (dipakai ringkasan & grafik)
+    # ─────────────────────────────────────────────
+    with perf.stage("sls.rollup"):
+        if cari_text:
+            cube = get_search_cube(filter_key, filtered)
+        else:
+            cube = get_rollup_cube(snapshot.version, df).slice(selection)
+
+    # Setiap bagian di bawah adalah fragment dengan dependensi eksplisit
+    sls_metrics(cube)
+    sls_charts(cube)
+    sls_progress_section(filtered, filter_key, len(df))
+    sls_detail_section(filtered, filter_key, len(df))